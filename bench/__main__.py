@@ -0,0 +1,32 @@
+from argparse import ArgumentParser, Namespace
+from importlib import import_module
+from pathlib import Path
+from sys import exit, path
+
+_BENCH = Path(__file__).resolve(strict=True).parent
+_TOP_LV = _BENCH.parent
+
+
+def _parse_args() -> Namespace:
+    parser = ArgumentParser()
+    parser.add_argument("-p", "--pattern", default="*.py")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = _parse_args()
+    path.insert(0, str(_TOP_LV.parent))
+
+    for py in sorted(_BENCH.glob(args.pattern)):
+        if not py.stem.startswith("_"):
+            mod = import_module(f"{_TOP_LV.name}.{_BENCH.name}.{py.stem}")
+            print(f"# {py.stem}", flush=True)
+            for line in mod.bench():
+                print(line, flush=True)
+            print(flush=True)
+
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,66 @@
+from statistics import quantiles
+from time import perf_counter
+from tracemalloc import get_traced_memory, start, stop
+from typing import Any, Callable, Sequence
+
+SIZES: Sequence[int] = (100, 1000, 10000)
+
+
+def timed(f: Callable[[], Any], repeat: int = 5) -> float:
+    """
+    Best of `repeat`, in seconds
+    """
+
+    best = float("inf")
+    for _ in range(repeat):
+        t1 = perf_counter()
+        f()
+        t2 = perf_counter()
+        best = min(best, t2 - t1)
+    return best
+
+
+def fmt(name: str, n: int, seconds: float, base: float) -> str:
+    per = seconds / n if n else 0
+    return (
+        f"{name.ljust(24)} n={str(n).ljust(6)} "
+        f"total={seconds * 1e3:9.3f}ms  "
+        f"per_item={per * 1e6:8.3f}us  "
+        f"x{base / seconds if seconds else 0:.2f}"
+    )
+
+
+def traced(f: Callable[[], Any]) -> int:
+    """
+    Peak traced allocation, in bytes
+    """
+
+    start()
+    try:
+        f()
+        _, peak = get_traced_memory()
+    finally:
+        stop()
+    return peak
+
+
+def fmt_mem(name: str, n: int, peak: int, base: int) -> str:
+    return (
+        f"{name.ljust(24)} n={str(n).ljust(6)} "
+        f"peak={peak / 1e3:9.3f}kb  "
+        f"x{base / peak if peak else 0:.2f}"
+    )
+
+
+def fmt_quantiles(name: str, samples: Sequence[float]) -> str:
+    """
+    p50 / p95 / p99 of `samples`, in seconds
+    """
+
+    n = len(samples)
+    cuts = quantiles(samples, n=100, method="inclusive") if n > 1 else [*samples] * 99
+    p50, p95, p99 = (cuts[q - 1] * 1e3 if cuts else 0 for q in (50, 95, 99))
+    return (
+        f"{name.ljust(24)} n={str(n).ljust(6)} "
+        f"p50={p50:9.3f}ms  p95={p95:9.3f}ms  p99={p99:9.3f}ms"
+    )
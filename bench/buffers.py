@@ -0,0 +1,109 @@
+from itertools import count
+from typing import Iterator, Sequence
+
+from ..coq.clients.buffers.db.database import BDB
+from ..coq.shared.processes import Processes
+from ..coq.shared.settings import MatchBackend, MatchOptions
+from ._shared import fmt, timed
+
+_LINES = (1000, 10000, 100000)
+_WORDS = (10000, 100000, 1000000)
+_CWORDS = ("l", "lin", "line_12", "sup", "worke")
+_UNIFYING_CHARS = {"_", "-"}
+_PROCESSES = Processes(0)
+_MATCH = MatchOptions(
+    unifying_chars=_UNIFYING_CHARS,
+    max_results=33,
+    look_ahead=2,
+    exact_matches=2,
+    fuzzy_cutoff=0.6,
+    backend=MatchBackend.sqlite,
+)
+
+
+def _lines(n: int) -> Sequence[str]:
+    return tuple(
+        f"    line_{idx} = review(super_{idx % 97}, worker)" for idx in range(n)
+    )
+
+
+def _bench_lines() -> Iterator[str]:
+    for n in _LINES:
+        db = BDB(
+            _PROCESSES,
+            tokenization_limit=n * 10,
+            unifying_chars=_UNIFYING_CHARS,
+            include_syms=True,
+            match=_MATCH,
+        )
+        lines = _lines(n)
+        db.set_lines(1, filetype="py", filename="bench.py", lo=0, hi=0, lines=lines)
+        mid, ticks = n // 2, count()
+
+        def edit() -> None:
+            line = f"    line_{next(ticks)} = review(super_x, worker)"
+            db.set_lines(
+                1, filetype="py", filename="bench.py", lo=mid, hi=mid + 1, lines=(line,)
+            )
+
+        def insert() -> None:
+            line = f"    new_{next(ticks)}"
+            db.set_lines(
+                1, filetype="py", filename="bench.py", lo=mid, hi=mid, lines=(line,)
+            )
+
+        def refresh() -> None:
+            lo, hi = mid - 50, mid + 50
+            db.set_lines(
+                1, filetype="py", filename="bench.py", lo=lo, hi=hi, lines=lines[lo:hi]
+            )
+
+        base = timed(edit)
+        yield fmt(f"edit {n}L", n=1, seconds=base, base=base)
+        yield fmt(f"insert {n}L", n=1, seconds=timed(insert), base=base)
+        yield fmt(f"refresh {n}L", n=100, seconds=timed(refresh), base=base)
+
+
+def _words(n: int) -> Sequence[str]:
+    """
+    ~ 5 words per line, ~ 1 unique word per line
+    """
+
+    return tuple(
+        f"line_{idx} = review(super_{idx % 97}, {'worker' if idx % 2 else 'work'})"
+        for idx in range(n // 5)
+    )
+
+
+def _bench_words() -> Iterator[str]:
+    for n in _WORDS:
+        db = BDB(
+            _PROCESSES,
+            tokenization_limit=n * 10,
+            unifying_chars=_UNIFYING_CHARS,
+            include_syms=False,
+            match=_MATCH,
+        )
+        lines = _words(n)
+        db.set_lines(1, filetype="py", filename="bench.py", lo=0, hi=0, lines=lines)
+
+        for cword in _CWORDS:
+
+            def words() -> None:
+                for _ in db.words(
+                    _MATCH,
+                    filetype=None,
+                    word=cword,
+                    sym="",
+                    limit=_MATCH.max_results,
+                    update=None,
+                ):
+                    pass
+
+            base = timed(words, repeat=3)
+            yield fmt(f"words [{cword}] {n}w", n=1, seconds=base, base=base)
+
+
+def bench() -> Iterator[str]:
+    yield from _bench_lines()
+    yield from _bench_words()
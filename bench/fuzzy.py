@@ -0,0 +1,155 @@
+from collections import Counter
+from random import Random
+from string import ascii_letters
+from typing import Iterator, Sequence
+
+from ..coq.shared.fuzzy import (
+    _dl_distance,
+    dl_distance,
+    fuzzy_query,
+    metrics,
+    metrics_many,
+    query_quick_ratio,
+)
+from ._shared import SIZES, fmt, fmt_mem, timed, traced
+
+_LOOK_AHEAD = 2
+_CWORDS = ("s", "sup", "supervis", "supervisor_col")
+
+
+def _corpus(n: int) -> Sequence[str]:
+    rand = Random(n)
+    stems = ("super", "visor", "collect", "worker", "review", "metric", "_")
+
+    def cont() -> Iterator[str]:
+        for _ in range(n):
+            stem = "".join(rand.choice(stems) for _ in range(rand.randint(1, 3)))
+            tail = "".join(
+                rand.choice(ascii_letters) for _ in range(rand.randint(0, 4))
+            )
+            yield stem + tail
+
+    return tuple(cont())
+
+
+def _typo(rand: Random, word: str, edits: int) -> str:
+    chars = [*word]
+    for _ in range(edits):
+        idx = rand.randint(0, len(chars))
+        op = rand.randint(0, 3)
+        if op == 0:
+            chars.insert(idx, rand.choice(ascii_letters))
+        elif chars and op == 1:
+            chars.pop(min(idx, len(chars) - 1))
+        elif chars and op == 2:
+            chars[min(idx, len(chars) - 1)] = rand.choice(ascii_letters)
+        elif idx + 1 < len(chars):
+            chars[idx], chars[idx + 1] = chars[idx + 1], chars[idx]
+    return "".join(chars)
+
+
+def _windows() -> Iterator[str]:
+    """
+    `metrics` compares slices of at most `len(cword) + look_ahead`,
+    candidates are typically a few edits away from the cword
+    """
+
+    rand = Random(0)
+    n = 1000
+    for len_l in (2, 4, 8, 16):
+        for look_ahead in (0, 2, 4):
+            lhs = "".join(rand.choice(ascii_letters) for _ in range(len_l))
+            typos = (_typo(rand, word=lhs, edits=rand.randint(0, 4)) for _ in range(n))
+            pairs = tuple((lhs, typo[: len_l + look_ahead]) for typo in typos)
+            size = (len_l + 2) * (len_l + look_ahead + 2)
+
+            def matrix() -> None:
+                d = [0] * size
+                for lhs, rhs in pairs:
+                    _dl_distance(d, da={}, lhs=lhs, rhs=rhs)
+
+            def bits() -> None:
+                for lhs, rhs in pairs:
+                    dl_distance(lhs, rhs)
+
+            name = f"[{len_l}+{look_ahead}]"
+            base = timed(matrix)
+            yield fmt(f"matrix {name}", n=n, seconds=base, base=base)
+            yield fmt(f"bits {name}", n=n, seconds=timed(bits), base=base)
+
+
+def _counter_ratio(lhs: str, rhs: str, look_ahead: int) -> float:
+    """
+    `quick_ratio` before `FuzzyQuery`, re-counting `lhs` on every call
+    """
+
+    shorter = min(len(lhs), len(rhs))
+    if not shorter:
+        return 1
+
+    p_matches = 0
+    for l, r in zip(lhs, rhs):
+        if l != r:
+            break
+        p_matches += 1
+
+    lhs, rhs = lhs[p_matches:], rhs[p_matches:]
+    l_ratio = p_matches / shorter
+
+    ms_shorter = min(len(lhs), len(rhs))
+    if not ms_shorter:
+        ms_ratio = 1.0
+    else:
+        cutoff = ms_shorter + look_ahead
+        l, r = lhs[:cutoff], rhs[:cutoff]
+        longer = max(len(l), len(r))
+        l_c, r_c = Counter(l), Counter(r)
+        dif = l_c - r_c if len(l) > len(r) else r_c - l_c
+        ms_ratio = (1 - sum(dif.values()) / longer) / (ms_shorter / longer)
+
+    return l_ratio + ms_ratio * (1 - l_ratio) * 0.5
+
+
+def _queries() -> Iterator[str]:
+    """
+    `X_SIMILARITY` is evaluated once per row, always against the same cword
+    """
+
+    n = SIZES[-1]
+    corpus = _corpus(n)
+    for cword in _CWORDS:
+
+        def counter() -> None:
+            for match in corpus:
+                _counter_ratio(cword, match, look_ahead=_LOOK_AHEAD)
+
+        def query() -> None:
+            q = fuzzy_query(cword)
+            for match in corpus:
+                query_quick_ratio(q, match, look_ahead=_LOOK_AHEAD)
+
+        base, peak = timed(counter), traced(counter)
+        yield fmt(f"counter [{cword}]", n=n, seconds=base, base=base)
+        yield fmt(f"query [{cword}]", n=n, seconds=timed(query), base=base)
+        yield fmt_mem(f"counter [{cword}]", n=n, peak=peak, base=peak)
+        yield fmt_mem(f"query [{cword}]", n=n, peak=traced(query), base=peak)
+
+
+def bench() -> Iterator[str]:
+    yield from _windows()
+    yield from _queries()
+
+    for cword in _CWORDS:
+        for n in SIZES:
+            corpus = _corpus(n)
+
+            def single() -> None:
+                for match in corpus:
+                    metrics(cword, match, look_ahead=_LOOK_AHEAD)
+
+            def many() -> None:
+                metrics_many(fuzzy_query(cword), corpus, look_ahead=_LOOK_AHEAD)
+
+            base = timed(single)
+            yield fmt(f"metrics [{cword}]", n=n, seconds=base, base=base)
+            yield fmt(f"metrics_many [{cword}]", n=n, seconds=timed(many), base=base)
@@ -0,0 +1,61 @@
+from threading import Event, Thread
+from time import perf_counter, sleep
+from typing import Iterator, MutableSequence, Sequence
+
+from ..coq.shared.processes import Processes
+from ._shared import fmt_quantiles
+
+_LINES = 100000
+_TICK = 0.001
+_ROUNDS = 5
+_WORKERS = (0, 1, 2)
+_UNIFYING_CHARS = {"_", "-"}
+
+
+def _texts() -> Sequence[str]:
+    lines = (
+        f"    line_{idx} = review(super_{idx % 97}, worker) # {idx * 7919}"
+        for idx in range(_LINES)
+    )
+    return ("\n".join(lines),)
+
+
+def _lag(processes: Processes, texts: Sequence[str]) -> Sequence[float]:
+    """
+    How late a `_TICK` timer on this thread runs, while another thread indexes
+    """
+
+    done = Event()
+
+    def index() -> None:
+        for _ in range(_ROUNDS):
+            processes.tokenize(
+                _LINES * 10,
+                unifying_chars=_UNIFYING_CHARS,
+                include_syms=True,
+                texts=texts,
+            )
+        done.set()
+
+    lags: MutableSequence[float] = []
+    th = Thread(target=index, daemon=True)
+    th.start()
+    while not done.is_set():
+        t1 = perf_counter()
+        sleep(_TICK)
+        t2 = perf_counter()
+        lags.append(t2 - t1 - _TICK)
+    th.join()
+    return lags
+
+
+def bench() -> Iterator[str]:
+    texts = _texts()
+    for workers in _WORKERS:
+        processes = Processes(workers)
+        # spawn the pool outside of the measurement
+        processes.tokenize(
+            1, unifying_chars=_UNIFYING_CHARS, include_syms=True, texts=texts
+        )
+        lags = _lag(processes, texts=texts)
+        yield fmt_quantiles(f"timer lag, {workers} procs", samples=lags)
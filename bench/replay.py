@@ -0,0 +1,286 @@
+from asyncio import run, sleep
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from itertools import groupby
+from os import environ
+from pathlib import Path
+from random import Random
+from string import ascii_lowercase
+from threading import Lock
+from time import monotonic, perf_counter
+from typing import (
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+    cast,
+)
+from uuid import UUID, uuid4
+
+from pynvim_pp.lib import decode
+from std2.pickle.decoder import new_decoder
+from yaml import safe_load
+
+from ..coq.consts import CONFIG_YML, RECORD_LOG, VARS
+from ..coq.databases.insertions.database import IDB
+from ..coq.server.completions import _ENCODER
+from ..coq.server.reviewer import ReviewCtx, Reviewer
+from ..coq.server.rt_types import Stack
+from ..coq.server.state import state
+from ..coq.server.trans import trans
+from ..coq.shared.context import EMPTY_CONTEXT
+from ..coq.shared.executor import AsyncExecutor
+from ..coq.shared.lru import LRU
+from ..coq.shared.record import Batch, Record, Sourced, records
+from ..coq.shared.runtime import Metric, Supervisor, Worker
+from ..coq.shared.settings import BaseClient, Settings
+from ..coq.shared.types import Completion, Context, Edit
+from ._shared import fmt_quantiles
+
+_RECORDING = Path(environ.get("COQ_REPLAY", RECORD_LOG))
+_PUM_WIDTH = 15
+_SCREEN = (160, 48)
+_STAGES = ("collect", "review", "trans", "encode", "total")
+
+
+class _Replay(Worker[BaseClient, None]):
+    """
+    Yields what was recorded, when it was recorded
+    """
+
+    def __init__(
+        self,
+        ex: AsyncExecutor,
+        supervisor: Supervisor,
+        always_wait: bool,
+        options: BaseClient,
+        misc: None,
+    ) -> None:
+        super().__init__(
+            ex,
+            supervisor=supervisor,
+            always_wait=always_wait,
+            options=options,
+            misc=misc,
+        )
+        self.script: Optional[Sourced] = None
+
+    async def _work(
+        self, context: Context, timeout: float
+    ) -> AsyncIterator[Sequence[Completion]]:
+        if script := self.script:
+            t0 = monotonic()
+            for at, chunk in groupby(script.yielded, key=lambda row: row[0]):
+                if (delay := at - (monotonic() - t0)) > 0:
+                    await sleep(delay)
+                yield tuple(completion for _, completion in chunk)
+            if (delay := script.elapsed - (monotonic() - t0)) > 0:
+                await sleep(delay)
+
+
+class _Timed(Reviewer):
+    """
+    Counts the time spent in `trans_many`, across every worker thread
+    """
+
+    def __init__(self, settings: Settings, db: IDB) -> None:
+        super().__init__(options=settings.match, icons=settings.display.icons, db=db)
+        self._lock = Lock()
+        self._spent = 0.0
+
+    def take(self) -> float:
+        with self._lock:
+            spent, self._spent = self._spent, 0.0
+        return spent
+
+    def trans_many(
+        self, token: ReviewCtx, instance: UUID, completions: Sequence[Completion]
+    ) -> Sequence[Metric]:
+        t1 = perf_counter()
+        try:
+            return super().trans_many(token, instance=instance, completions=completions)
+        finally:
+            t2 = perf_counter()
+            with self._lock:
+                self._spent += t2 - t1
+
+
+def _batches(
+    recorded: Iterable[Record],
+) -> Sequence[Tuple[Batch, Sequence[Sourced]]]:
+    batches: MutableMapping[UUID, Batch] = {}
+    sourced: MutableMapping[UUID, MutableSequence[Sourced]] = {}
+    for record in recorded:
+        if isinstance(record, Batch):
+            batches[record.batch] = record
+        else:
+            sourced.setdefault(record.batch, []).append(record)
+    return tuple((batch, sourced.get(uid, ())) for uid, batch in batches.items())
+
+
+def _synthetic() -> Iterator[Record]:
+    """
+    Typing a few words out, against a fast and a slow source
+    """
+
+    rand = Random(0)
+    vocab = tuple(
+        "".join(rand.choice(ascii_lowercase) for _ in range(rand.randint(3, 12)))
+        for _ in range(2000)
+    )
+    lines = tuple(" ".join(rand.sample(vocab, k=8)) for _ in range(500))
+
+    def comp(source: str, word: str) -> Completion:
+        return Completion(
+            source=source,
+            always_on_top=False,
+            weight_adjust=0,
+            label=word,
+            sort_by=word,
+            primary_edit=Edit(new_text=word),
+            adjust_indent=False,
+            icon_match=None,
+        )
+
+    for word in rand.sample(vocab, k=20):
+        for col in range(1, len(word) + 1):
+            typed = word[:col]
+            batch = uuid4()
+            context = replace(
+                EMPTY_CONTEXT,
+                manual=False,
+                change_id=uuid4(),
+                position=(0, col),
+                cursor=(0, col, col, col),
+                line=typed,
+                line_before=typed,
+                lines=lines,
+                words=typed,
+                words_before=typed,
+                l_words_before=typed,
+            )
+            yield Batch(batch=batch, context=context, timeout=0.09)
+
+            hits = tuple(w for w in vocab if w.startswith(typed[:2]))
+            yield Sourced(
+                batch=batch,
+                source="B",
+                always_wait=False,
+                interrupted=False,
+                elapsed=0.003,
+                yielded=tuple((0.002, comp("B", w)) for w in hits[:33]),
+            )
+            yield Sourced(
+                batch=batch,
+                source="LSP",
+                always_wait=False,
+                interrupted=False,
+                elapsed=0.03,
+                yielded=tuple((0.03, comp("LSP", w)) for w in rand.sample(vocab, 500)),
+            )
+
+
+def _settings() -> Settings:
+    yml = safe_load(decode(CONFIG_YML.read_bytes()))
+    return new_decoder[Settings](Settings)(yml)
+
+
+async def _replay(
+    batches: Sequence[Tuple[Batch, Sequence[Sourced]]],
+) -> Mapping[str, Sequence[float]]:
+    settings = _settings()
+    idb = IDB()
+    reviewer = _Timed(settings, db=idb)
+    stages: Mapping[str, MutableSequence[float]] = {stage: [] for stage in _STAGES}
+
+    with ThreadPoolExecutor() as th:
+        supervisor = Supervisor(
+            th=th,
+            vars_dir=VARS,
+            display=settings.display,
+            match=settings.match,
+            comp=settings.completion,
+            limits=settings.limits,
+            reviewer=reviewer,
+        )
+        supervisor.recorder = None
+
+        sources = {
+            script.source: script.always_wait
+            for _, scripts in batches
+            for script in scripts
+        }
+        workers = {
+            source: cast(
+                _Replay,
+                _Replay.init(
+                    supervisor,
+                    always_wait=always_wait,
+                    options=BaseClient(
+                        always_wait=always_wait,
+                        enabled=True,
+                        max_pulls=None,
+                        short_name=source,
+                        weight_adjust=0,
+                    ),
+                    misc=None,
+                ),
+            )
+            for source, always_wait in sources.items()
+        }
+        stack = Stack(
+            settings=settings,
+            lru=LRU(size=settings.match.max_results),
+            metrics={},
+            idb=idb,
+            supervisor=supervisor,
+            workers={*workers.values()},
+        )
+        state(pum_width=_PUM_WIDTH, screen=_SCREEN)
+
+        for batch, sourced in batches:
+            scripts = {script.source: script for script in sourced}
+            for source, worker in workers.items():
+                worker.script = scripts.get(source)
+            supervisor.limits = replace(
+                settings.limits,
+                completion_auto_timeout=batch.timeout,
+                completion_manual_timeout=batch.timeout,
+            )
+
+            t1 = perf_counter()
+            metrics = await supervisor.collect(batch.context)
+            t2 = perf_counter()
+            vim_comps = tuple(
+                trans(
+                    stack,
+                    pum_width=_PUM_WIDTH,
+                    context=batch.context,
+                    metrics=metrics,
+                )
+            )
+            t3 = perf_counter()
+            for _, vim_comp in vim_comps:
+                _ENCODER(vim_comp)
+            t4 = perf_counter()
+
+            stages["collect"].append(t2 - t1)
+            stages["review"].append(reviewer.take())
+            stages["trans"].append(t3 - t2)
+            stages["encode"].append(t4 - t3)
+            stages["total"].append(t4 - t1)
+
+    return stages
+
+
+def bench() -> Iterator[str]:
+    recorded = records(_RECORDING) if _RECORDING.exists() else _synthetic()
+    batches = _batches(recorded)
+    stages = run(_replay(batches))
+    for stage, samples in stages.items():
+        yield fmt_quantiles(stage, samples=samples)
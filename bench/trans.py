@@ -0,0 +1,97 @@
+from random import Random
+from string import ascii_letters
+from typing import Iterable, Iterator, MutableSet, Sequence
+from uuid import uuid4
+
+from ..coq.server.trans import _collate, _columns, _cum, _ranked, _sort_by
+from ..coq.shared.runtime import Metric
+from ..coq.shared.settings import Weights
+from ..coq.shared.types import Completion, Edit
+from ._shared import fmt, fmt_mem, timed, traced
+
+_SIZES = (1000, 5000, 20000)
+_MAX_RESULTS = 33
+_WEIGHTS = Weights(prefix_matches=2, edit_distance=1.5, recency=1, proximity=0.5)
+
+
+def _metrics(n: int) -> Sequence[Metric]:
+    rand = Random(n)
+    instance = uuid4()
+
+    def cont() -> Iterator[Metric]:
+        for _ in range(n):
+            word = "".join(
+                rand.choice(ascii_letters) for _ in range(rand.randint(1, 9))
+            )
+            edit = Edit(new_text=word)
+            comp = Completion(
+                source=rand.choice(("B", "LSP", "T")),
+                always_on_top=False,
+                weight_adjust=0,
+                label=word,
+                sort_by=word,
+                primary_edit=edit,
+                adjust_indent=False,
+                icon_match=None,
+            )
+            yield Metric(
+                instance=instance,
+                comp=comp,
+                weight_adjust=1,
+                weight=Weights(
+                    prefix_matches=rand.randint(0, 5),
+                    edit_distance=rand.random(),
+                    recency=rand.randint(0, 100),
+                    proximity=rand.randint(0, 10),
+                ),
+                label_width=len(word),
+                kind_width=0,
+            )
+
+    return tuple(cont())
+
+
+def _take(ranked: Iterable[Metric]) -> Sequence[Metric]:
+    seen: MutableSet[str] = set()
+
+    def cont() -> Iterator[Metric]:
+        for metric in ranked:
+            if len(seen) > _MAX_RESULTS:
+                break
+            elif (text := metric.comp.primary_edit.new_text) not in seen:
+                seen.add(text)
+                yield metric
+
+    return tuple(cont())
+
+
+def _pipeline(metrics: Sequence[Metric], lazy: bool) -> Sequence[Metric]:
+    columns = _columns(metrics)
+    adjustment = _cum(_WEIGHTS, columns=columns)
+    ranked = _ranked(
+        _sort_by(adjustment, columns=columns, metrics=metrics),
+        tie_break=_collate(False),
+        lazy=lazy,
+        items=metrics,
+    )
+    return _take(ranked)
+
+
+def bench() -> Iterator[str]:
+    for n in _SIZES:
+        metrics = _metrics(n)
+
+        def eager() -> Sequence[Metric]:
+            return _pipeline(metrics, lazy=False)
+
+        def lazy() -> Sequence[Metric]:
+            return _pipeline(metrics, lazy=True)
+
+        assert eager() == lazy()
+        base = timed(eager)
+        yield fmt("sorted", n=n, seconds=base, base=base)
+        yield fmt("ranked", n=n, seconds=timed(lazy), base=base)
+
+        base_mem = traced(eager)
+        yield fmt_mem("sorted", n=n, peak=base_mem, base=base_mem)
+        yield fmt_mem("ranked", n=n, peak=traced(lazy), base=base_mem)
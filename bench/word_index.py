@@ -0,0 +1,132 @@
+from json import dumps
+from pathlib import Path
+from random import Random
+from sqlite3 import Connection, Row
+from string import ascii_letters
+from typing import Iterator, Mapping, Sequence, Tuple
+from uuid import uuid4
+
+from ..coq.shared.fuzzy import fuzzy_query, query_quick_ratio
+from ..coq.shared.word_index import WordIndex
+from ._shared import fmt, timed
+
+_COQ = Path(__file__).resolve(strict=True).parent.parent / "coq"
+_BUFFERS = _COQ / "clients" / "buffers" / "db" / "sql"
+_INDEX = _COQ / "databases" / "index" / "sql"
+
+_EXACT_MATCHES = 2
+_LOOK_AHEAD = 2
+_CUT_OFF = 0.6
+_LIMIT = 33
+_CWORDS = ("s", "sup", "supervis", "Worker_c")
+_LINES = (1000, 10000, 50000)
+
+
+def _sql(base: Path, *paths: str) -> str:
+    return (base / Path(*paths)).with_suffix(".sql").read_text()
+
+
+def _similarity(lhs: str, rhs: str, look_ahead: int) -> float:
+    return query_quick_ratio(fuzzy_query(lhs), rhs=rhs, look_ahead=look_ahead)
+
+
+def _like(like: str) -> str:
+    for char in ("!", "%", "_", "["):
+        like = like.replace(char, f"!{char}")
+    return f"{like}%"
+
+
+def _words(n: int) -> Sequence[Tuple[str, ...]]:
+    rand = Random(n)
+    stems = ("super", "visor", "collect", "worker", "review", "metric", "Buf", "_")
+    vocab = tuple(
+        "".join(rand.choice(stems) for _ in range(rand.randint(1, 3)))
+        + "".join(rand.choice(ascii_letters) for _ in range(rand.randint(0, 3)))
+        for _ in range(n // 2 + 1)
+    )
+    return tuple(
+        tuple(rand.choice(vocab) for _ in range(rand.randint(0, 12))) for _ in range(n)
+    )
+
+
+def _db(lines: Sequence[Tuple[str, ...]]) -> Connection:
+    conn = Connection(":memory:", isolation_level=None)
+    conn.row_factory = Row
+    conn.create_function("X_SIMILARITY", narg=3, func=_similarity, deterministic=True)
+    conn.executescript(_sql(_BUFFERS, "create", "pragma"))
+    conn.executescript(_sql(_BUFFERS, "create", "tables"))
+    conn.executescript(_sql(_INDEX, "create", "log"))
+    conn.executescript(_sql(_BUFFERS, "create", "index"))
+
+    with conn:
+        conn.execute(
+            _sql(_BUFFERS, "insert", "buffer"),
+            {"rowid": 1, "filetype": "py", "filename": "bench.py"},
+        )
+        for line_num, words in enumerate(lines):
+            line_id = uuid4().bytes
+            conn.execute(
+                _sql(_BUFFERS, "insert", "line"),
+                {"rowid": line_id, "buffer_id": 1, "line_num": line_num, "line": ""},
+            )
+            conn.executemany(
+                _sql(_BUFFERS, "insert", "word"),
+                ({"line_id": line_id, "word": word} for word in words),
+            )
+    return conn
+
+
+def _drain(conn: Connection, index: WordIndex) -> None:
+    with conn:
+        rows = conn.execute(_sql(_INDEX, "select", "log")).fetchall()
+        conn.execute(_sql(_INDEX, "delete", "log"))
+    index.update((row["lword"], row["delta"]) for row in rows)
+
+
+def _params(cword: str) -> Mapping[str, object]:
+    return {
+        "cut_off": _CUT_OFF,
+        "look_ahead": _LOOK_AHEAD,
+        "limit": _LIMIT,
+        "filetype": None,
+        "word": cword,
+        "sym": "",
+        "like_word": _like(cword[:_EXACT_MATCHES]),
+        "like_sym": _like(""),
+    }
+
+
+def bench() -> Iterator[str]:
+    select = _sql(_BUFFERS, "select", "words")
+    select_hits = _sql(_BUFFERS, "select", "words_hits")
+
+    for n in _LINES:
+        conn = _db(_words(n))
+        index = WordIndex(exact_matches=_EXACT_MATCHES)
+        _drain(conn, index=index)
+        (count,) = conn.execute("SELECT COUNT(*) FROM words").fetchone()
+
+        for cword in _CWORDS:
+            params = _params(cword)
+
+            def sqlite() -> None:
+                conn.execute(select, params).fetchall()
+
+            def memory() -> None:
+                _drain(conn, index=index)
+                hits = index.hits(cword, look_ahead=_LOOK_AHEAD, cut_off=_CUT_OFF)
+                ranked = sorted(hits, key=hits.__getitem__, reverse=True)
+                conn.execute(
+                    select_hits,
+                    {
+                        **params,
+                        "hits": dumps(ranked),
+                        "word_hits": dumps([*hits]),
+                        "sym_hits": dumps([]),
+                    },
+                ).fetchall()
+
+            base = timed(sqlite)
+            name = f"[{cword}] {count}w"
+            yield fmt(f"sqlite {name}", n=1, seconds=base, base=base)
+            yield fmt(f"memory {name}", n=1, seconds=timed(memory), base=base)
@@ -0,0 +1,129 @@
+from asyncio import run
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from random import Random
+from string import ascii_letters
+from time import perf_counter
+from typing import AsyncIterator, Iterator, MutableSequence, Sequence, cast
+from uuid import uuid4
+
+from ..coq.consts import VARS
+from ..coq.databases.insertions.database import IDB
+from ..coq.server.reviewer import Reviewer
+from ..coq.shared.context import EMPTY_CONTEXT
+from ..coq.shared.runtime import Supervisor, Worker
+from ..coq.shared.settings import BaseClient
+from ..coq.shared.types import Completion, Context, Edit
+from ._shared import fmt
+from .replay import _settings
+
+_SIZES = (1000, 5000, 20000)
+_REPEAT = 5
+
+
+class _Worker(Worker[BaseClient, None]):
+    """
+    Yields `completions`, `chunk` at a time
+    """
+
+    completions: Sequence[Completion] = ()
+    chunk = 1
+
+    def interrupt(self) -> None: ...
+
+    async def _work(
+        self, context: Context, timeout: float
+    ) -> AsyncIterator[Sequence[Completion]]:
+        for idx in range(0, len(self.completions), self.chunk):
+            yield self.completions[idx : idx + self.chunk]
+
+
+def _completions(n: int) -> Sequence[Completion]:
+    rand = Random(n)
+
+    def cont() -> Iterator[Completion]:
+        for _ in range(n):
+            word = "".join(
+                rand.choice(ascii_letters) for _ in range(rand.randint(1, 9))
+            )
+            yield Completion(
+                source="LSP",
+                always_on_top=False,
+                weight_adjust=0,
+                label=word,
+                sort_by=word,
+                primary_edit=Edit(new_text=word),
+                adjust_indent=False,
+                icon_match=None,
+            )
+
+    return tuple(cont())
+
+
+async def _collect(
+    supervisor: Supervisor, worker: _Worker, completions: Sequence[Completion]
+) -> float:
+    worker.completions = completions
+    supervisor.limits = replace(
+        supervisor.limits, completion_auto_timeout=60, completion_manual_timeout=60
+    )
+    best = float("inf")
+    for _ in range(_REPEAT):
+        context = replace(
+            EMPTY_CONTEXT,
+            change_id=uuid4(),
+            line="ab",
+            line_before="ab",
+            words="ab",
+            words_before="ab",
+            l_words_before="ab",
+        )
+        t1 = perf_counter()
+        metrics = await supervisor.collect(context)
+        t2 = perf_counter()
+        assert len(metrics) == len(completions)
+        best = min(best, t2 - t1)
+    return best
+
+
+async def _bench() -> Sequence[str]:
+    settings = _settings()
+    idb = IDB()
+    reviewer = Reviewer(options=settings.match, icons=settings.display.icons, db=idb)
+    acc: MutableSequence[str] = []
+    with ThreadPoolExecutor() as th:
+        supervisor = Supervisor(
+            th=th,
+            vars_dir=VARS,
+            display=settings.display,
+            match=settings.match,
+            comp=settings.completion,
+            limits=settings.limits,
+            reviewer=reviewer,
+        )
+        supervisor.recorder = None
+        options = BaseClient(
+            always_wait=False,
+            enabled=True,
+            max_pulls=None,
+            short_name="LSP",
+            weight_adjust=0,
+        )
+        worker = cast(
+            _Worker,
+            _Worker.init(supervisor, always_wait=False, options=options, misc=None),
+        )
+
+        for n in _SIZES:
+            completions = _completions(n)
+            worker.chunk = 1
+            base = await _collect(supervisor, worker=worker, completions=completions)
+            worker.chunk = n
+            chunked = await _collect(supervisor, worker=worker, completions=completions)
+            acc.append(fmt("per item", n=n, seconds=base, base=base))
+            acc.append(fmt("chunked", n=n, seconds=chunked, base=base))
+    return acc
+
+
+def bench() -> Iterator[str]:
+    yield from run(_bench())
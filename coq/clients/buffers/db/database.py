@@ -1,17 +1,28 @@
 from contextlib import closing, suppress
 from dataclasses import dataclass
-from itertools import islice
+from itertools import repeat
 from random import shuffle
 from sqlite3 import Connection, OperationalError
 from sqlite3.dbapi2 import Cursor
-from typing import AbstractSet, Iterator, Mapping, Optional, Sequence, Tuple
+from typing import (
+    AbstractSet,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    MutableSet,
+    Optional,
+    Sequence,
+    Tuple,
+)
 from uuid import uuid4
 
 from pynvim_pp.lib import recode
 
 from ....consts import BUFFER_DB, DEBUG
+from ....databases.index.database import attach, hits
 from ....databases.types import DB
-from ....shared.parse import coalesce
+from ....shared.processes import Processes
 from ....shared.settings import MatchOptions
 from ....shared.sql import BIGGEST_INT, init_db, like_esc
 from .sql import sql
@@ -48,44 +59,118 @@ def _ensure_buffer(cursor: Cursor, buf_id: int, filetype: str, filename: str) ->
         cursor.execute(sql("insert", "buffer"), row)
 
 
+@dataclass(frozen=True)
+class _Line:
+    line_id: bytes
+    text: str
+
+
+class _Lines:
+    """
+    Line order of a buffer, kept outside of sqlite
+
+    Lines that move only shift here, their rows & words stay untouched
+    """
+
+    def __init__(self) -> None:
+        self._lines: MutableSequence[Optional[_Line]] = []
+        self._line_nums: Optional[MutableMapping[bytes, int]] = None
+
+    def __len__(self) -> int:
+        return len(self._lines)
+
+    def span(self, lo: int, hi: int) -> Tuple[int, int]:
+        """
+        `hi < 0` is till the end, `lo` past the end pads with unknown lines
+        """
+
+        hi = len(self._lines) if hi < 0 else min(hi, len(self._lines))
+        return lo, max(lo, hi)
+
+    def get(self, lo: int, hi: int) -> Sequence[_Line]:
+        return tuple(line for line in self._lines[lo:hi] if line)
+
+    def splice(self, lo: int, hi: int, lines: Sequence[_Line]) -> None:
+        if (pad := lo - len(self._lines)) > 0:
+            self._lines.extend(repeat(None, pad))
+
+        if (line_nums := self._line_nums) is not None:
+            if len(lines) == hi - lo:
+                for line in self.get(lo, hi):
+                    line_nums.pop(line.line_id, None)
+                for line_num, line in enumerate(lines, start=lo):
+                    line_nums[line.line_id] = line_num
+            else:
+                self._line_nums = None
+
+        self._lines[lo:hi] = lines
+
+    def line_num(self, line_id: bytes) -> int:
+        if self._line_nums is None:
+            self._line_nums = {
+                line.line_id: line_num
+                for line_num, line in enumerate(self._lines)
+                if line
+            }
+        return self._line_nums.get(line_id, 0)
+
+
 def _setlines(
     cursor: Cursor,
+    processes: Processes,
     unifying_chars: AbstractSet[str],
     tokenization_limit: int,
     include_syms: bool,
+    buf: _Lines,
     buf_id: int,
     filetype: str,
     filename: str,
     lo: int,
     hi: int,
     lines: Sequence[str],
-) -> None:
-    def m0() -> Iterator[Tuple[int, str, bytes]]:
-        for line_num, line in enumerate(lines, start=lo):
-            line_id = uuid4().bytes
-            yield line_num, recode(line), line_id
+) -> Sequence[_Line]:
+    """
+    Rows in `[lo, hi)` are reused by content,
+    only lines that actually changed are tokenized
+
+    -> new `[lo, hi)`, to be spliced into `buf` once committed
+    """
+
+    stale: MutableMapping[str, MutableSequence[bytes]] = {}
+    for line in buf.get(lo, hi):
+        stale.setdefault(line.text, []).append(line.line_id)
+
+    def m0() -> Iterator[Tuple[_Line, Optional[str]]]:
+        for line in map(recode, lines):
+            if line_ids := stale.get(line):
+                yield _Line(line_id=line_ids.pop(), text=line), None
+            else:
+                yield _Line(line_id=uuid4().bytes, text=line), line
 
     line_info = [*m0()]
-    shuffle(line_info)
+    fresh = [(line.line_id, text) for line, text in line_info if text is not None]
+    shuffle(fresh)
 
     def m1() -> Iterator[Mapping]:
-        for line_num, line, line_id in line_info:
+        for line_id, line in fresh:
             yield {
                 "rowid": line_id,
                 "buffer_id": buf_id,
-                "line_num": line_num,
                 "line": line if DEBUG else "",
             }
 
+    tokens = processes.tokenize(
+        BIGGEST_INT,
+        unifying_chars=unifying_chars,
+        include_syms=include_syms,
+        texts=tuple(line for _, line in fresh),
+        budget=tokenization_limit,
+    )
+
     def m2() -> Iterator[Mapping]:
-        for line_num, line, line_id in line_info:
-            for word in coalesce(
-                unifying_chars,
-                include_syms=include_syms,
-                backwards=None,
-                chars=line,
-            ):
-                yield {"line_id": line_id, "word": word, "line_num": line_num}
+        for (line_id, _), words in zip(fresh, tokens):
+            for word in words:
+                yield {"line_id": line_id, "word": word}
 
     _ensure_buffer(
         cursor,
@@ -93,27 +178,15 @@ def _setlines(
         filetype=filetype,
         filename=filename,
     )
-    cursor.execute(
-        sql("delete", "lines"),
-        {"buffer_id": buf_id, "lo": lo, "hi": hi},
-    )
-    shift = len(lines) - (hi - lo)
-    cursor.execute(
-        sql("update", "lines_shift_1"),
-        {"buffer_id": buf_id, "lo": lo, "shift": shift},
+    cursor.executemany(
+        sql("delete", "line"),
+        ({"rowid": line_id} for line_ids in stale.values() for line_id in line_ids),
     )
-    cursor.execute(sql("update", "lines_shift_2"), {"buffer_id": buf_id})
     with suppress(UnicodeEncodeError):
         cursor.executemany(sql("insert", "line"), m1())
     with suppress(UnicodeEncodeError):
-        cursor.executemany(sql("insert", "word"), islice(m2(), tokenization_limit))
-    cursor.execute(sql("select", "line_count"), {"buffer_id": buf_id})
-    count = cursor.fetchone()["line_count"]
-    if not count:
-        cursor.execute(
-            sql("insert", "line"),
-            {"rowid": uuid4().bytes, "line": "", "buffer_id": buf_id, "line_num": 0},
-        )
+        cursor.executemany(sql("insert", "word"), m2())
+    return tuple(line for line, _ in line_info)
 
 
 def _init() -> Connection:
@@ -127,14 +200,23 @@ def _init() -> Connection:
 class BDB(DB):
     def __init__(
         self,
+        processes: Processes,
         tokenization_limit: int,
         unifying_chars: AbstractSet[str],
         include_syms: bool,
+        match: MatchOptions,
     ) -> None:
+        self._processes = processes
         self._tokenization_limit = tokenization_limit
         self._unifying_chars = unifying_chars
         self._include_syms = include_syms
+        self._bufs: MutableMapping[int, _Lines] = {}
         self._conn = _init()
+        self._index = attach(self._conn, opts=match, triggers=sql("create", "index"))
+
+    def _line_num(self, buf_id: int, line_id: bytes) -> int:
+        buf = self._bufs.get(buf_id)
+        return (buf.line_num(line_id) if buf else 0) + 1
 
     def vacuum(self, live_bufs: Mapping[int, int]) -> None:
         with suppress(OperationalError):
@@ -147,14 +229,22 @@ class BDB(DB):
                     ({"buffer_id": buf_id} for buf_id in dead),
                 )
                 cursor.executemany(
-                    sql("delete", "lines"),
+                    sql("delete", "line"),
                     (
-                        {"buffer_id": buf_id, "lo": line_count, "hi": -1}
+                        {"rowid": line.line_id}
                         for buf_id, line_count in live_bufs.items()
+                        if (buf := self._bufs.get(buf_id))
+                        for line in buf.get(line_count, len(buf))
                     ),
                 )
                 cursor.execute("PRAGMA optimize", ())
 
+            for buf_id in dead:
+                self._bufs.pop(buf_id, None)
+            for buf_id, line_count in live_bufs.items():
+                if buf := self._bufs.get(buf_id):
+                    buf.splice(line_count, len(buf), ())
+
     def buf_update(self, buf_id: int, filetype: str, filename: str) -> None:
         with self._conn, closing(self._conn.cursor()) as cursor:
             _ensure_buffer(
@@ -173,13 +263,17 @@ class BDB(DB):
         hi: int,
         lines: Sequence[str],
     ) -> None:
+        buf = self._bufs.setdefault(buf_id, _Lines())
+        lo, hi = buf.span(lo, hi)
         with suppress(OperationalError):
             with self._conn, closing(self._conn.cursor()) as cursor:
-                _setlines(
+                new_lines = _setlines(
                     cursor,
+                    processes=self._processes,
                     unifying_chars=self._unifying_chars,
                     tokenization_limit=self._tokenization_limit,
                     include_syms=self._include_syms,
+                    buf=buf,
                     buf_id=buf_id,
                     filetype=filetype,
                     filename=filename,
@@ -187,6 +281,7 @@ class BDB(DB):
                     hi=hi,
                     lines=lines,
                 )
+            buf.splice(lo, hi, new_lines)
 
     def words(
         self,
@@ -197,39 +292,45 @@ class BDB(DB):
         limit: int,
         update: Optional[Update],
     ) -> Iterator[BufferWord]:
+        if update:
+            self.set_lines(
+                update.buf_id,
+                filetype=update.filetype,
+                filename=update.filename,
+                lo=update.lo,
+                hi=update.hi,
+                lines=update.lines,
+            )
+
         with suppress(OperationalError):
             with self._conn, closing(self._conn.cursor()) as cursor:
-                if update:
-                    _setlines(
-                        cursor,
-                        unifying_chars=self._unifying_chars,
-                        tokenization_limit=self._tokenization_limit,
-                        include_syms=self._include_syms,
-                        buf_id=update.buf_id,
-                        filetype=update.filetype,
-                        filename=update.filename,
-                        lo=update.lo,
-                        hi=update.hi,
-                        lines=update.lines,
-                    )
-
-                cursor.execute(
-                    sql("select", "words"),
-                    {
-                        "cut_off": opts.fuzzy_cutoff,
-                        "look_ahead": opts.look_ahead,
-                        "limit": limit,
-                        "filetype": filetype,
-                        "word": word,
-                        "sym": sym,
-                        "like_word": like_esc(word[: opts.exact_matches]),
-                        "like_sym": like_esc(sym[: opts.exact_matches]),
-                    },
-                )
-                for row in cursor:
-                    yield BufferWord(
-                        text=row["word"],
-                        filetype=row["filetype"],
-                        filename=row["filename"],
-                        line_num=row["line_num"] + 1,
+                with hits(
+                    cursor, index=self._index, opts=opts, word=word, sym=sym
+                ) as params:
+                    cursor.execute(
+                        sql("select", "words_hits" if self._index else "words"),
+                        {
+                            "cut_off": opts.fuzzy_cutoff,
+                            "look_ahead": opts.look_ahead,
+                            "limit": limit,
+                            "filetype": filetype,
+                            "word": word,
+                            "sym": sym,
+                            "like_word": like_esc(word[: opts.exact_matches]),
+                            "like_sym": like_esc(sym[: opts.exact_matches]),
+                            **params,
+                        },
                     )
+                    # SQL dedupes rows, the same word can still span filetypes
+                    seen: MutableSet[str] = set()
+                    for row in cursor:
+                        if (text := row["word"]) not in seen:
+                            seen.add(text)
+                            yield BufferWord(
+                                text=text,
+                                filetype=row["filetype"],
+                                filename=row["filename"],
+                                line_num=self._line_num(
+                                    row["buffer_id"], line_id=row["line_id"]
+                                ),
+                            )
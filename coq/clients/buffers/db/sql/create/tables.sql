@@ -12,12 +12,9 @@ CREATE INDEX IF NOT EXISTS buffers_filetype ON buffers (filetype);
 CREATE TABLE IF NOT EXISTS lines (
   rowid     BLOB    NOT NULL PRIMARY KEY,
   buffer_id INTEGER NOT NULL REFERENCES buffers (rowid) ON UPDATE CASCADE ON DELETE CASCADE,
-  line_num  INTEGER NOT NULL,
-  line      TEXT    NOT NULL,
-  UNIQUE(buffer_id, line_num)
+  line      TEXT    NOT NULL
 ) WITHOUT ROWID;
 CREATE INDEX IF NOT EXISTS lines_buffer_id ON lines (buffer_id);
-CREATE INDEX IF NOT EXISTS lines_line_num  ON lines (line_num);
 
 
 CREATE TABLE IF NOT EXISTS words (
@@ -28,25 +25,96 @@ CREATE TABLE IF NOT EXISTS words (
 );
 CREATE INDEX IF NOT EXISTS words_line_id ON words (line_id);
 CREATE INDEX IF NOT EXISTS words_word    ON words (word);
-CREATE INDEX IF NOT EXISTS words_lword   ON words (lword);
-
-
-CREATE VIEW IF NOT EXISTS words_view AS
-SELECT
-  words.word,
-  words.lword,
-  buffers.filetype,
-  buffers.filename,
-  lines.line_num
-FROM buffers
-JOIN lines
-  ON lines.buffer_id = buffers.rowid
-JOIN words
-  ON words.line_id = lines.rowid
-GROUP BY
-  words.word
-HAVING
-  words.word <> '';
+
+
+-- Deduplicated `words`, maintained by the triggers below
+-- `sample_line` is any line the word is on, `filetype` is of its buffer
+CREATE TABLE IF NOT EXISTS unique_words (
+  word        TEXT    NOT NULL PRIMARY KEY,
+  lword       TEXT    NOT NULL,
+  filetype    TEXT    NOT NULL,
+  refcount    INTEGER NOT NULL,
+  sample_line BLOB    NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS unique_words_lword       ON unique_words (lword COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS unique_words_sample_line ON unique_words (sample_line);
+
+
+CREATE TRIGGER IF NOT EXISTS words_insert
+AFTER INSERT ON words
+WHEN NEW.word <> ''
+BEGIN
+  INSERT INTO unique_words (word, lword, filetype, refcount, sample_line)
+  SELECT
+    NEW.word,
+    NEW.lword,
+    buffers.filetype,
+    1,
+    NEW.line_id
+  FROM lines
+  JOIN buffers
+  ON
+    buffers.rowid = lines.buffer_id
+  WHERE
+    lines.rowid = NEW.line_id
+  ON CONFLICT (word) DO UPDATE SET refcount = refcount + 1;
+END;
+
+
+CREATE TRIGGER IF NOT EXISTS words_delete
+AFTER DELETE ON words
+WHEN OLD.word <> ''
+BEGIN
+  UPDATE unique_words
+  SET
+    refcount = refcount - 1
+  WHERE
+    word = OLD.word;
+  DELETE FROM unique_words
+  WHERE
+    word = OLD.word
+    AND
+    refcount <= 0;
+  UPDATE unique_words
+  SET
+    (sample_line, filetype) = (
+      SELECT
+        lines.rowid,
+        buffers.filetype
+      FROM words
+      JOIN lines
+      ON
+        lines.rowid = words.line_id
+      JOIN buffers
+      ON
+        buffers.rowid = lines.buffer_id
+      WHERE
+        words.word = OLD.word
+      LIMIT 1
+    )
+  WHERE
+    word = OLD.word
+    AND
+    sample_line = OLD.line_id;
+END;
+
+
+CREATE TRIGGER IF NOT EXISTS buffers_filetype
+AFTER UPDATE OF filetype ON buffers
+WHEN OLD.filetype <> NEW.filetype
+BEGIN
+  UPDATE unique_words
+  SET
+    filetype = NEW.filetype
+  WHERE
+    sample_line IN (
+      SELECT
+        rowid
+      FROM lines
+      WHERE
+        buffer_id = NEW.rowid
+    );
+END;
 
 
 END;
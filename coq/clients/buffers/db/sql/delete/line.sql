@@ -0,0 +1,3 @@
+DELETE FROM lines
+WHERE
+  rowid = :rowid
@@ -1,3 +1,3 @@
-INSERT INTO lines ( rowid,  buffer_id,  line_num,  line)
-VALUES            (:rowid, :buffer_id, :line_num, :line)
+INSERT INTO lines ( rowid,  buffer_id,  line)
+VALUES            (:rowid, :buffer_id, :line)
 
@@ -1,38 +1,58 @@
 SELECT
-  word,
-  filetype,
-  filename,
-  line_num
-FROM words_view
+  unique_words.word,
+  unique_words.filetype,
+  buffers.filename,
+  lines.buffer_id,
+  lines.rowid AS line_id
+FROM unique_words
+JOIN lines
+ON
+  lines.rowid = unique_words.sample_line
+JOIN buffers
+ON
+  buffers.rowid = lines.buffer_id
 WHERE
+  :word <> ''
+  AND
+  CASE
+    WHEN :filetype <> NULL THEN unique_words.filetype = :filetype
+    ELSE 1
+  END
+  AND
+  unique_words.lword LIKE :like_word ESCAPE '!'
+  AND
+  LENGTH(unique_words.word) + :look_ahead >= LENGTH(:word)
+  AND
+  unique_words.word <> SUBSTR(:word, 1, LENGTH(unique_words.word))
+  AND
+  X_SIMILARITY(LOWER(:word), unique_words.lword, :look_ahead) > :cut_off
+UNION
+SELECT
+  unique_words.word,
+  unique_words.filetype,
+  buffers.filename,
+  lines.buffer_id,
+  lines.rowid AS line_id
+FROM unique_words
+JOIN lines
+ON
+  lines.rowid = unique_words.sample_line
+JOIN buffers
+ON
+  buffers.rowid = lines.buffer_id
+WHERE
+  :sym <> ''
+  AND
   CASE
-    WHEN :filetype <> NULL THEN filetype = :filetype
+    WHEN :filetype <> NULL THEN unique_words.filetype = :filetype
     ELSE 1
   END
   AND
-  (
-    (
-      :word <> ''
-      AND
-      lword LIKE :like_word ESCAPE '!'
-      AND
-      LENGTH(word) + :look_ahead >= LENGTH(:word)
-      AND
-      word <> SUBSTR(:word, 1, LENGTH(word))
-      AND
-      X_SIMILARITY(LOWER(:word), lword, :look_ahead) > :cut_off
-    )
-    OR
-    (
-      :sym <> ''
-      AND
-      lword LIKE :like_sym ESCAPE '!'
-      AND
-      LENGTH(word) + :look_ahead >= LENGTH(:sym)
-      AND
-      word <> SUBSTR(:sym, 1, LENGTH(word))
-      AND
-      X_SIMILARITY(LOWER(:sym), lword, :look_ahead) > :cut_off
-    )
-  )
+  unique_words.lword LIKE :like_sym ESCAPE '!'
+  AND
+  LENGTH(unique_words.word) + :look_ahead >= LENGTH(:sym)
+  AND
+  unique_words.word <> SUBSTR(:sym, 1, LENGTH(unique_words.word))
+  AND
+  X_SIMILARITY(LOWER(:sym), unique_words.lword, :look_ahead) > :cut_off
 LIMIT :limit
@@ -0,0 +1,46 @@
+SELECT
+  unique_words.word,
+  unique_words.filetype,
+  buffers.filename,
+  lines.buffer_id,
+  lines.rowid AS line_id
+FROM json_each(:hits) AS hits
+JOIN unique_words
+ON
+  unique_words.lword = hits.value COLLATE NOCASE
+JOIN lines
+ON
+  lines.rowid = unique_words.sample_line
+JOIN buffers
+ON
+  buffers.rowid = lines.buffer_id
+WHERE
+  CASE
+    WHEN :filetype <> NULL THEN unique_words.filetype = :filetype
+    ELSE 1
+  END
+  AND
+  (
+    (
+      :word <> ''
+      AND
+      unique_words.lword IN (SELECT value FROM json_each(:word_hits))
+      AND
+      LENGTH(unique_words.word) + :look_ahead >= LENGTH(:word)
+      AND
+      unique_words.word <> SUBSTR(:word, 1, LENGTH(unique_words.word))
+    )
+    OR
+    (
+      :sym <> ''
+      AND
+      unique_words.lword IN (SELECT value FROM json_each(:sym_hits))
+      AND
+      LENGTH(unique_words.word) + :look_ahead >= LENGTH(:sym)
+      AND
+      unique_words.word <> SUBSTR(:sym, 1, LENGTH(unique_words.word))
+    )
+  )
+ORDER BY
+  hits.key
+LIMIT :limit
@@ -81,9 +81,11 @@ class Worker(BaseWorker[BuffersClient, None]):
         misc: None,
     ) -> None:
         self._db = BDB(
-            supervisor.limits.tokenization_limit,
+            supervisor.processes,
+            tokenization_limit=supervisor.limits.tokenization_limit,
             unifying_chars=supervisor.match.unifying_chars,
             include_syms=options.match_syms,
+            match=supervisor.match,
         )
         super().__init__(
             ex,
@@ -151,7 +153,9 @@ class Worker(BaseWorker[BuffersClient, None]):
 
         await self._ex.submit(cont())
 
-    async def _work(self, context: Context, timeout: float) -> AsyncIterator[Completion]:
+    async def _work(
+        self, context: Context, timeout: float
+    ) -> AsyncIterator[Sequence[Completion]]:
         limit = (
             BIGGEST_INT
             if context.manual
@@ -180,17 +184,21 @@ class Worker(BaseWorker[BuffersClient, None]):
                 limit=limit,
                 update=update,
             )
-            for word in words:
-                edit = Edit(new_text=word.text)
-                cmp = Completion(
-                    source=self._options.short_name,
-                    always_on_top=self._options.always_on_top,
-                    weight_adjust=self._options.weight_adjust,
-                    label=edit.new_text,
-                    sort_by=word.text,
-                    primary_edit=edit,
-                    adjust_indent=False,
-                    doc=_doc(self._options, context=context, word=word),
-                    icon_match="Text",
-                )
-                yield cmp
+
+            def cont() -> Iterator[Completion]:
+                for word in words:
+                    edit = Edit(new_text=word.text)
+                    cmp = Completion(
+                        source=self._options.short_name,
+                        always_on_top=self._options.always_on_top,
+                        weight_adjust=self._options.weight_adjust,
+                        label=edit.new_text,
+                        sort_by=word.text,
+                        primary_edit=edit,
+                        adjust_indent=False,
+                        doc=_doc(self._options, context=context, word=word),
+                        icon_match="Text",
+                    )
+                    yield cmp
+
+            yield tuple(cont())
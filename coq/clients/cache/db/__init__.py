@@ -1,3 +0,0 @@
-"""
-This file defines cache as a submodule of clients.
-"""
@@ -1,3 +0,0 @@
-PRAGMA auto_vacuum = INCREMENTAL;
-PRAGMA foreign_keys = ON;
-PRAGMA temp_store = MEMORY;
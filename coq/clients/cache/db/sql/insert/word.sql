@@ -1,2 +0,0 @@
-INSERT OR REPLACE INTO words (key,  word,  lword)
-VALUES                       (:key, :word, LOWER(:word))
@@ -0,0 +1,84 @@
+from itertools import chain
+from typing import Iterable, Iterator, MutableMapping, MutableSet, Tuple
+
+from ...shared.fuzzy import fuzzy_query, query_quick_ratio
+from ...shared.settings import MatchOptions
+from ...shared.sql import BIGGEST_INT
+from ...shared.word_index import sql_lower
+
+_Row = Tuple[bytes, str]
+
+
+class Index:
+    """
+    `(key, word)` rows of the cache, by `lword`
+
+    `prefixes` is a trie flattened down to `exact_matches` levels,
+    each node holding every row under it, as in `WordIndex`
+    """
+
+    def __init__(self, exact_matches: int) -> None:
+        self._depth = exact_matches
+        self._prefixes: MutableMapping[str, MutableMapping[_Row, str]] = {}
+        self._words: MutableMapping[bytes, MutableSet[str]] = {}
+
+    def _keys(self, lword: str) -> Iterator[str]:
+        for idx in range(min(len(lword), self._depth) + 1):
+            yield lword[:idx]
+
+    def clear(self) -> None:
+        self._prefixes.clear()
+        self._words.clear()
+
+    def insert(self, rows: Iterable[_Row]) -> None:
+        prefixes = self._prefixes
+        for row in rows:
+            key, word = row
+            if word:
+                self._words.setdefault(key, set()).add(word)
+                lword = sql_lower(word)
+                for prefix in self._keys(lword):
+                    prefixes.setdefault(prefix, {})[row] = lword
+
+    def remove(self, keys: Iterable[bytes]) -> None:
+        for key in keys:
+            for word in self._words.pop(key, ()):
+                for prefix in self._keys(sql_lower(word)):
+                    if (rows := self._prefixes.get(prefix)) is not None:
+                        rows.pop((key, word), None)
+                        if not rows:
+                            self._prefixes.pop(prefix)
+
+    def _hits(self, opts: MatchOptions, word: str) -> Iterator[_Row]:
+        lword = sql_lower(word)
+        query = fuzzy_query(lword)
+        min_len = len(word) - opts.look_ahead
+        # snapshot, `insert` may run before the caller is done
+        rows = tuple(self._prefixes.get(lword[: self._depth], {}).items())
+        for row, lw in rows:
+            if (
+                len(lw) >= min_len
+                and query_quick_ratio(query, rhs=lw, look_ahead=opts.look_ahead)
+                > opts.fuzzy_cutoff
+            ):
+                yield row
+
+    def select(
+        self, opts: MatchOptions, word: str, sym: str, limitless: bool
+    ) -> Iterator[_Row]:
+        """
+        `lword LIKE word[:exact_matches] || '%'`
+        `AND LENGTH(lword) + look_ahead >= LENGTH(word)`
+        `AND X_SIMILARITY(LOWER(word), lword, look_ahead) > cut_off`
+
+        Same for `sym`, at most one row per `key`
+        """
+
+        limit = BIGGEST_INT if limitless else opts.max_results
+        seen: MutableSet[bytes] = set()
+        for key, hit in chain(self._hits(opts, word=word), self._hits(opts, word=sym)):
+            if len(seen) >= limit:
+                break
+            elif key not in seen:
+                seen.add(key)
+                yield key, hit
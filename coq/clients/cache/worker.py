@@ -1,11 +1,10 @@
-from dataclasses import dataclass, replace
+from dataclasses import dataclass
 from itertools import chain
 from typing import (
     AbstractSet,
     Iterable,
     Iterator,
     Mapping,
-    MutableMapping,
     MutableSet,
     Optional,
     Tuple,
@@ -13,20 +12,17 @@ from typing import (
 from uuid import UUID, uuid4
 
 from ...shared.fuzzy import multi_set_ratio
+from ...shared.lru import SizedLRU, Usage
 from ...shared.parse import coalesce
-from ...shared.repeat import sanitize
+from ...shared.repeat import sanitize_cached
 from ...shared.runtime import Supervisor
 from ...shared.settings import MatchOptions
 from ...shared.timeit import timeit
-from ...shared.types import (
-    BaseRangeEdit,
-    Completion,
-    Context,
-    Cursors,
-    Interruptible,
-    SnippetEdit,
-)
-from .db.database import Database
+from ...shared.types import Completion, Context, Interruptible, SnippetEdit
+from .index import Index
+
+# the dataclasses, `uid`, edits & co, in bytes, roughly
+_OVERHEAD = 1024
 
 
 @dataclass(frozen=True)
@@ -57,33 +53,26 @@ def _use_cache(match: MatchOptions, cache: _CacheCtx, ctx: Context) -> bool:
     return use_cache
 
 
-def _overlap(row: int, edit: BaseRangeEdit) -> bool:
-    (b_row, _), (e_row, _) = edit.begin, edit.end
-    return b_row == row or e_row == row
+def _sizeof(comp: Completion) -> int:
+    """
+    Approximate, docs dominate
+    """
 
-
-def sanitize_cached(
-    inline_shift: bool, cursor: Cursors, comp: Completion, sort_by: Optional[str]
-) -> Optional[Completion]:
-    if edit := sanitize(inline_shift, cursor, edit=comp.primary_edit):
-        row, *_ = cursor
-        cached = replace(
-            comp,
-            primary_edit=edit,
-            secondary_edits=tuple(
-                edit for edit in comp.secondary_edits if not _overlap(row, edit=edit)
-            ),
-            sort_by=sort_by or comp.sort_by,
-        )
-        return cached
-    else:
-        return None
+    chars = (
+        len(comp.label)
+        + len(comp.sort_by)
+        + len(comp.primary_edit.new_text)
+        + sum(len(edit.new_text) for edit in comp.secondary_edits)
+        + (len(comp.doc.text) if comp.doc else 0)
+    )
+    # `extern` holds on to the raw item, which has most of the same text
+    return _OVERHEAD + chars * (2 if comp.extern else 1)
 
 
 class CacheWorker(Interruptible):
     def __init__(self, supervisor: Supervisor) -> None:
         self._supervisor = supervisor
-        self._db = Database()
+        self._index = Index(supervisor.match.exact_matches)
         self._cache_ctx = _CacheCtx(
             change_id=uuid4(),
             commit_id=uuid4(),
@@ -95,10 +84,21 @@ class CacheWorker(Interruptible):
             ws_before=""
         )
         self._clients: MutableSet[str] = set()
-        self._cached: MutableMapping[bytes, Completion] = {}
+        self._cached: SizedLRU[bytes, Completion] = SizedLRU(
+            supervisor.limits.cache_budget, sizeof=_sizeof
+        )
+        self._hits = self._misses = 0
 
-    def interrupt(self) -> None:
-        self._db.interrupt()
+    def interrupt(self) -> None: ...
+
+    def usage(self) -> Usage:
+        return Usage(
+            entries=len(self._cached),
+            size=self._cached.size,
+            hits=self._hits,
+            misses=self._misses,
+            evicted=self._cached.evicted,
+        )
 
     def set_cache(
         self,
@@ -123,12 +123,13 @@ class CacheWorker(Interruptible):
                     yield key, val.sort_by
 
         if not skip_db:
-            self._db.insert(cont())
+            self._index.insert(cont())
 
         for client in items:
             if client:
                 self._clients.add(client)
-        self._cached.update(new_comps)
+        evicted = self._cached.update(new_comps)
+        self._index.remove(evicted)
 
     def apply_cache(
         self, context: Context, always: bool, inline_shift: bool
@@ -151,16 +152,20 @@ class CacheWorker(Interruptible):
         ) and bool(self._cached)
         cached_clients = {*self._clients}
 
-        if not use_cache:
+        if use_cache:
+            self._hits += 1
+        else:
+            self._misses += 1
             self._clients.clear()
             self._cached.clear()
+            self._index.clear()
 
         selected = (
-            ((key, val.sort_by) for key, val in self._cached.items())
+            # snapshot, `get` reorders the LRU
+            tuple((val.uid.bytes, val.sort_by) for val in self._cached.values())
             if always
-            else self._db.select(
-                not use_cache,
-                opts=self._supervisor.match,
+            else self._index.select(
+                self._supervisor.match,
                 word=context.words,
                 sym=context.syms,
                 limitless=context.manual,
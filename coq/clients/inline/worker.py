@@ -1,5 +1,5 @@
 from asyncio import Condition, as_completed
-from typing import AsyncIterator, Optional
+from typing import AsyncIterator, Optional, Sequence
 
 from pynvim_pp.logging import suppress_and_log
 from std2 import anext
@@ -10,6 +10,7 @@ from ...consts import CACHE_CHUNK
 from ...lsp.requests.completion import comp_lsp_inline
 from ...lsp.types import LSPcomp
 from ...shared.executor import AsyncExecutor
+from ...shared.lru import Usage
 from ...shared.runtime import Supervisor
 from ...shared.runtime import Worker as BaseWorker
 from ...shared.settings import LSPInlineClient
@@ -42,6 +43,9 @@ class Worker(BaseWorker[LSPInlineClient, None]):
         with self._interrupt():
             self._cache.interrupt()
 
+    def usage(self) -> Optional[Usage]:
+        return self._cache.usage()
+
     async def _request(self, context: Context) -> AsyncIterator[LSPcomp]:
         rows = comp_lsp_inline(
             short_name=self._options.short_name,
@@ -70,7 +74,9 @@ class Worker(BaseWorker[LSPInlineClient, None]):
 
             await self._with_interrupt(cont())
 
-    async def _work(self, context: Context, timeout: float) -> AsyncIterator[Completion]:
+    async def _work(
+        self, context: Context, timeout: float
+    ) -> AsyncIterator[Sequence[Completion]]:
         async with self._work_lock, self._working:
             try:
                 _, _, cached = self._cache.apply_cache(
@@ -97,7 +103,6 @@ class Worker(BaseWorker[LSPInlineClient, None]):
                         yield lsp_comps
 
                 async for comp in stream():
-                    for row in comp.items:
-                        yield row
+                    yield tuple(comp.items)
             finally:
                 self._working.notify_all()
@@ -1,54 +1,92 @@
-from bisect import bisect
-from collections import defaultdict
 from datetime import timedelta
-from math import exp, floor, gamma, inf, log
-from random import random, uniform
-from typing import AbstractSet, MutableSet, Optional, Sequence
+from random import random
+from time import monotonic
+from typing import AbstractSet, MutableMapping, MutableSet, Optional, Sequence
 
 from std2.itertools import pairwise
 
-
-def _logit(x: float) -> float:
-    return log(x / (1 - x))
-
-
-def _bins(k: float, n: int) -> Sequence[float]:
-    return tuple((exp(k * i) - 1) * 1000 for i in range(n)) + (inf,)
+# 5ms, 10ms, 20ms ... ~5s
+_BINS: Sequence[float] = (0.0, *(0.005 * 2**i for i in range(11)))
+_DECAY = 0.9
+_PROBABILITY_FLOOR = 0.05
+_LIKELY = 0.5
 
 
 class _Dist:
+    """
+    Exponentially decayed histogram of response times
+    """
+
     def __init__(self) -> None:
-        self._bins = _bins(k=0.03, n=6)
-        self._decay = 0.99
-        self._cdf = [0.0 for _ in pairwise(self._bins)]
-        self._sum = 0.0
+        self._weights = [0.0 for _ in _BINS]
 
     def update(self, x: float) -> None:
-        binned, inc = False, 0.0
-        for i, (lo, hi) in enumerate(pairwise(self._bins)):
-            binned |= lo <= x < hi
-            inc += binned
-            self._cdf[i] = self._cdf[i] * self._decay + binned
-        self._cdf[-1] = self._cdf[-1] * self._decay + inc
+        for i, lo in enumerate(_BINS):
+            hit = lo <= x and (i + 1 >= len(_BINS) or x < _BINS[i + 1])
+            self._weights[i] = self._weights[i] * _DECAY + hit
+
+    def cdf(self, x: float) -> float:
+        """
+        P(response time <= x), linear within each bin
+        """
 
-    def inv_cdf(self, p: float) -> float:
-        assert 0 <= p <= 1
+        if not (total := sum(self._weights)):
+            return 1.0
 
-        i = round((len(self._cdf) - 1) * p)
-        print(self._cdf[i + 1])
-        frac = (p - self._cdf[i]) / (self._cdf[i + 1] - self._cdf[i])
-        return self._bins[i] + frac * (self._bins[i + 1] - self._bins[i])
+        acc = 0.0
+        for (lo, hi), weight in zip(pairwise(_BINS), self._weights):
+            if x >= hi:
+                acc += weight
+            elif x > lo:
+                acc += weight * (x - lo) / (hi - lo)
+        return acc / total
 
 
 class MultiArmedBandit:
-    def __init__(self) -> None:
-        self._probability_floor = 0.05
-        self._clients: MutableSet[str] = set()
+    """
+    Learns how fast each client answers, to skip the ones that will not make it
+    """
 
-    def _elapsed(self, client: str) -> float:
-        return inf
+    def __init__(self) -> None:
+        self._clients: MutableMapping[str, _Dist] = {}
+        self._pending: MutableSet[str] = set()
+        self._t0 = monotonic()
+        self._deadline: Optional[float] = None
 
     def update(
         self, clients: AbstractSet[str], client: Optional[str], elapsed: timedelta
     ) -> None:
-        self._clients |= clients
+        for name in clients:
+            self._clients.setdefault(name, _Dist())
+        if client is not None:
+            self._pending.discard(client)
+            self._clients.setdefault(client, _Dist()).update(elapsed.total_seconds())
+
+    def skip(self, deadline: Optional[float]) -> AbstractSet[str]:
+        """
+        Clients to leave out of the next request
+
+        Clients that missed the last deadline without answering count as having
+        taken as long as that request lasted
+        """
+
+        now = monotonic()
+        if self._deadline is not None and (waited := now - self._t0) > self._deadline:
+            for name in self._pending:
+                if dist := self._clients.get(name):
+                    dist.update(waited)
+        self._t0, self._deadline = now, deadline
+
+        if deadline is None:
+            self._pending = set(self._clients)
+            return set()
+        else:
+            odds = {name: dist.cdf(deadline) for name, dist in self._clients.items()}
+            best = max(odds, key=lambda name: odds[name], default=None)
+            skip = {
+                name
+                for name, p in odds.items()
+                if name != best and p < _LIKELY and random() >= _PROBABILITY_FLOOR
+            }
+            self._pending = set(self._clients) - skip
+            return skip
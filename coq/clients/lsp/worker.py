@@ -3,11 +3,13 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 from typing import (
     AsyncIterator,
+    Iterable,
     Iterator,
     MutableMapping,
     MutableSequence,
     MutableSet,
     Optional,
+    Sequence,
     Tuple,
 )
 
@@ -16,19 +18,22 @@ from std2 import anext
 from std2.itertools import batched
 
 from ...consts import CACHE_CHUNK
+from ...lsp.parse import eager
 from ...lsp.requests.completion import comp_lsp
-from ...lsp.types import LSPcomp
+from ...lsp.types import LazyCompletion, LazyLSPcomp, Prefilter
 from ...shared.context import cword_before
 from ...shared.executor import AsyncExecutor
-from ...shared.fuzzy import multi_set_ratio
+from ...shared.fuzzy import fuzzy_query, query_multi_set_ratio
+from ...shared.lru import Usage
 from ...shared.parse import lower
+from ...shared.repeat import sanitize_cached
 from ...shared.runtime import Supervisor
 from ...shared.runtime import Worker as BaseWorker
 from ...shared.settings import LSPClient, MatchOptions
 from ...shared.sql import BIGGEST_INT
 from ...shared.timeit import timeit
 from ...shared.types import Completion, Context, SnippetEdit
-from ..cache.worker import CacheWorker, sanitize_cached
+from ..cache.worker import CacheWorker
 from .mul_bandit import MultiArmedBandit
 
 
@@ -39,8 +44,13 @@ class _Src(Enum):
 
 
 def _use_comp(
-    match: MatchOptions, context: Context, sort_by: str, comp: Completion
-) -> bool:
+    match: MatchOptions, context: Context, lazy: LazyCompletion
+) -> Optional[Completion]:
+    """
+    Only `decode()` if `sort_by` is good enough
+    """
+
+    sort_by = lazy.sort_by
     cword = cword_before(
         match.unifying_chars,
         lower=True,
@@ -49,28 +59,54 @@ def _use_comp(
     )
 
     if len(sort_by) + match.look_ahead >= len(cword):
-        ratio = multi_set_ratio(
-            cword,
+        ratio = query_multi_set_ratio(
+            fuzzy_query(cword),
             lower(sort_by),
             look_ahead=match.look_ahead,
         )
-        use = ratio >= match.fuzzy_cutoff and (
-            isinstance(comp.primary_edit, SnippetEdit)
-            or bool(comp.secondary_edits)
-            or bool(comp.extern)
-            or not cword.startswith(comp.primary_edit.new_text)
-        )
-        return use
+        if ratio >= match.fuzzy_cutoff and (comp := lazy.decode()):
+            use = (
+                isinstance(comp.primary_edit, SnippetEdit)
+                or bool(comp.secondary_edits)
+                or bool(comp.extern)
+                or not cword.startswith(comp.primary_edit.new_text)
+            )
+            return comp if use else None
+        else:
+            return None
+    else:
+        return None
+
+
+def _decoded(lazies: Iterable[LazyCompletion]) -> Iterator[Completion]:
+    for lazy in lazies:
+        if comp := lazy.decode():
+            yield comp
+
+
+def _prefilter(
+    options: LSPClient, match: MatchOptions, context: Context
+) -> Optional[Prefilter]:
+    if not (options.prefilter or options.defer_docs):
+        return None
     else:
-        return False
+        cword = context.l_words_before
+        return Prefilter(
+            # non ascii is left to `_use_comp`
+            cword=cword if options.prefilter and cword.isascii() else "",
+            look_ahead=match.look_ahead,
+            fuzzy_cutoff=match.fuzzy_cutoff,
+            unifying_chars="".join(match.unifying_chars),
+            defer_docs=options.defer_docs,
+        )
 
 
 @dataclass(frozen=True)
 class _LocalCache:
-    pre: MutableMapping[Optional[str], Iterator[Completion]] = field(
+    pre: MutableMapping[Optional[str], Iterator[LazyCompletion]] = field(
         default_factory=dict
     )
-    post: MutableMapping[Optional[str], MutableSequence[Completion]] = field(
+    post: MutableMapping[Optional[str], MutableSequence[LazyCompletion]] = field(
         default_factory=dict
     )
 
@@ -102,14 +138,24 @@ class Worker(BaseWorker[LSPClient, None]):
         with self._interrupt():
             self._cache.interrupt()
 
-    async def _request(self, context: Context) -> AsyncIterator[LSPcomp]:
+    def usage(self) -> Optional[Usage]:
+        return self._cache.usage()
+
+    async def _request(
+        self, context: Context, deadline: Optional[float], prefilter: bool
+    ) -> AsyncIterator[LazyLSPcomp]:
         rows = comp_lsp(
             short_name=self._options.short_name,
             always_on_top=self._options.always_on_top,
             weight_adjust=self._options.weight_adjust,
             context=context,
             chunk=self._max_results,
-            clients=set()
+            clients=self._stats.skip(deadline),
+            prefilter=(
+                _prefilter(self._options, match=self._supervisor.match, context=context)
+                if prefilter
+                else None
+            ),
         )
         async for row, peers, elapsed in rows:
             self._stats.update(peers, client=row.client, elapsed=elapsed)
@@ -123,18 +169,28 @@ class Worker(BaseWorker[LSPClient, None]):
             async def cont() -> None:
                 with suppress_and_log(), timeit("LSP CACHE"):
                     if not self._work_lock.locked():
-                        self._cache.set_cache(self._local_cached.post, skip_db=False)
+                        self._cache.set_cache(
+                            {
+                                client: _decoded(lazies)
+                                for client, lazies in self._local_cached.post.items()
+                            },
+                            skip_db=False,
+                        )
                         acc = tuple(self._local_cached.pre.items())
                         for client, comps in acc:
                             await sleep(0)
                             if not self._work_lock.locked():
-                                for chunked in batched(comps, n=CACHE_CHUNK):
+                                for chunked in batched(_decoded(comps), n=CACHE_CHUNK):
                                     self._cache.set_cache(
                                         {client: chunked}, skip_db=False
                                     )
                         if context := self._supervisor.current_context:
-                            async for lsp_comps in self._request(context):
-                                for chunked in batched(lsp_comps.items, n=CACHE_CHUNK):
+                            async for lsp_comps in self._request(
+                                context, deadline=None, prefilter=False
+                            ):
+                                for chunked in batched(
+                                    _decoded(lsp_comps.items), n=CACHE_CHUNK
+                                ):
                                     if not self._work_lock.locked():
                                         self._cache.set_cache(
                                             {lsp_comps.client: chunked}, skip_db=False
@@ -143,7 +199,9 @@ class Worker(BaseWorker[LSPClient, None]):
 
             await self._with_interrupt(cont())
 
-    async def _work(self, context: Context, timeout: float) -> AsyncIterator[Completion]:
+    async def _work(
+        self, context: Context, timeout: float
+    ) -> AsyncIterator[Sequence[Completion]]:
         inline_shift = False
         limit = (
             BIGGEST_INT
@@ -160,27 +218,31 @@ class Worker(BaseWorker[LSPClient, None]):
                     self._local_cached.pre.clear()
                     self._local_cached.post.clear()
 
-                lsp_stream = self._request(context)
+                lsp_stream = self._request(
+                    context,
+                    deadline=None if context.manual else timeout,
+                    prefilter=True,
+                )
 
-                async def db() -> Tuple[_Src, LSPcomp]:
-                    return _Src.from_db, LSPcomp(
-                        client=None, local_cache=False, items=cached
+                async def db() -> Tuple[_Src, LazyLSPcomp]:
+                    return _Src.from_db, LazyLSPcomp(
+                        client=None, local_cache=False, items=map(eager, cached)
                     )
 
-                async def lsp() -> Optional[Tuple[_Src, LSPcomp]]:
+                async def lsp() -> Optional[Tuple[_Src, LazyLSPcomp]]:
                     if comps := await anext(lsp_stream, None):
                         return _Src.from_query, comps
                     else:
                         return None
 
-                async def stream() -> AsyncIterator[Tuple[_Src, LSPcomp]]:
+                async def stream() -> AsyncIterator[Tuple[_Src, LazyLSPcomp]]:
                     acc = {**self._local_cached.pre}
                     self._local_cached.pre.clear()
 
                     for client, cached_items in acc.items():
                         items = (
-                            cached
-                            for item in cached_items
+                            eager(cached)
+                            for item in _decoded(cached_items)
                             if (
                                 cached := sanitize_cached(
                                     inline_shift=inline_shift,
@@ -190,7 +252,7 @@ class Worker(BaseWorker[LSPClient, None]):
                                 )
                             )
                         )
-                        yield _Src.from_stored, LSPcomp(
+                        yield _Src.from_stored, LazyLSPcomp(
                             client=client, local_cache=True, items=items
                         )
 
@@ -211,21 +273,23 @@ class Worker(BaseWorker[LSPClient, None]):
                     if lsp_comps.local_cache and src is not _Src.from_db:
                         self._local_cached.pre[lsp_comps.client] = lsp_comps.items
 
-                    for comp in lsp_comps.items:
-                        if comp.primary_edit.new_text in seen:
+                    chunk: MutableSequence[Completion] = []
+                    for lazy in lsp_comps.items:
+                        if lazy.new_text in seen:
                             continue
                         if src is _Src.from_db:
-                            seen.add(comp.primary_edit.new_text)
-                            yield comp
+                            if comp := lazy.decode():
+                                seen.add(lazy.new_text)
+                                chunk.append(comp)
+                        elif comp := _use_comp(
+                            self._supervisor.match, context=context, lazy=lazy
+                        ):
+                            # decoded once, shared with the cache
+                            acc.append(eager(comp))
+                            seen.add(lazy.new_text)
+                            chunk.append(comp)
                         else:
-                            acc.append(comp)
-                            if _use_comp(
-                                self._supervisor.match,
-                                context=context,
-                                sort_by=comp.sort_by,
-                                comp=comp,
-                            ):
-                                seen.add(comp.primary_edit.new_text)
-                                yield comp
+                            acc.append(lazy)
+                    yield chunk
             finally:
                 self._working.notify_all()
@@ -11,6 +11,7 @@ from typing import (
     Iterator,
     MutableSequence,
     MutableSet,
+    Sequence,
     Tuple,
 )
 
@@ -20,7 +21,7 @@ from std2.string import removesuffix
 
 from ...shared.context import cword_before
 from ...shared.executor import AsyncExecutor
-from ...shared.fuzzy import quick_ratio
+from ...shared.fuzzy import fuzzy_query, query_quick_ratio
 from ...shared.parse import lower
 from ...shared.runtime import Supervisor
 from ...shared.runtime import Worker as BaseWorker
@@ -152,9 +153,10 @@ def parse(
                         p = Path(lhs)
                         left = p if p.is_absolute() else base / p
                         if left.is_dir():
+                            query = fuzzy_query(lower(rhs))
                             for path in scandir(left):
-                                ratio = quick_ratio(
-                                    lower(rhs),
+                                ratio = query_quick_ratio(
+                                    query,
                                     lower(path.name),
                                     look_ahead=look_ahead,
                                 )
@@ -232,7 +234,9 @@ class Worker(BaseWorker[PathsClient, None]):
     def interrupt(self) -> None:
         pass
 
-    async def _work(self, context: Context, timeout: float) -> AsyncIterator[Completion]:
+    async def _work(
+        self, context: Context, timeout: float
+    ) -> AsyncIterator[Sequence[Completion]]:
         async with self._work_lock:
             line = context.line_before + context.words_after
 
@@ -264,6 +268,7 @@ class Worker(BaseWorker[PathsClient, None]):
             seen: MutableSet[str] = set()
 
             for co in as_completed(aw):
+                completions: MutableSequence[Completion] = []
                 for path, is_dir, new_text in await co:
                     if len(seen) >= limit:
                         break
@@ -285,4 +290,5 @@ class Worker(BaseWorker[PathsClient, None]):
                             extern=ExternPath(is_dir=is_dir, path=path),
                             icon_match="Folder" if new_text.endswith(sep) else "File",
                         )
-                        yield completion
+                        completions.append(completion)
+                yield completions
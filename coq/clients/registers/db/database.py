@@ -4,8 +4,10 @@ from sqlite3 import Connection, Cursor, OperationalError
 from typing import AbstractSet, Any, Iterator, Mapping
 
 from ....consts import REGISTER_DB
+from ....databases.index.database import attach, hits
 from ....databases.types import DB
-from ....shared.parse import coalesce, tokenize
+from ....shared.parse import coalesce
+from ....shared.processes import Processes
 from ....shared.settings import MatchOptions
 from ....shared.sql import init_db, like_esc
 from .sql import sql
@@ -30,14 +32,18 @@ def _init() -> Connection:
 class RDB(DB):
     def __init__(
         self,
+        processes: Processes,
         tokenization_limit: int,
         unifying_chars: AbstractSet[str],
         include_syms: bool,
+        match: MatchOptions,
     ) -> None:
+        self._processes = processes
         self._tokenization_limit = tokenization_limit
         self._unifying_chars = unifying_chars
         self._include_syms = include_syms
         self._conn = _init()
+        self._index = attach(self._conn, opts=match, triggers=sql("create", "index"))
 
     def periodical(
         self,
@@ -46,14 +52,16 @@ class RDB(DB):
     ) -> None:
         m1 = (*wordreg, *linereg)
 
+        tokens = self._processes.tokenize(
+            self._tokenization_limit,
+            unifying_chars=self._unifying_chars,
+            include_syms=self._include_syms,
+            texts=tuple(wordreg.values()),
+        )
+
         def m2() -> Iterator[Mapping]:
-            for reg, text in wordreg.items():
-                for word in tokenize(
-                    self._tokenization_limit,
-                    unifying_chars=self._unifying_chars,
-                    include_syms=self._include_syms,
-                    text=text,
-                ):
+            for reg, words in zip(wordreg, tokens):
+                for word in words:
                     yield {"register": reg, "word": word}
 
         def m3() -> Iterator[Mapping]:
@@ -89,10 +97,14 @@ class RDB(DB):
         limit: int,
     ) -> Iterator[RegWord]:
         def fetch(
-            cursor: Cursor, match_syms: bool, stmt: str, linewise: bool
+            cursor: Cursor,
+            params: Mapping[str, str],
+            match_syms: bool,
+            stmt: str,
+            linewise: bool,
         ) -> Iterator[Any]:
             cursor.execute(
-                sql("select", stmt),
+                sql("select", f"{stmt}_hits" if self._index else stmt),
                 {
                     "cut_off": opts.fuzzy_cutoff,
                     "look_ahead": opts.look_ahead,
@@ -101,6 +113,7 @@ class RDB(DB):
                     "sym": (sym if match_syms else ""),
                     "like_word": like_esc(word[: opts.exact_matches]),
                     "like_sym": like_esc(sym[: opts.exact_matches]),
+                    **params,
                 },
             )
             for row in cursor:
@@ -113,11 +126,24 @@ class RDB(DB):
 
         with suppress(OperationalError):
             with self._conn, closing(self._conn.cursor()) as cursor:
-                yield from (
-                    fetch(cursor, match_syms=True, stmt="lines", linewise=True)
-                    if linewise
-                    else ()
-                )
-                yield from fetch(
-                    cursor, match_syms=match_syms, stmt="words", linewise=False
-                )
+                with hits(
+                    cursor, index=self._index, opts=opts, word=word, sym=sym
+                ) as params:
+                    yield from (
+                        fetch(
+                            cursor,
+                            params=params,
+                            match_syms=True,
+                            stmt="lines",
+                            linewise=True,
+                        )
+                        if linewise
+                        else ()
+                    )
+                    yield from fetch(
+                        cursor,
+                        params=params,
+                        match_syms=match_syms,
+                        stmt="words",
+                        linewise=False,
+                    )
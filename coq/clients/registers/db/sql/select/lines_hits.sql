@@ -0,0 +1,27 @@
+SELECT
+  lines.register,
+  lines.word,
+  lines.line AS text
+FROM json_each(:hits) AS hits
+JOIN lines
+ON
+  lines.lword = hits.value
+WHERE
+  (
+    :word <> ''
+    AND
+    lines.lword IN (SELECT value FROM json_each(:word_hits))
+    AND
+    LENGTH(lines.word) + :look_ahead >= LENGTH(:word)
+  )
+  OR
+  (
+    :sym <> ''
+    AND
+    lines.lword IN (SELECT value FROM json_each(:sym_hits))
+    AND
+    LENGTH(lines.word) + :look_ahead >= LENGTH(:sym)
+  )
+ORDER BY
+  hits.key
+LIMIT :limit
@@ -0,0 +1,31 @@
+SELECT
+  words.register,
+  words.word,
+  words.word AS text
+FROM json_each(:hits) AS hits
+JOIN words
+ON
+  words.lword = hits.value
+WHERE
+  (
+    :word <> ''
+    AND
+    words.lword IN (SELECT value FROM json_each(:word_hits))
+    AND
+    LENGTH(words.word) + :look_ahead >= LENGTH(:word)
+    AND
+    words.word <> SUBSTR(:word, 1, LENGTH(words.word))
+  )
+  OR
+  (
+    :sym <> ''
+    AND
+    words.lword IN (SELECT value FROM json_each(:sym_hits))
+    AND
+    LENGTH(words.word) + :look_ahead >= LENGTH(:sym)
+    AND
+    words.word <> SUBSTR(:sym, 1, LENGTH(words.word))
+  )
+ORDER BY
+  hits.key
+LIMIT :limit
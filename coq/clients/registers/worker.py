@@ -1,4 +1,11 @@
-from typing import AbstractSet, AsyncIterator, Mapping, MutableSet
+from typing import (
+    AbstractSet,
+    AsyncIterator,
+    Iterator,
+    Mapping,
+    MutableSet,
+    Sequence,
+)
 
 from pynvim_pp.atomic import Atomic
 from pynvim_pp.logging import suppress_and_log
@@ -33,9 +40,11 @@ class Worker(BaseWorker[RegistersClient, None]):
     ) -> None:
         self._yanked: MutableSet[str] = {*options.words, *options.lines}
         self._db = RDB(
-            supervisor.limits.tokenization_limit,
+            supervisor.processes,
+            tokenization_limit=supervisor.limits.tokenization_limit,
             unifying_chars=supervisor.match.unifying_chars,
             include_syms=options.match_syms,
+            match=supervisor.match,
         )
         super().__init__(
             ex,
@@ -86,7 +95,9 @@ class Worker(BaseWorker[RegistersClient, None]):
 
         await self._ex.submit(cont())
 
-    async def _work(self, context: Context, timeout: float) -> AsyncIterator[Completion]:
+    async def _work(
+        self, context: Context, timeout: float
+    ) -> AsyncIterator[Sequence[Completion]]:
         limit = (
             BIGGEST_INT
             if context.manual
@@ -103,26 +114,30 @@ class Worker(BaseWorker[RegistersClient, None]):
                 sym=context.syms,
                 limit=limit,
             )
-            for word in words:
-                edit = (
-                    SnippetEdit(new_text=word.text, grammar=SnippetGrammar.lit)
-                    if word.linewise
-                    else Edit(new_text=word.text)
-                )
-                docline = f"{self._options.short_name}{self._options.register_scope}{word.regname}"
-                doc = Doc(
-                    text=docline,
-                    syntax="",
-                )
-                cmp = Completion(
-                    source=self._options.short_name,
-                    always_on_top=self._options.always_on_top,
-                    weight_adjust=self._options.weight_adjust,
-                    label=edit.new_text,
-                    sort_by=word.match,
-                    primary_edit=edit,
-                    adjust_indent=False,
-                    doc=doc,
-                    icon_match="Text",
-                )
-                yield cmp
+
+            def cont() -> Iterator[Completion]:
+                for word in words:
+                    edit = (
+                        SnippetEdit(new_text=word.text, grammar=SnippetGrammar.lit)
+                        if word.linewise
+                        else Edit(new_text=word.text)
+                    )
+                    docline = f"{self._options.short_name}{self._options.register_scope}{word.regname}"
+                    doc = Doc(
+                        text=docline,
+                        syntax="",
+                    )
+                    cmp = Completion(
+                        source=self._options.short_name,
+                        always_on_top=self._options.always_on_top,
+                        weight_adjust=self._options.weight_adjust,
+                        label=edit.new_text,
+                        sort_by=word.match,
+                        primary_edit=edit,
+                        adjust_indent=False,
+                        doc=doc,
+                        icon_match="Text",
+                    )
+                    yield cmp
+
+            yield tuple(cont())
@@ -5,6 +5,7 @@ from sqlite3 import Connection, OperationalError
 from typing import AbstractSet, Iterator, Mapping, TypedDict, cast
 from uuid import uuid4
 
+from ....databases.index.database import attach, hits
 from ....databases.types import DB
 from ....shared.settings import MatchOptions
 from ....shared.sql import BIGGEST_INT, init_db, like_esc
@@ -33,9 +34,10 @@ def _init(db_dir: Path) -> Connection:
 
 
 class SDB(DB):
-    def __init__(self, vars_dir: Path) -> None:
+    def __init__(self, vars_dir: Path, match: MatchOptions) -> None:
         db_dir = vars_dir / "clients" / "snippets"
         self._conn = _init(db_dir)
+        self._index = attach(self._conn, opts=match, triggers=sql("create", "index"))
 
     def clean(self, paths: AbstractSet[PurePath]) -> None:
         with self._conn, closing(self._conn.cursor()) as cursor:
@@ -100,18 +102,22 @@ class SDB(DB):
     ) -> Iterator[_Snip]:
         with suppress(OperationalError):
             with self._conn, closing(self._conn.cursor()) as cursor:
-                cursor.execute(
-                    sql("select", "snippets"),
-                    {
-                        "cut_off": opts.fuzzy_cutoff,
-                        "look_ahead": opts.look_ahead,
-                        "limit": limit,
-                        "filetype": filetype,
-                        "word": word,
-                        "sym": sym,
-                        "like_word": like_esc(word[: opts.exact_matches]),
-                        "like_sym": like_esc(sym[: opts.exact_matches]),
-                    },
-                )
-                for row in cursor:
-                    yield cast(_Snip, row)
+                with hits(
+                    cursor, index=self._index, opts=opts, word=word, sym=sym
+                ) as params:
+                    cursor.execute(
+                        sql("select", "snippets_hits" if self._index else "snippets"),
+                        {
+                            "cut_off": opts.fuzzy_cutoff,
+                            "look_ahead": opts.look_ahead,
+                            "limit": limit,
+                            "filetype": filetype,
+                            "word": word,
+                            "sym": sym,
+                            "like_word": like_esc(word[: opts.exact_matches]),
+                            "like_sym": like_esc(sym[: opts.exact_matches]),
+                            **params,
+                        },
+                    )
+                    for row in cursor:
+                        yield cast(_Snip, row)
@@ -0,0 +1,35 @@
+BEGIN;
+
+
+CREATE TEMP TRIGGER IF NOT EXISTS matches_index_insert
+AFTER INSERT ON main.matches
+BEGIN
+  INSERT INTO word_index_log (lword, delta)
+  VALUES                     (NEW.lword, 1)
+  ON CONFLICT (lword) DO UPDATE SET delta = delta + 1;
+END;
+
+
+CREATE TEMP TRIGGER IF NOT EXISTS matches_index_delete
+AFTER DELETE ON main.matches
+BEGIN
+  INSERT INTO word_index_log (lword, delta)
+  VALUES                     (OLD.lword, -1)
+  ON CONFLICT (lword) DO UPDATE SET delta = delta - 1;
+END;
+
+
+INSERT INTO word_index_log (lword, delta)
+SELECT
+  lword,
+  COUNT(*)
+FROM (
+  SELECT
+    lword
+  FROM main.matches
+)
+GROUP BY
+  lword;
+
+
+END;
@@ -0,0 +1,35 @@
+SELECT
+  snippets_view.grammar,
+  snippets_view.word,
+  snippets_view.snippet,
+  snippets_view.label,
+  snippets_view.doc
+FROM json_each(:hits) AS hits
+JOIN snippets_view
+ON
+  snippets_view.lword = hits.value
+WHERE
+  snippets_view.ft_src IN (:filetype, '*', '_')
+  AND
+  (
+    (
+      :word <> ''
+      AND
+      snippets_view.lword IN (SELECT value FROM json_each(:word_hits))
+      AND
+      LENGTH(snippets_view.word) + :look_ahead >= LENGTH(:word)
+    )
+    OR
+    (
+      :sym <> ''
+      AND
+      snippets_view.lword IN (SELECT value FROM json_each(:sym_hits))
+      AND
+      LENGTH(snippets_view.word) + :look_ahead >= LENGTH(:sym)
+    )
+  )
+GROUP BY
+  snippets_view.snippet_id
+ORDER BY
+  MIN(hits.key)
+LIMIT :limit
@@ -1,5 +1,5 @@
 from pathlib import Path, PurePath
-from typing import AbstractSet, AsyncIterator, Mapping
+from typing import AbstractSet, AsyncIterator, Iterator, Mapping, Sequence
 
 from ...shared.executor import AsyncExecutor
 from ...shared.runtime import Supervisor
@@ -20,7 +20,7 @@ class Worker(BaseWorker[SnippetClient, Path]):
         options: SnippetClient,
         misc: Path,
     ) -> None:
-        self._db = SDB(misc)
+        self._db = SDB(misc, match=supervisor.match)
         super().__init__(
             ex,
             supervisor=supervisor,
@@ -54,7 +54,9 @@ class Worker(BaseWorker[SnippetClient, Path]):
 
         await self._ex.submit(cont())
 
-    async def _work(self, context: Context, timeout: float) -> AsyncIterator[Completion]:
+    async def _work(
+        self, context: Context, timeout: float
+    ) -> AsyncIterator[Sequence[Completion]]:
         limit = (
             BIGGEST_INT
             if context.manual
@@ -70,24 +72,31 @@ class Worker(BaseWorker[SnippetClient, Path]):
                 limit=limit,
             )
 
-            for snip in snippets:
-                edit = SnippetEdit(
-                    new_text=snip["snippet"],
-                    grammar=SnippetGrammar[snip["grammar"]],
-                )
-                label_line, *_ = (snip["label"] or edit.new_text or " ").splitlines()
-                label = label_line.strip().expandtabs(context.tabstop)
-                doc = Doc(text=snip["doc"] or edit.new_text, syntax=context.filetype)
-                completion = Completion(
-                    source=self._options.short_name,
-                    always_on_top=self._options.always_on_top,
-                    weight_adjust=self._options.weight_adjust,
-                    primary_edit=edit,
-                    adjust_indent=True,
-                    sort_by=snip["word"],
-                    label=label,
-                    doc=doc,
-                    kind=snip["word"],
-                    icon_match="Snippet",
-                )
-                yield completion
+            def cont() -> Iterator[Completion]:
+                for snip in snippets:
+                    edit = SnippetEdit(
+                        new_text=snip["snippet"],
+                        grammar=SnippetGrammar[snip["grammar"]],
+                    )
+                    label_line, *_ = (
+                        snip["label"] or edit.new_text or " "
+                    ).splitlines()
+                    label = label_line.strip().expandtabs(context.tabstop)
+                    doc = Doc(
+                        text=snip["doc"] or edit.new_text, syntax=context.filetype
+                    )
+                    completion = Completion(
+                        source=self._options.short_name,
+                        always_on_top=self._options.always_on_top,
+                        weight_adjust=self._options.weight_adjust,
+                        primary_edit=edit,
+                        adjust_indent=True,
+                        sort_by=snip["word"],
+                        label=label,
+                        doc=doc,
+                        kind=snip["word"],
+                        icon_match="Snippet",
+                    )
+                    yield completion
+
+            yield tuple(cont())
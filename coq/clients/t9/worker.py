@@ -273,7 +273,9 @@ class Worker(BaseWorker[T9Client, None]):
         else:
             return await shield(cont())
 
-    async def _work(self, context: Context, timeout: float) -> AsyncIterator[Completion]:
+    async def _work(
+        self, context: Context, timeout: float
+    ) -> AsyncIterator[Sequence[Completion]]:
         limit = (
             BIGGEST_INT
             if context.manual
@@ -302,12 +304,13 @@ class Worker(BaseWorker[T9Client, None]):
                             self._t9_locked = resp.get("is_locked", False)
 
                         pc = await protocol()
-                        for comp in _decode(
-                            pc,
-                            client=self._options,
-                            ellipsis=self._supervisor.display.pum.ellipsis,
-                            syntax=context.filetype,
-                            id=id,
-                            reply=cast(Response, resp),
-                        ):
-                            yield comp
+                        yield tuple(
+                            _decode(
+                                pc,
+                                client=self._options,
+                                ellipsis=self._supervisor.display.pum.ellipsis,
+                                syntax=context.filetype,
+                                id=id,
+                                reply=cast(Response, resp),
+                            )
+                        )
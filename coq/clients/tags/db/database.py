@@ -7,6 +7,7 @@ from typing import AbstractSet, Iterator, Mapping, cast
 
 from pynvim_pp.lib import encode
 
+from ....databases.index.database import attach, hits
 from ....databases.types import DB
 from ....shared.settings import MatchOptions
 from ....shared.sql import init_db, like_esc
@@ -42,13 +43,18 @@ def _init(db_dir: Path, cwd: PurePath) -> Connection:
 
 
 class CTDB(DB):
-    def __init__(self, vars_dir: Path, cwd: PurePath) -> None:
+    def __init__(self, vars_dir: Path, cwd: PurePath, match: MatchOptions) -> None:
         self._vars_dir = vars_dir / "clients" / "tags"
+        self._match = match
         self._conn = _init(self._vars_dir, cwd=cwd)
+        self._index = attach(self._conn, opts=match, triggers=sql("create", "index"))
 
     def swap(self, cwd: PurePath) -> None:
         self._conn.close()
         self._conn = _init(self._vars_dir, cwd=cwd)
+        self._index = attach(
+            self._conn, opts=self._match, triggers=sql("create", "index")
+        )
 
     def paths(self) -> Mapping[str, float]:
         with suppress(OperationalError):
@@ -94,19 +100,23 @@ class CTDB(DB):
     ) -> Iterator[Tag]:
         with suppress(OperationalError):
             with self._conn, closing(self._conn.cursor()) as cursor:
-                cursor.execute(
-                    sql("select", "tags"),
-                    {
-                        "cut_off": opts.fuzzy_cutoff,
-                        "look_ahead": opts.look_ahead,
-                        "limit": limit,
-                        "filename": filename,
-                        "line_num": line_num,
-                        "word": word,
-                        "sym": sym,
-                        "like_word": like_esc(word[: opts.exact_matches]),
-                        "like_sym": like_esc(sym[: opts.exact_matches]),
-                    },
-                )
-                for row in cursor:
-                    yield cast(Tag, {**row})
+                with hits(
+                    cursor, index=self._index, opts=opts, word=word, sym=sym
+                ) as params:
+                    cursor.execute(
+                        sql("select", "tags_hits" if self._index else "tags"),
+                        {
+                            "cut_off": opts.fuzzy_cutoff,
+                            "look_ahead": opts.look_ahead,
+                            "limit": limit,
+                            "filename": filename,
+                            "line_num": line_num,
+                            "word": word,
+                            "sym": sym,
+                            "like_word": like_esc(word[: opts.exact_matches]),
+                            "like_sym": like_esc(sym[: opts.exact_matches]),
+                            **params,
+                        },
+                    )
+                    for row in cursor:
+                        yield cast(Tag, {**row})
@@ -0,0 +1,35 @@
+BEGIN;
+
+
+CREATE TEMP TRIGGER IF NOT EXISTS tags_index_insert
+AFTER INSERT ON main.tags
+BEGIN
+  INSERT INTO word_index_log (lword, delta)
+  VALUES                     (NEW.lname, 1)
+  ON CONFLICT (lword) DO UPDATE SET delta = delta + 1;
+END;
+
+
+CREATE TEMP TRIGGER IF NOT EXISTS tags_index_delete
+AFTER DELETE ON main.tags
+BEGIN
+  INSERT INTO word_index_log (lword, delta)
+  VALUES                     (OLD.lname, -1)
+  ON CONFLICT (lword) DO UPDATE SET delta = delta - 1;
+END;
+
+
+INSERT INTO word_index_log (lword, delta)
+SELECT
+  lword,
+  COUNT(*)
+FROM (
+  SELECT
+    lname AS lword
+  FROM main.tags
+)
+GROUP BY
+  lword;
+
+
+END;
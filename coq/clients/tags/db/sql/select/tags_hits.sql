@@ -0,0 +1,55 @@
+WITH fts AS (
+  SELECT
+    filetype
+  FROM files
+  WHERE
+    filename = :filename
+)
+SELECT
+  tags.`path`,
+  tags.line,
+  tags.kind,
+  tags.name,
+  tags.lname,
+  tags.pattern,
+  tags.typeref,
+  tags.scope,
+  tags.scopeKind,
+  tags.`access`
+FROM json_each(:hits) AS hits
+JOIN tags
+ON
+  tags.lname = hits.value
+JOIN files
+ON
+  files.filename = tags.`path`
+JOIN fts
+ON
+  fts.filetype = files.filetype
+WHERE
+  tags.name <> ''
+  AND
+  (
+    (
+      :word <> ''
+      AND
+      tags.lname IN (SELECT value FROM json_each(:word_hits))
+      AND
+      LENGTH(tags.name) + :look_ahead >= LENGTH(:word)
+      AND
+      tags.name <> SUBSTR(:word, 1, LENGTH(tags.name))
+    )
+    OR
+    (
+      :sym <> ''
+      AND
+      tags.lname IN (SELECT value FROM json_each(:sym_hits))
+      AND
+      LENGTH(tags.name) + :look_ahead >= LENGTH(:sym)
+      AND
+      tags.name <> SUBSTR(:sym, 1, LENGTH(tags.name))
+    )
+  )
+ORDER BY
+  hits.key
+LIMIT :limit
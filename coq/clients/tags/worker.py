@@ -10,6 +10,7 @@ from typing import (
     Iterator,
     Mapping,
     MutableSet,
+    Sequence,
     Tuple,
 )
 
@@ -141,7 +142,7 @@ class Worker(BaseWorker[TagsClient, Tuple[Path, Path, PurePath]]):
         misc: Tuple[Path, Path, PurePath],
     ) -> None:
         self._exec, vars_dir, cwd = misc
-        self._db = CTDB(vars_dir, cwd=cwd)
+        self._db = CTDB(vars_dir, cwd=cwd, match=supervisor.match)
         super().__init__(
             ex,
             supervisor=supervisor,
@@ -185,7 +186,9 @@ class Worker(BaseWorker[TagsClient, Tuple[Path, Path, PurePath]]):
 
         await self._ex.submit(cont())
 
-    async def _work(self, context: Context, timeout: float) -> AsyncIterator[Completion]:
+    async def _work(
+        self, context: Context, timeout: float
+    ) -> AsyncIterator[Sequence[Completion]]:
         limit = (
             BIGGEST_INT
             if context.manual
@@ -203,22 +206,26 @@ class Worker(BaseWorker[TagsClient, Tuple[Path, Path, PurePath]]):
             )
 
             seen: MutableSet[str] = set()
-            for tag in tags:
-                name = tag["name"]
-                if name not in seen:
-                    seen.add(name)
-                    edit = Edit(new_text=name)
-                    kind = capwords(tag["kind"])
-                    cmp = Completion(
-                        source=self._options.short_name,
-                        always_on_top=self._options.always_on_top,
-                        weight_adjust=self._options.weight_adjust,
-                        label=edit.new_text,
-                        sort_by=name,
-                        primary_edit=edit,
-                        adjust_indent=False,
-                        kind=kind,
-                        doc=_doc(self._options, context=context, tag=tag),
-                        icon_match=kind,
-                    )
-                    yield cmp
+
+            def cont() -> Iterator[Completion]:
+                for tag in tags:
+                    name = tag["name"]
+                    if name not in seen:
+                        seen.add(name)
+                        edit = Edit(new_text=name)
+                        kind = capwords(tag["kind"])
+                        cmp = Completion(
+                            source=self._options.short_name,
+                            always_on_top=self._options.always_on_top,
+                            weight_adjust=self._options.weight_adjust,
+                            label=edit.new_text,
+                            sort_by=name,
+                            primary_edit=edit,
+                            adjust_indent=False,
+                            kind=kind,
+                            doc=_doc(self._options, context=context, tag=tag),
+                            icon_match=kind,
+                        )
+                        yield cmp
+
+            yield tuple(cont())
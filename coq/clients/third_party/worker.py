@@ -1,14 +1,21 @@
-from typing import AsyncIterator
+from typing import AsyncIterator, Optional
 
+from ...lsp.parse import eager
 from ...lsp.requests.completion import comp_thirdparty
-from ...lsp.types import LSPcomp
+from ...lsp.types import LazyLSPcomp
 from ...shared.types import Context
 from ..lsp.worker import Worker as LSPWorker
 
 
 class Worker(LSPWorker):
-    def _request(self, context: Context) -> AsyncIterator[LSPcomp]:
-        return comp_thirdparty(
+    async def _request(
+        self, context: Context, deadline: Optional[float], prefilter: bool
+    ) -> AsyncIterator[LazyLSPcomp]:
+        """
+        Third party sources answer in full, there is nothing left to defer
+        """
+
+        rows = comp_thirdparty(
             short_name=self._options.short_name,
             always_on_top=self._options.always_on_top,
             weight_adjust=self._options.weight_adjust,
@@ -16,3 +23,9 @@ class Worker(LSPWorker):
             chunk=self._max_results * 2,
             clients=set(),
         )
+        async for row in rows:
+            yield LazyLSPcomp(
+                client=row.client,
+                local_cache=row.local_cache,
+                items=map(eager, row.items),
+            )
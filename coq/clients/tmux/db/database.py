@@ -4,8 +4,9 @@ from sqlite3 import Connection, OperationalError
 from typing import AbstractSet, Iterator, Mapping, MutableMapping, Optional
 
 from ....consts import TMUX_DB
+from ....databases.index.database import attach, hits
 from ....databases.types import DB
-from ....shared.parse import tokenize
+from ....shared.processes import Processes
 from ....shared.settings import MatchOptions
 from ....shared.sql import init_db, like_esc
 from ....tmux.parse import Pane
@@ -33,16 +34,20 @@ def _init() -> Connection:
 class TMDB(DB):
     def __init__(
         self,
+        processes: Processes,
         tokenization_limit: int,
         unifying_chars: AbstractSet[str],
         include_syms: bool,
+        match: MatchOptions,
     ) -> None:
         self._current: Optional[Pane] = None
+        self._processes = processes
         self._tokenization_limit = tokenization_limit
         self._unifying_chars = unifying_chars
         self._include_syms = include_syms
         self._cache: MutableMapping[str, str] = {}
         self._conn = _init()
+        self._index = attach(self._conn, opts=match, triggers=sql("create", "index"))
 
     def periodical(self, current: Optional[Pane], panes: Mapping[Pane, str]) -> None:
         self._current = current
@@ -73,14 +78,16 @@ class TMDB(DB):
                     "pane_title": pane.pane_title,
                 }
 
+        tokens = self._processes.tokenize(
+            self._tokenization_limit,
+            unifying_chars=self._unifying_chars,
+            include_syms=self._include_syms,
+            texts=tuple(not_cached.values()),
+        )
+
         def m3() -> Iterator[Mapping]:
-            for pane, text in not_cached.items():
-                for word in tokenize(
-                    self._tokenization_limit,
-                    unifying_chars=self._unifying_chars,
-                    include_syms=self._include_syms,
-                    text=text,
-                ):
+            for (pane, text), words in zip(not_cached.items(), tokens):
+                for word in words:
                     yield {
                         "pane_id": pane.uid,
                         "word": word,
@@ -103,25 +110,29 @@ class TMDB(DB):
     ) -> Iterator[TmuxWord]:
         with suppress(OperationalError):
             with self._conn, closing(self._conn.cursor()) as cursor:
-                cursor.execute(
-                    sql("select", "words"),
-                    {
-                        "cut_off": opts.fuzzy_cutoff,
-                        "look_ahead": opts.look_ahead,
-                        "limit": limit,
-                        "pane_id": self._current.uid if self._current else None,
-                        "word": word,
-                        "sym": sym,
-                        "like_word": like_esc(word[: opts.exact_matches]),
-                        "like_sym": like_esc(sym[: opts.exact_matches]),
-                    },
-                )
-                for row in cursor:
-                    yield TmuxWord(
-                        text=row["word"],
-                        session_name=row["session_name"],
-                        window_index=row["window_index"],
-                        window_name=row["window_name"],
-                        pane_index=row["pane_index"],
-                        pane_title=row["pane_title"],
+                with hits(
+                    cursor, index=self._index, opts=opts, word=word, sym=sym
+                ) as params:
+                    cursor.execute(
+                        sql("select", "words_hits" if self._index else "words"),
+                        {
+                            "cut_off": opts.fuzzy_cutoff,
+                            "look_ahead": opts.look_ahead,
+                            "limit": limit,
+                            "pane_id": self._current.uid if self._current else None,
+                            "word": word,
+                            "sym": sym,
+                            "like_word": like_esc(word[: opts.exact_matches]),
+                            "like_sym": like_esc(sym[: opts.exact_matches]),
+                            **params,
+                        },
                     )
+                    for row in cursor:
+                        yield TmuxWord(
+                            text=row["word"],
+                            session_name=row["session_name"],
+                            window_index=row["window_index"],
+                            window_name=row["window_name"],
+                            pane_index=row["pane_index"],
+                            pane_title=row["pane_title"],
+                        )
@@ -0,0 +1,45 @@
+SELECT
+  words.word,
+  panes.session_name,
+  panes.window_index,
+  panes.window_name,
+  panes.pane_index,
+  panes.pane_title
+FROM json_each(:hits) AS hits
+JOIN words
+ON
+  words.lword = hits.value
+JOIN panes
+ON
+  panes.pane_id = words.pane_id
+WHERE
+  words.word <> ''
+  AND
+  panes.pane_id <> :pane_id
+  AND
+  (
+    (
+      :word <> ''
+      AND
+      words.lword IN (SELECT value FROM json_each(:word_hits))
+      AND
+      LENGTH(words.word) + :look_ahead >= LENGTH(:word)
+      AND
+      words.word <> SUBSTR(:word, 1, LENGTH(words.word))
+    )
+    OR
+    (
+      :sym <> ''
+      AND
+      words.lword IN (SELECT value FROM json_each(:sym_hits))
+      AND
+      LENGTH(words.word) + :look_ahead >= LENGTH(:sym)
+      AND
+      words.word <> SUBSTR(:sym, 1, LENGTH(words.word))
+    )
+  )
+GROUP BY
+  words.word
+ORDER BY
+  MIN(hits.key)
+LIMIT :limit
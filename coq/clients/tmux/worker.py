@@ -1,7 +1,7 @@
 from asyncio import Lock
 from os import linesep
 from pathlib import Path
-from typing import AsyncIterator, Iterator
+from typing import AsyncIterator, Iterator, Sequence
 
 from pynvim_pp.logging import suppress_and_log
 
@@ -38,9 +38,11 @@ class Worker(BaseWorker[TmuxClient, Path]):
         self._exec = misc
         self._lock = Lock()
         self._db = TMDB(
-            supervisor.limits.tokenization_limit,
+            supervisor.processes,
+            tokenization_limit=supervisor.limits.tokenization_limit,
             unifying_chars=supervisor.match.unifying_chars,
             include_syms=options.match_syms,
+            match=supervisor.match,
         )
         super().__init__(
             ex,
@@ -77,7 +79,9 @@ class Worker(BaseWorker[TmuxClient, Path]):
     async def periodical(self) -> None:
         await self._ex.submit(self._periodical())
 
-    async def _work(self, context: Context, timeout: float) -> AsyncIterator[Completion]:
+    async def _work(
+        self, context: Context, timeout: float
+    ) -> AsyncIterator[Sequence[Completion]]:
         limit = (
             BIGGEST_INT
             if context.manual
@@ -91,17 +95,20 @@ class Worker(BaseWorker[TmuxClient, Path]):
                 limit=limit,
             )
 
-            for word in words:
-                edit = Edit(new_text=word.text)
-                cmp = Completion(
-                    source=self._options.short_name,
-                    always_on_top=self._options.always_on_top,
-                    weight_adjust=self._options.weight_adjust,
-                    label=edit.new_text,
-                    sort_by=word.text,
-                    primary_edit=edit,
-                    adjust_indent=False,
-                    doc=_doc(self._options, word=word),
-                    icon_match="Text",
-                )
-                yield cmp
+            def cont() -> Iterator[Completion]:
+                for word in words:
+                    edit = Edit(new_text=word.text)
+                    cmp = Completion(
+                        source=self._options.short_name,
+                        always_on_top=self._options.always_on_top,
+                        weight_adjust=self._options.weight_adjust,
+                        label=edit.new_text,
+                        sort_by=word.text,
+                        primary_edit=edit,
+                        adjust_indent=False,
+                        doc=_doc(self._options, word=word),
+                        icon_match="Text",
+                    )
+                    yield cmp
+
+            yield tuple(cont())
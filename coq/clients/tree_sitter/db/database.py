@@ -3,6 +3,7 @@ from sqlite3 import Connection, Cursor, OperationalError
 from typing import Iterable, Iterator, Mapping
 
 from ....consts import TREESITTER_DB
+from ....databases.index.database import attach, hits
 from ....databases.types import DB
 from ....shared.settings import MatchOptions
 from ....shared.sql import init_db, like_esc
@@ -32,8 +33,9 @@ def _ensure_buffer(cursor: Cursor, buf_id: int, filetype: str, filename: str) ->
 
 
 class TDB(DB):
-    def __init__(self) -> None:
+    def __init__(self, match: MatchOptions) -> None:
         self._conn = _init()
+        self._index = attach(self._conn, opts=match, triggers=sql("create", "index"))
 
     def vacuum(self, live_bufs: Mapping[int, int]) -> None:
         with suppress(OperationalError):
@@ -100,37 +102,41 @@ class TDB(DB):
     ) -> Iterator[Payload]:
         with suppress(OperationalError):
             with self._conn, closing(self._conn.cursor()) as cursor:
-                cursor.execute(
-                    sql("select", "words"),
-                    {
-                        "cut_off": opts.fuzzy_cutoff,
-                        "look_ahead": opts.look_ahead,
-                        "limit": limit,
-                        "filetype": filetype,
-                        "word": word,
-                        "sym": sym,
-                        "like_word": like_esc(word[: opts.exact_matches]),
-                        "like_sym": like_esc(sym[: opts.exact_matches]),
-                    },
-                )
-
-                for row in cursor:
-                    range = row["lo"], row["hi"]
-                    grandparent = (
-                        SimplePayload(text=row["gpword"], kind=row["gpkind"])
-                        if row["gpword"] and row["gpkind"]
-                        else None
-                    )
-                    parent = (
-                        SimplePayload(text=row["pword"], kind=row["pkind"])
-                        if row["pword"] and row["pkind"]
-                        else None
-                    )
-                    yield Payload(
-                        filename=row["filename"],
-                        range=range,
-                        text=row["word"],
-                        kind=row["kind"],
-                        parent=parent,
-                        grandparent=grandparent,
+                with hits(
+                    cursor, index=self._index, opts=opts, word=word, sym=sym
+                ) as params:
+                    cursor.execute(
+                        sql("select", "words_hits" if self._index else "words"),
+                        {
+                            "cut_off": opts.fuzzy_cutoff,
+                            "look_ahead": opts.look_ahead,
+                            "limit": limit,
+                            "filetype": filetype,
+                            "word": word,
+                            "sym": sym,
+                            "like_word": like_esc(word[: opts.exact_matches]),
+                            "like_sym": like_esc(sym[: opts.exact_matches]),
+                            **params,
+                        },
                     )
+
+                    for row in cursor:
+                        range = row["lo"], row["hi"]
+                        grandparent = (
+                            SimplePayload(text=row["gpword"], kind=row["gpkind"])
+                            if row["gpword"] and row["gpkind"]
+                            else None
+                        )
+                        parent = (
+                            SimplePayload(text=row["pword"], kind=row["pkind"])
+                            if row["pword"] and row["pkind"]
+                            else None
+                        )
+                        yield Payload(
+                            filename=row["filename"],
+                            range=range,
+                            text=row["word"],
+                            kind=row["kind"],
+                            parent=parent,
+                            grandparent=grandparent,
+                        )
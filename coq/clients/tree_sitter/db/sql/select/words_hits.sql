@@ -0,0 +1,48 @@
+SELECT
+  words.word,
+  words.lo + 1 AS lo,
+  words.hi + 1 AS hi,
+  words.kind,
+  words.pword,
+  words.pkind,
+  words.gpword,
+  words.gpkind,
+  buffers.filename
+FROM json_each(:hits) AS hits
+JOIN words
+ON
+  words.lword = hits.value
+JOIN buffers
+ON
+  buffers.rowid = words.buffer_id
+WHERE
+  words.word <> ''
+  AND
+  buffers.filetype = :filetype
+  AND
+  (
+    (
+      :word <> ''
+      AND
+      words.lword IN (SELECT value FROM json_each(:word_hits))
+      AND
+      LENGTH(words.word) + :look_ahead >= LENGTH(:word)
+      AND
+      words.word <> SUBSTR(:word, 1, LENGTH(words.word))
+    )
+    OR
+    (
+      :sym <> ''
+      AND
+      words.lword IN (SELECT value FROM json_each(:sym_hits))
+      AND
+      LENGTH(words.word) + :look_ahead >= LENGTH(:sym)
+      AND
+      words.word <> SUBSTR(:sym, 1, LENGTH(words.word))
+    )
+  )
+GROUP BY
+  words.word
+ORDER BY
+  MIN(hits.key)
+LIMIT :limit
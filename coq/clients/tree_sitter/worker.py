@@ -1,7 +1,7 @@
 from asyncio import Lock, gather
 from os import linesep
 from pathlib import PurePath
-from typing import AsyncIterator, Iterator, Mapping, Optional, Tuple
+from typing import AsyncIterator, Iterator, Mapping, Optional, Sequence, Tuple
 
 from pynvim_pp.atomic import Atomic
 from pynvim_pp.buffer import Buffer
@@ -109,7 +109,7 @@ class Worker(BaseWorker[TSClient, None]):
         misc: None,
     ) -> None:
         self._lock = Lock()
-        self._db = TDB()
+        self._db = TDB(supervisor.match)
         super().__init__(
             ex,
             supervisor=supervisor,
@@ -156,7 +156,9 @@ class Worker(BaseWorker[TSClient, None]):
     async def populate(self) -> Optional[Tuple[bool, float]]:
         return await self._ex.submit(self._populate())
 
-    async def _work(self, context: Context, timeout: float) -> AsyncIterator[Completion]:
+    async def _work(
+        self, context: Context, timeout: float
+    ) -> AsyncIterator[Sequence[Completion]]:
         limit = (
             BIGGEST_INT
             if context.manual
@@ -171,5 +173,7 @@ class Worker(BaseWorker[TSClient, None]):
                 limit=limit,
             )
 
-            for payload in payloads:
-                yield _trans(self._options, context=context, payload=payload)
+            yield tuple(
+                _trans(self._options, context=context, payload=payload)
+                for payload in payloads
+            )
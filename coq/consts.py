@@ -40,6 +40,7 @@ REPL_GRAMMAR = environ.get("COQ_GRAMMAR", "lsp")
 DEBUG = "COQ_DEBUG" in environ
 DEBUG_METRICS = "COQ_DEBUG_METRICS" in environ
 DEBUG_DB = "COQ_DEBUG_DB" in environ
+DEBUG_RECORD = "COQ_DEBUG_RECORD" in environ
 
 BUFFER_DB = normpath(TMP_DIR / "buffers.sqlite3") if DEBUG_DB else ":memory:"
 TREESITTER_DB = normpath(TMP_DIR / "treesitter.sqlite3") if DEBUG_DB else ":memory:"
@@ -47,6 +48,8 @@ INSERT_DB = normpath(TMP_DIR / "inserts.sqlite3") if DEBUG_DB else ":memory:"
 TMUX_DB = normpath(TMP_DIR / "tmux.sqlite3") if DEBUG_DB else ":memory:"
 REGISTER_DB = normpath(TMP_DIR / "register.sqlite3") if DEBUG_DB else ":memory:"
 
+RECORD_LOG = TMP_DIR / "record.pickle"
+
 
 _URI_BASE = "https://github.com/ms-jpq/coq_nvim/tree/coq/docs/"
 
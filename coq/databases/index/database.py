@@ -0,0 +1,71 @@
+from contextlib import contextmanager
+from json import dumps
+from sqlite3 import Connection, Cursor
+from typing import Iterable, Iterator, Mapping, Optional
+
+from ...shared.settings import MatchBackend, MatchOptions
+from ...shared.word_index import WordIndex
+from .sql import sql
+
+
+def attach(conn: Connection, opts: MatchOptions, triggers: str) -> Optional[WordIndex]:
+    """
+    `triggers` log every `lword` in & out of the word tables into `word_index_log`
+
+    They also seed the log with the rows already present
+    """
+
+    if opts.backend is MatchBackend.sqlite:
+        return None
+    else:
+        conn.executescript(sql("create", "log"))
+        conn.executescript(triggers)
+        return WordIndex(exact_matches=opts.exact_matches)
+
+
+def _json(lwords: Iterable[str]) -> str:
+    return dumps([*lwords], check_circular=False, ensure_ascii=False)
+
+
+@contextmanager
+def hits(
+    cursor: Cursor,
+    index: Optional[WordIndex],
+    opts: MatchOptions,
+    word: str,
+    sym: str,
+) -> Iterator[Mapping[str, str]]:
+    """
+    Must be called inside the transaction that reads the hits
+
+    The log is drained in the same transaction,
+    so the index is rolled back along with it
+    """
+
+    if index is None:
+        yield {}
+    else:
+        cursor.execute(sql("select", "log"), ())
+        deltas = tuple((row["lword"], row["delta"]) for row in cursor.fetchall())
+        cursor.execute(sql("delete", "log"), ())
+        index.update(deltas)
+
+        try:
+            look_ahead, cut_off = opts.look_ahead, opts.fuzzy_cutoff
+            word_hits = index.hits(word, look_ahead=look_ahead, cut_off=cut_off)
+            sym_hits = index.hits(sym, look_ahead=look_ahead, cut_off=cut_off)
+            ranked = sorted(
+                word_hits.keys() | sym_hits.keys(),
+                key=lambda lword: max(
+                    word_hits.get(lword, (0, 0.0)), sym_hits.get(lword, (0, 0.0))
+                ),
+                reverse=True,
+            )
+            yield {
+                "hits": _json(ranked),
+                "word_hits": _json(word_hits),
+                "sym_hits": _json(sym_hits),
+            }
+        except BaseException:
+            index.update((lword, -delta) for lword, delta in deltas)
+            raise
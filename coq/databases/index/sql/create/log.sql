@@ -0,0 +1,7 @@
+PRAGMA recursive_triggers = ON;
+
+
+CREATE TEMP TABLE IF NOT EXISTS word_index_log (
+  lword TEXT    NOT NULL PRIMARY KEY,
+  delta INTEGER NOT NULL
+) WITHOUT ROWID;
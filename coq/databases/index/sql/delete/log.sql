@@ -0,0 +1 @@
+DELETE FROM temp.word_index_log
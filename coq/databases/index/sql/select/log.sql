@@ -0,0 +1,6 @@
+SELECT
+  lword,
+  delta
+FROM temp.word_index_log
+WHERE
+  delta <> 0
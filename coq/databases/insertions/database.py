@@ -1,13 +1,25 @@
-from contextlib import closing, suppress
+from collections import OrderedDict
+from contextlib import closing
 from dataclasses import dataclass
-from sqlite3 import Connection, OperationalError
-from typing import Iterator, Mapping
+from sqlite3 import Connection
+from threading import Lock
+from time import monotonic
+from types import MappingProxyType
+from typing import Iterator, Mapping, MutableMapping, Optional, Tuple
 
 from ...consts import INSERT_DB
+from ...shared.histogram import Histogram, Rolling
+from ...shared.lru import LRU
 from ...shared.sql import init_db
 from ..types import DB
 from .sql import sql
 
+_RECENT = 100
+_INSTANCES = 999
+_STEPS = 16
+_WINDOW_SPAN = 60
+_WINDOW_SLOTS = 5
+
 
 @dataclass(frozen=True)
 class Statistics:
@@ -25,6 +37,35 @@ class Statistics:
     q50_items: int
     q99_items: int
 
+    window_q50_duration: float
+    window_q95_duration: float
+    window_q99_duration: float
+
+
+class _Sketch:
+    """
+    Running stats of one source, in memory, O(1) space
+    """
+
+    def __init__(self) -> None:
+        self.interrupted = 0
+        self.inserted = 0
+        self.instances = 0
+        self.duration_sum = 0.0
+        self.items_sum = 0
+        self.duration = Histogram(_STEPS)
+        self.items = Histogram(_STEPS)
+        self.window = Rolling(_WINDOW_SPAN, slots=_WINDOW_SLOTS, steps=_STEPS)
+
+    def add(self, interrupted: bool, duration: float, items: int) -> None:
+        self.interrupted += interrupted
+        self.instances += 1
+        self.duration_sum += duration
+        self.items_sum += items
+        self.duration.add(duration)
+        self.items.add(items)
+        self.window.add(duration, now=monotonic())
+
 
 def _init() -> Connection:
     conn = Connection(INSERT_DB, isolation_level=None)
@@ -37,76 +78,106 @@ def _init() -> Connection:
 class IDB(DB):
     def __init__(self) -> None:
         self._conn = _init()
+        # `sort_by` -> `insert_order`, most recent last
+        self._recent: OrderedDict[str, int] = OrderedDict()
+        self._order: Mapping[str, int] = MappingProxyType({})
 
-    def new_source(self, source: str) -> None:
-        # MUST OK
         with self._conn, closing(self._conn.cursor()) as cursor:
-            cursor.execute(sql("insert", "source"), {"name": source})
+            cursor.execute(sql("select", "inserted"), {"limit": _RECENT})
+            rows = cursor.fetchall()
+        for row in reversed(rows):
+            self._recent[row["sort_by"]] = row["insert_order"]
+        self._order = MappingProxyType({**self._recent})
 
-    def new_batch(self, batch_id: bytes) -> None:
-        # MUST OK
-        with self._conn, closing(self._conn.cursor()) as cursor:
-            cursor.execute(sql("insert", "batch"), {"rowid": batch_id})
+        self._lock = Lock()
+        self._sketches: MutableMapping[str, _Sketch] = {}
+        # `instance` -> `source`, `batch`, only the recent ones can be inserted from
+        self._instances: MutableMapping[bytes, Tuple[str, bytes]] = LRU(size=_INSTANCES)
+
+    def new_source(self, source: str) -> None:
+        with self._lock:
+            self._sketches.setdefault(source, _Sketch())
 
     def new_instance(self, instance: bytes, source: str, batch_id: bytes) -> None:
-        # MUST OK
-        with self._conn, closing(self._conn.cursor()) as cursor:
-            cursor.execute(
-                sql("insert", "instance"),
-                {"rowid": instance, "source_id": source, "batch_id": batch_id},
-            )
+        with self._lock:
+            self._instances[instance] = source, batch_id
 
     def new_stat(
         self, instance: bytes, interrupted: bool, duration: float, items: int
     ) -> None:
-        # MUST OK
-        with self._conn, closing(self._conn.cursor()) as cursor:
-            cursor.execute(
-                sql("insert", "instance_stat"),
-                {
-                    "instance_id": instance,
-                    "interrupted": interrupted,
-                    "duration": duration,
-                    "items": items,
-                },
-            )
+        with self._lock:
+            if (seen := self._instances.get(instance)) is not None:
+                source, _ = seen
+                if sketch := self._sketches.get(source):
+                    sketch.add(interrupted, duration=duration, items=items)
 
-    def insertion_order(self, n_rows: int) -> Mapping[str, int]:
-        # can interrupt
-        with suppress(OperationalError):
-            with self._conn, closing(self._conn.cursor()) as cursor:
-                cursor.execute(sql("select", "inserted"), {"limit": n_rows})
-                order = {
-                    row["sort_by"]: row["insert_order"] for row in cursor.fetchall()
-                }
-                return order
-        return {}
+    def insertion_order(self) -> Mapping[str, int]:
+        """
+        Last `_RECENT` distinct insertions, read only, updated by `inserted`
+        """
+
+        return self._order
 
     def inserted(self, instance_id: bytes, sort_by: str) -> None:
-        # MUST OK
-        with self._conn, closing(self._conn.cursor()) as cursor:
-            cursor.execute(
-                sql("insert", "inserted"),
-                {"instance_id": instance_id, "sort_by": sort_by},
-            )
+        """
+        Only the rows behind an insertion are written, telemetry stays in memory
+        """
 
-    def stats(self) -> Iterator[Statistics]:
         # MUST OK
-        with self._conn, closing(self._conn.cursor()) as cursor:
-            cursor.execute(sql("select", "summaries"), ())
-
-            for row in cursor:
-                stat = Statistics(
-                    source=row["source"],
-                    interrupted=row["interrupted"],
-                    inserted=row["inserted"],
-                    avg_duration=row["avg_duration"],
-                    avg_items=row["avg_items"],
-                    q10_duration=row["q10_duration"],
-                    q50_duration=row["q50_duration"],
-                    q95_duration=row["q95_duration"],
-                    q99_duration=row["q99_duration"],
-                    q50_items=row["q50_items"],
-                    q99_items=row["q99_items"],
+        with self._lock:
+            seen = self._instances.get(instance_id)
+
+        if seen is None:
+            row_id: Optional[int] = None
+        else:
+            source, batch_id = seen
+            with self._lock:
+                if sketch := self._sketches.get(source):
+                    sketch.inserted += 1
+            with self._conn, closing(self._conn.cursor()) as cursor:
+                cursor.execute(sql("insert", "source"), {"name": source})
+                cursor.execute(sql("insert", "batch"), {"rowid": batch_id})
+                cursor.execute(
+                    sql("insert", "instance"),
+                    {"rowid": instance_id, "source_id": source, "batch_id": batch_id},
                 )
-                yield stat
+                cursor.execute(
+                    sql("insert", "inserted"),
+                    {"instance_id": instance_id, "sort_by": sort_by},
+                )
+                row_id = cursor.lastrowid
+
+        insert_order = (
+            max(self._recent.values(), default=0) + 1 if row_id is None else row_id
+        )
+        self._recent.pop(sort_by, None)
+        self._recent[sort_by] = insert_order
+        while len(self._recent) > _RECENT:
+            self._recent.popitem(last=False)
+        self._order = MappingProxyType({**self._recent})
+
+    def stats(self) -> Iterator[Statistics]:
+        now = monotonic()
+        with self._lock:
+            sketches = tuple(self._sketches.items())
+
+        for source, sketch in sketches:
+            n = sketch.instances or 1
+            window = sketch.window.window(now)
+            stat = Statistics(
+                source=source,
+                interrupted=sketch.interrupted,
+                inserted=sketch.inserted,
+                avg_duration=sketch.duration_sum / n,
+                avg_items=sketch.items_sum / n,
+                q10_duration=sketch.duration.quantile(0.1),
+                q50_duration=sketch.duration.quantile(0.5),
+                q95_duration=sketch.duration.quantile(0.95),
+                q99_duration=sketch.duration.quantile(0.99),
+                q50_items=round(sketch.items.quantile(0.5)),
+                q99_items=round(sketch.items.quantile(0.99)),
+                window_q50_duration=window.quantile(0.5),
+                window_q95_duration=window.quantile(0.95),
+                window_q99_duration=window.quantile(0.99),
+            )
+            yield stat
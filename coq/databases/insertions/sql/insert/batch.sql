@@ -1,2 +1,2 @@
-INSERT INTO batches ( rowid)
-VALUES              (:rowid)
+INSERT OR IGNORE INTO batches ( rowid)
+VALUES                        (:rowid)
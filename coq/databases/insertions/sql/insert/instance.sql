@@ -1,2 +1,2 @@
-INSERT INTO instances ( rowid,  source_id,  batch_id)
-VALUES                (:rowid, :source_id, :batch_id)
+INSERT OR IGNORE INTO instances ( rowid,  source_id,  batch_id)
+VALUES                          (:rowid, :source_id, :batch_id)
@@ -1,2 +0,0 @@
-INSERT INTO instance_stats ( instance_id,  interrupted,  duration,  items)
-VALUES                     (:instance_id, :interrupted, :duration, :items)
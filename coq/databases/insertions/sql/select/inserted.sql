@@ -1,10 +1,9 @@
-SELECT DISTINCT
-  rowid   AS insert_order,
-  sort_by AS sort_by
+SELECT
+  MAX(rowid) AS insert_order,
+  sort_by    AS sort_by
 FROM inserted
 GROUP BY
   sort_by
 ORDER BY
-  rowid DESC
+  insert_order DESC
 LIMIT :limit
-
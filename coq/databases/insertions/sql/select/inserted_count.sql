@@ -1,3 +0,0 @@
-SELECT
-  COUNT(*)
-FROM inserted
@@ -1,3 +0,0 @@
-SELECT
-  *
-FROM stat_inserted_view
@@ -1,3 +0,0 @@
-SELECT
-  *
-FROM stats_view
@@ -1,11 +1,14 @@
 from dataclasses import asdict
+from functools import partial
 from typing import (
     AbstractSet,
     Any,
+    Iterator,
     Mapping,
     MutableMapping,
     Optional,
     Sequence,
+    Tuple,
     Type,
     Union,
 )
@@ -40,6 +43,8 @@ from .types import (
     InLineCompletionResponse,
     InsertReplaceEdit,
     ItemDefaults,
+    LazyCompletion,
+    LazyLSPcomp,
     LSPcomp,
     MarkupContent,
     StringValue,
@@ -341,6 +346,34 @@ def parse_inline_item(
             return comp
 
 
+def _items(resp: CompletionResponse) -> Tuple[bool, Iterator[Any]]:
+    """
+    -> `(local_cache, items)`, `itemDefaults` applied
+    """
+
+    if _falsy(resp):
+        return True, iter(())
+
+    elif isinstance(resp, Mapping):
+        is_complete = _falsy(resp.get("isIncomplete"))
+
+        if not isinstance((items := resp.get("items")), Sequence):
+            log.warning("%s", f"Unknown LSP resp -- {type(items)}")
+            return is_complete, iter(())
+
+        else:
+            defaults = _defaults_parser(resp.get("itemDefaults")) or ItemDefaults()
+            return is_complete, (_with_defaults(defaults, item=item) for item in items)
+
+    elif isinstance(resp, Sequence):
+        defaults = ItemDefaults()
+        return True, (_with_defaults(defaults, item=item) for item in resp)
+
+    else:
+        log.warning("%s", f"Unknown LSP resp -- {type(resp)}")
+        return False, iter(())
+
+
 def parse(
     protocol: LSProtocol,
     extern_type: Union[Type[ExternLSP], Type[ExternLUA]],
@@ -352,44 +385,99 @@ def parse(
     weight_adjust: float,
     resp: CompletionResponse,
 ) -> LSPcomp:
-    if _falsy(resp):
-        return LSPcomp(client=client, local_cache=True, items=iter(()))
+    local_cache, items = _items(resp)
+    comps = (
+        co
+        for item in items
+        if (
+            co := parse_item(
+                protocol,
+                extern_type=extern_type,
+                always_on_top=always_on_top,
+                client=client,
+                encoding=encoding,
+                short_name=short_name,
+                cursors=cursors,
+                weight_adjust=weight_adjust,
+                item=item,
+            )
+        )
+    )
+    return LSPcomp(client=client, local_cache=local_cache, items=comps)
 
-    elif isinstance(resp, Mapping):
-        is_complete = _falsy(resp.get("isIncomplete"))
 
-        if not isinstance((items := resp.get("items")), Sequence):
-            log.warning("%s", f"Unknown LSP resp -- {type(items)}")
-            return LSPcomp(client=client, local_cache=is_complete, items=iter(()))
+def _light(protocol: LSProtocol, item: Any) -> Optional[Tuple[str, str]]:
+    """
+    `(primary_edit.new_text, sort_by)` of `parse_item`, without decoding `item`
+    """
 
+    if not isinstance(item, Mapping) or not isinstance(
+        (label := item.get("label")), str
+    ):
+        return None
+    else:
+        edit = item.get("textEdit")
+        edit_text = (
+            edit.get("newText", edit.get("new_text"))
+            if isinstance(edit, Mapping)
+            else None
+        )
+        insert_text = item.get("insertText")
+        filter_text = item.get("filterText")
+        fmt = item.get("insertTextFormat")
+        is_snippet = (
+            protocol.InsertTextFormat.get(fmt if isinstance(fmt, int) else None)
+            == "Snippet"
+        )
+
+        if isinstance(edit_text, str):
+            new_text = edit_text
+        elif isinstance(insert_text, str) and insert_text:
+            new_text = insert_text
         else:
-            defaults = _defaults_parser(resp.get("itemDefaults")) or ItemDefaults()
-            comps = (
-                co1
-                for item in items
-                if (
-                    co1 := parse_item(
-                        protocol,
-                        extern_type=extern_type,
-                        client=client,
-                        encoding=encoding,
-                        always_on_top=always_on_top,
-                        short_name=short_name,
-                        cursors=cursors,
-                        weight_adjust=weight_adjust,
-                        item=_with_defaults(defaults, item=item),
-                    )
-                )
-            )
-            return LSPcomp(client=client, local_cache=is_complete, items=comps)
+            new_text = label
 
-    elif isinstance(resp, Sequence):
-        defaults = ItemDefaults()
-        comps = (
-            co2
-            for item in resp
-            if (
-                co2 := parse_item(
+        if isinstance(filter_text, str) and filter_text:
+            sort_by = filter_text
+        else:
+            sort_by = label if is_snippet else new_text
+
+        return new_text, sort_by
+
+
+def eager(comp: Completion) -> LazyCompletion:
+    """
+    `LazyCompletion` over an already decoded `comp`
+    """
+
+    return LazyCompletion(
+        new_text=comp.primary_edit.new_text, sort_by=comp.sort_by, decode=lambda: comp
+    )
+
+
+def parse_lazy(
+    protocol: LSProtocol,
+    extern_type: Union[Type[ExternLSP], Type[ExternLUA]],
+    always_on_top: Optional[AbstractSet[Optional[str]]],
+    client: Optional[str],
+    encoding: Encoding,
+    short_name: str,
+    cursors: Cursors,
+    weight_adjust: float,
+    resp: CompletionResponse,
+) -> LazyLSPcomp:
+    """
+    `parse`, but each item is only decoded on `decode()`
+    """
+
+    local_cache, items = _items(resp)
+
+    def cont() -> Iterator[LazyCompletion]:
+        for item in items:
+            if light := _light(protocol, item=item):
+                new_text, sort_by = light
+                decode = partial(
+                    parse_item,
                     protocol,
                     extern_type=extern_type,
                     always_on_top=always_on_top,
@@ -398,15 +486,11 @@ def parse(
                     short_name=short_name,
                     cursors=cursors,
                     weight_adjust=weight_adjust,
-                    item=_with_defaults(defaults, item=item),
+                    item=item,
                 )
-            )
-        )
-        return LSPcomp(client=client, local_cache=True, items=comps)
+                yield LazyCompletion(new_text=new_text, sort_by=sort_by, decode=decode)
 
-    else:
-        log.warning("%s", f"Unknown LSP resp -- {type(resp)}")
-        return LSPcomp(client=client, local_cache=False, items=iter(()))
+    return LazyLSPcomp(client=client, local_cache=local_cache, items=cont())
 
 
 def parse_inline(
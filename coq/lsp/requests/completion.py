@@ -2,12 +2,19 @@ from datetime import timedelta
 from typing import AbstractSet, AsyncIterator, Optional, Tuple, cast
 
 from ...shared.types import Context, ExternLSP, ExternLUA
-from ..parse import parse, parse_inline
+from ..parse import parse, parse_inline, parse_lazy
 from ..protocol import protocol
-from ..types import CompletionResponse, InLineCompletionResponse, LSPcomp
+from ..types import (
+    CompletionResponse,
+    InLineCompletionResponse,
+    LazyLSPcomp,
+    LSPcomp,
+    Prefilter,
+)
 from .request import async_request
 
 _Rsp = Tuple[LSPcomp, AbstractSet[str], timedelta]
+_LazyRsp = Tuple[LazyLSPcomp, AbstractSet[str], timedelta]
 
 
 async def comp_lsp(
@@ -17,12 +24,15 @@ async def comp_lsp(
     context: Context,
     chunk: int,
     clients: AbstractSet[str],
-) -> AsyncIterator[_Rsp]:
+    prefilter: Optional[Prefilter],
+) -> AsyncIterator[_LazyRsp]:
     pc = await protocol()
 
-    async for client in async_request("lsp_comp", chunk, clients, context.cursor):
+    async for client in async_request(
+        "lsp_comp", chunk, clients, context.cursor, prefilter
+    ):
         resp = cast(CompletionResponse, client.message)
-        parsed = parse(
+        parsed = parse_lazy(
             pc,
             extern_type=ExternLSP,
             client=client.name,
@@ -2,6 +2,7 @@ from dataclasses import dataclass
 from typing import (
     AbstractSet,
     Any,
+    Callable,
     Iterator,
     Literal,
     Optional,
@@ -124,6 +125,18 @@ _NULL = Literal[None, False, 0]
 CompletionResponse = Union[_NULL, Sequence[CompletionItem], _CompletionList]
 
 
+class Prefilter(TypedDict):
+    """
+    Checked in `lua/coq/lsp-request.lua`, before items are sent over
+    """
+
+    cword: str
+    look_ahead: int
+    fuzzy_cutoff: float
+    unifying_chars: str
+    defer_docs: bool
+
+
 @dataclass(frozen=True)
 class LSPcomp:
     client: Optional[str]
@@ -131,6 +144,24 @@ class LSPcomp:
     items: Iterator[Completion]
 
 
+@dataclass(frozen=True)
+class LazyCompletion:
+    """
+    Enough of a `CompletionItem` to filter on, `decode()` for the rest
+    """
+
+    new_text: str
+    sort_by: str
+    decode: Callable[[], Optional[Completion]]
+
+
+@dataclass(frozen=True)
+class LazyLSPcomp:
+    client: Optional[str]
+    local_cache: bool
+    items: Iterator[LazyCompletion]
+
+
 @dataclass(frozen=True)
 class StringValue:
     kind: Literal["snippet"]
@@ -18,6 +18,7 @@ from ...lsp.requests.resolve import resolve
 from ...registry import NAMESPACE, autocmd, rpc
 from ...shared.aio import with_timeout
 from ...shared.runtime import Metric
+from ...shared.timeit import measure
 from ...shared.types import ChangeEvent, Context, ExternLSP, ExternPath
 from ..completions import complete
 from ..context import context
@@ -47,13 +48,34 @@ def _should_cont(
     return True
 
 
+async def _show(stack: Stack, context: Context, metrics: Sequence[Metric]) -> bool:
+    s = state()
+    if s.change_id != context.change_id:
+        return False
+    else:
+        _, col = context.position
+        with measure("trans"):
+            vim_comps = tuple(
+                trans(
+                    stack,
+                    pum_width=s.pum_width,
+                    context=context,
+                    metrics=metrics,
+                )
+            )
+        with measure("complete"):
+            await complete(stack=stack, col=col, comps=vim_comps)
+        return True
+
+
 async def comp_func(
     stack: Stack, s: State, change: Optional[ChangeEvent], t0: float, manual: bool
 ) -> None:
     with suppress_and_log():
-        ctx = await context(
-            options=stack.settings.match, state=s, change=change, manual=manual
-        )
+        with measure("context"):
+            ctx = await context(
+                options=stack.settings.match, state=s, change=change, manual=manual
+            )
         should = (
             _should_cont(
                 s,
@@ -68,25 +90,25 @@ async def comp_func(
 
         if should:
             state(context=ctx)
-            metrics, _ = await gather(
-                stack.supervisor.collect(ctx),
-                (
-                    complete(stack=stack, col=col, comps=())
-                    if stack.settings.display.pum.fast_close
-                    else sleep(0)
-                ),
+            narrowed = stack.supervisor.narrow(ctx)
+            collecting = stack.supervisor.collect(
+                ctx,
+                progress=lambda metrics: _show(stack, context=ctx, metrics=metrics),
+                shown=len(narrowed),
             )
-            s = state()
-            if s.change_id == ctx.change_id:
-                vim_comps = tuple(
-                    trans(
-                        stack,
-                        pum_width=s.pum_width,
-                        context=ctx,
-                        metrics=metrics,
-                    )
+            if narrowed:
+                await _show(stack, context=ctx, metrics=narrowed)
+                metrics = await collecting
+            else:
+                metrics, _ = await gather(
+                    collecting,
+                    (
+                        complete(stack=stack, col=col, comps=())
+                        if stack.settings.display.pum.fast_close
+                        else sleep(0)
+                    ),
                 )
-                await complete(stack=stack, col=col, comps=vim_comps)
+            if await _show(stack, context=ctx, metrics=metrics):
                 if DEBUG:
                     t1 = monotonic()
                     delta = t1 - t0
@@ -118,16 +140,18 @@ async def _resolve(stack: Stack, metric: Metric) -> Metric:
         )
     elif not isinstance((extern := metric.comp.extern), ExternLSP) or extern.inline:
         return metric
-    elif comp := await with_timeout(
-        stack.settings.clients.lsp.resolve_timeout, co=resolve(extern=extern)
-    ):
-        return replace(
-            metric,
-            comp=replace(metric.comp, secondary_edits=comp.secondary_edits),
-        )
-
     else:
-        return metric
+        with measure("resolve"):
+            comp = await with_timeout(
+                stack.settings.clients.lsp.resolve_timeout, co=resolve(extern=extern)
+            )
+        if comp:
+            return replace(
+                metric,
+                comp=replace(metric.comp, secondary_edits=comp.secondary_edits),
+            )
+        else:
+            return metric
 
 
 @rpc()
@@ -171,12 +195,14 @@ async def _comp_done(stack: Stack, event: Mapping[str, Any]) -> None:
                         )
 
                     if new_metric.comp.uid in stack.metrics:
-                        if inserted := await edit(
-                            stack=stack,
-                            state=s,
-                            metric=new_metric,
-                            synthetic=False,
-                        ):
+                        with measure("edit"):
+                            inserted = await edit(
+                                stack=stack,
+                                state=s,
+                                metric=new_metric,
+                                synthetic=False,
+                            )
+                        if inserted:
                             inserted_at, text_trans = inserted
                         else:
                             inserted_at, text_trans = (-1, -1), None
@@ -30,7 +30,7 @@ from ...paths.show import show
 from ...registry import NAMESPACE, autocmd, rpc
 from ...shared.aio import with_timeout
 from ...shared.settings import GhostText, PreviewDisplay
-from ...shared.timeit import timeit
+from ...shared.timeit import measure, timeit
 from ...shared.trans import expand_tabs, indent_adjusted
 from ...shared.types import Completion, Context, Doc, ExternLSP, ExternPath
 from ..edit import EditInstruction, parse, parse_secondary
@@ -239,10 +239,12 @@ async def _resolve_comp(
                 doc = cached.doc
             else:
                 if isinstance(comp.extern, ExternLSP):
-                    if cmp := await with_timeout(
-                        timeout,
-                        co=resolve(extern=comp.extern),
-                    ):
+                    with measure("resolve"):
+                        cmp = await with_timeout(
+                            timeout,
+                            co=resolve(extern=comp.extern),
+                        )
+                    if cmp:
                         stack.lru[state.preview_id] = cmp
                     doc = (cmp.doc if cmp else None) or comp.doc
                 elif isinstance(comp.extern, ExternPath) and enabled:
@@ -14,7 +14,9 @@ from ...consts import MD_STATS
 from ...databases.insertions.database import Statistics
 from ...lang import LANG
 from ...registry import rpc
+from ...shared.timeit import stages
 from ..rt_types import Stack
+from ..trans import collation_cache
 
 _TAB_SIZE = 2
 _H_SEP = " | "
@@ -29,6 +31,14 @@ ${{chart2}}
 
 ${{chart3}}
 
+${{stages}}
+
+${{health}}
+
+${{caches}}
+
+${{collation}}
+
 ${{desc}}
 """.lstrip()
 
@@ -90,6 +100,9 @@ def _trans(stat: Statistics) -> Iterator[Tuple[str, Mapping[str, str]]]:
         "Q50 Duration": f"{si_prefixed_smol(stat.q50_duration, precision=0)}s",
         "Q95 Duration": f"{si_prefixed_smol(stat.q95_duration, precision=0)}s",
         "Q99 Duration": f"{si_prefixed_smol(stat.q99_duration, precision=0)}s",
+        "Q50 (5m)": f"{si_prefixed_smol(stat.window_q50_duration, precision=0)}s",
+        "Q95 (5m)": f"{si_prefixed_smol(stat.window_q95_duration, precision=0)}s",
+        "Q99 (5m)": f"{si_prefixed_smol(stat.window_q99_duration, precision=0)}s",
     }
     yield stat.source, m2
 
@@ -112,6 +125,59 @@ def _pprn(stats: Iterable[Statistics]) -> Iterator[str]:
             yield table
 
 
+def _stages() -> str:
+    def fmt(seconds: float) -> str:
+        return f"{si_prefixed_smol(seconds, precision=0)}s"
+
+    rows = {
+        stage: {
+            "Count": str(histogram.count),
+            "Q50": fmt(histogram.quantile(0.5)),
+            "Q95": fmt(histogram.quantile(0.95)),
+            "Q99": fmt(histogram.quantile(0.99)),
+            "Max": fmt(histogram.max),
+        }
+        for stage, histogram in stages().items()
+    }
+    headers = ("Count", "Q50", "Q95", "Q99", "Max")
+    return _table(headers, rows=rows)
+
+
+def _health(stack: Stack) -> str:
+    rows = {
+        f"{health.source} ({health.filetype})": {
+            "Failures": str(health.failures),
+            "Trips": str(health.trips),
+            "Open": f"{si_prefixed_smol(health.open_for, precision=0)}s",
+        }
+        for health in stack.supervisor.health()
+    }
+    headers = ("Failures", "Trips", "Open")
+    return _table(headers, rows=rows)
+
+
+def _caches(stack: Stack) -> str:
+    rows = {
+        source: {
+            "Entries": str(usage.entries),
+            "Size": f"{usage.size / 2**20:.1f}MiB",
+            "Hits": str(usage.hits),
+            "Misses": str(usage.misses),
+            "Evicted": str(usage.evicted),
+        }
+        for source, usage in stack.supervisor.usage().items()
+    }
+    headers = ("Entries", "Size", "Hits", "Misses", "Evicted")
+    return _table(headers, rows=rows)
+
+
+def _collation() -> str:
+    hits, misses = collation_cache()
+    total = hits + misses
+    rate = round(hits / total * 100) if total else 0
+    return LANG("collation cache", hits=hits, misses=misses, rate=rate)
+
+
 @rpc()
 async def stats(stack: Stack, *_: str) -> None:
     stats = stack.idb.stats()
@@ -119,7 +185,16 @@ async def stats(stack: Stack, *_: str) -> None:
     desc = MD_STATS.read_text()
     lines = (
         Template(_TPL)
-        .substitute(chart1=chart1, chart2=chart2, chart3=chart3, desc=desc)
+        .substitute(
+            chart1=chart1,
+            chart2=chart2,
+            chart3=chart3,
+            stages=_stages(),
+            health=_health(stack),
+            caches=_caches(stack),
+            collation=_collation(),
+            desc=desc,
+        )
         .splitlines()
     )
     async for win in list_floatwins(_NS):
@@ -1,15 +1,26 @@
-from asyncio import get_running_loop, run_coroutine_threadsafe, wrap_future
+from asyncio import get_running_loop
 from collections import Counter
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from itertools import chain
-from typing import Mapping
+from types import MappingProxyType
+from typing import (
+    AbstractSet,
+)
+from typing import Counter as TCounter
+from typing import Mapping, MutableMapping, MutableSequence, Sequence, Tuple
 from uuid import UUID, uuid4
 
 from pynvim_pp.lib import display_width
 
 from ..databases.insertions.database import IDB
 from ..shared.context import cword_before
-from ..shared.fuzzy import MatchMetrics, metrics
+from ..shared.fuzzy import (
+    FuzzyQuery,
+    MatchMetrics,
+    fuzzy_query,
+    metrics_many,
+    query_metrics,
+)
 from ..shared.parse import coalesce, lower
 from ..shared.runtime import Metric, PReviewer
 from ..shared.settings import BaseClient, Icons, MatchOptions, Weights
@@ -23,10 +34,24 @@ class ReviewCtx:
     context: Context
     proximity: Mapping[str, int]
     inserted: Mapping[str, int]
+    queries: Mapping[str, FuzzyQuery]
 
     is_lower: bool
 
 
+def _queries(context: Context) -> Mapping[str, FuzzyQuery]:
+    """
+    Every `cword_before` the batch can ask for
+    """
+
+    cwords = (
+        (context.l_words_before, context.l_syms_before, context.ws_before)
+        if context.is_lower
+        else (context.words_before, context.syms_before, context.ws_before)
+    )
+    return {cword: fuzzy_query(cword) for cword in cwords}
+
+
 def _metric(
     options: MatchOptions,
     ctx: ReviewCtx,
@@ -36,7 +61,36 @@ def _metric(
     cword = cword_before(
         options.unifying_chars, lower=ctx.is_lower, context=ctx.context, sort_by=match
     )
-    return metrics(cword, match, look_ahead=options.look_ahead)
+    return query_metrics(ctx.queries[cword], match, look_ahead=options.look_ahead)
+
+
+def _metrics_many(
+    options: MatchOptions,
+    ctx: ReviewCtx,
+    completions: Sequence[Completion],
+) -> Sequence[MatchMetrics]:
+    groups: MutableMapping[str, MutableSequence[Tuple[int, str]]] = {}
+    for idx, completion in enumerate(completions):
+        match = lower(completion.sort_by) if ctx.is_lower else completion.sort_by
+        cword = cword_before(
+            options.unifying_chars,
+            lower=ctx.is_lower,
+            context=ctx.context,
+            sort_by=match,
+        )
+        groups.setdefault(cword, []).append((idx, match))
+
+    acc: MutableMapping[int, MatchMetrics] = {}
+    for cword, matches in groups.items():
+        scored = metrics_many(
+            ctx.queries[cword],
+            (match for _, match in matches),
+            look_ahead=options.look_ahead,
+        )
+        for (idx, _), match_metrics in zip(matches, scored):
+            acc[idx] = match_metrics
+
+    return tuple(acc[idx] for idx in range(len(completions)))
 
 
 def sigmoid(x: float) -> float:
@@ -75,9 +129,100 @@ def _join(
     return metric
 
 
+class _Proximity:
+    """
+    Word counts of the lines around the cursor
+
+    Windows are lined up by row, only rows that changed are re-counted
+    """
+
+    def __init__(self, unifying_chars: AbstractSet[str]) -> None:
+        self._unifying_chars = unifying_chars
+        self._buf_id = -1
+        self._lo = 0
+        self._rows: Sequence[str] = ()
+        self._lines: TCounter[str] = Counter()
+        self._tokens: MutableMapping[str, TCounter[str]] = {}
+        self._counts: TCounter[str] = Counter()
+        self._view: Mapping[str, int] = MappingProxyType(self._counts)
+
+    def _tokenize(self, line: str) -> TCounter[str]:
+        return Counter(
+            coalesce(
+                self._unifying_chars,
+                include_syms=True,
+                backwards=False,
+                chars=line,
+            )
+        )
+
+    def update(self, buf_id: int, lo: int, lines: Sequence[str]) -> Mapping[str, int]:
+        """
+        `lines` start at row `lo`, the view returned is kept up to date
+        """
+
+        if buf_id != self._buf_id:
+            self._buf_id = buf_id
+            self._rows = ()
+            self._lines.clear()
+            self._tokens.clear()
+            self._counts.clear()
+
+        p_lo, rows = self._lo, self._rows
+        top, btm = max(lo, p_lo), min(lo + len(lines), p_lo + len(rows))
+        if top < btm:
+            changed = tuple(
+                (old, new)
+                for old, new in zip(
+                    rows[top - p_lo : btm - p_lo], lines[top - lo : btm - lo]
+                )
+                if old != new
+            )
+            gone = Counter(
+                chain(
+                    rows[: top - p_lo],
+                    rows[btm - p_lo :],
+                    (old for old, _ in changed),
+                )
+            )
+            came = Counter(
+                chain(
+                    lines[: top - lo],
+                    lines[btm - lo :],
+                    (new for _, new in changed),
+                )
+            )
+        else:
+            gone, came = Counter(rows), Counter(lines)
+
+        for line, n in (came - gone).items():
+            self._lines[line] += n
+            if (tokens := self._tokens.get(line)) is None:
+                tokens = self._tokens[line] = self._tokenize(line)
+            for token, count in tokens.items():
+                self._counts[token] += count * n
+
+        for line, n in (gone - came).items():
+            tokens = self._tokens[line]
+            for token, count in tokens.items():
+                if (left := self._counts[token] - count * n) > 0:
+                    self._counts[token] = left
+                else:
+                    self._counts.pop(token, None)
+            if (left := self._lines[line] - n) > 0:
+                self._lines[line] = left
+            else:
+                self._lines.pop(line, None)
+                self._tokens.pop(line, None)
+
+        self._lo, self._rows = lo, lines
+        return self._view
+
+
 class Reviewer(PReviewer[ReviewCtx]):
     def __init__(self, options: MatchOptions, icons: Icons, db: IDB) -> None:
         self._options, self._icons, self._db = options, icons, db
+        self._proximity = _Proximity(options.unifying_chars)
         self._loop = get_running_loop()
 
     def s_register(self, assoc: BaseClient) -> None:
@@ -87,38 +232,28 @@ class Reviewer(PReviewer[ReviewCtx]):
         self._loop.call_soon_threadsafe(cont)
 
     def begin(self, context: Context) -> ReviewCtx:
-        inserted = self._db.insertion_order(n_rows=100)
-        words = chain.from_iterable(
-            coalesce(
-                self._options.unifying_chars,
-                include_syms=True,
-                backwards=None,
-                chars=line,
-            )
-            for line in context.lines
+        inserted = self._db.insertion_order()
+        row, _ = context.position
+        proximity = self._proximity.update(
+            context.buf_id, lo=row - len(context.lines_before), lines=context.lines
         )
-        proximity = Counter(words)
 
         ctx = ReviewCtx(
             batch=uuid4(),
             context=context,
             proximity=proximity,
             inserted=inserted,
+            queries=_queries(context),
             is_lower=context.is_lower,
         )
-        self._db.new_batch(ctx.batch.bytes)
         return ctx
 
     async def s_begin(
         self, token: ReviewCtx, assoc: BaseClient, instance: UUID
     ) -> None:
-        async def cont() -> None:
-            self._db.new_instance(
-                instance.bytes, source=assoc.short_name, batch_id=token.batch.bytes
-            )
-
-        f = run_coroutine_threadsafe(cont(), loop=self._loop)
-        await wrap_future(f)
+        self._db.new_instance(
+            instance.bytes, source=assoc.short_name, batch_id=token.batch.bytes
+        )
 
     def trans(self, token: ReviewCtx, instance: UUID, completion: Completion) -> Metric:
         new_completion = iconify(self._icons, completion=completion)
@@ -135,13 +270,55 @@ class Reviewer(PReviewer[ReviewCtx]):
         )
         return metric
 
+    def trans_many(
+        self, token: ReviewCtx, instance: UUID, completions: Sequence[Completion]
+    ) -> Sequence[Metric]:
+        new_completions = tuple(
+            iconify(self._icons, completion=completion) for completion in completions
+        )
+        match_metrics = _metrics_many(
+            self._options,
+            ctx=token,
+            completions=new_completions,
+        )
+        metrics = tuple(
+            _join(
+                token,
+                instance=instance,
+                completion=completion,
+                match_metrics=m_metrics,
+            )
+            for completion, m_metrics in zip(new_completions, match_metrics)
+        )
+        return metrics
+
+    def rescore(
+        self, token: ReviewCtx, context: Context, metrics: Sequence[Metric]
+    ) -> Sequence[Metric]:
+        ctx = replace(
+            token,
+            context=context,
+            queries=_queries(context),
+            is_lower=context.is_lower,
+        )
+        match_metrics = _metrics_many(
+            self._options,
+            ctx=ctx,
+            completions=tuple(metric.comp for metric in metrics),
+        )
+        return tuple(
+            _join(
+                ctx,
+                instance=metric.instance,
+                completion=metric.comp,
+                match_metrics=m_metrics,
+            )
+            for metric, m_metrics in zip(metrics, match_metrics)
+        )
+
     async def s_end(
         self, instance: UUID, interrupted: bool, elapsed: float, items: int
     ) -> None:
-        async def cont() -> None:
-            self._db.new_stat(
-                instance.bytes, interrupted=interrupted, duration=elapsed, items=items
-            )
-
-        f = run_coroutine_threadsafe(cont(), loop=self._loop)
-        await wrap_future(f)
+        self._db.new_stat(
+            instance.bytes, interrupted=interrupted, duration=elapsed, items=items
+        )
@@ -1,7 +1,19 @@
-from dataclasses import asdict
-from itertools import chain
+from array import array
+from dataclasses import dataclass
+from functools import lru_cache
+from heapq import heapify, heappop
+from itertools import chain, repeat
 from locale import strxfrm
-from typing import Any, Callable, Iterable, Iterator, MutableSet, Sequence, Tuple
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    MutableSet,
+    Sequence,
+    Tuple,
+    TypeVar,
+)
 
 from pynvim_pp.lib import display_width
 from std2 import clamp
@@ -13,35 +25,69 @@ from .completions import VimCompletion
 from .rt_types import Stack
 from .state import state
 
+_T = TypeVar("_T")
 
-def _cum(adjustment: Weights, metrics: Iterable[Metric]) -> Weights:
-    zero = Weights(
-        prefix_matches=0,
-        edit_distance=0,
-        recency=0,
-        proximity=0,
+_COLLATION_CACHE = 9999
+
+
+@dataclass(frozen=True)
+class _Columns:
+    """
+    `Weights` of a whole batch, as a struct of arrays
+    """
+
+    prefix_matches: Sequence[float]
+    edit_distance: Sequence[float]
+    recency: Sequence[float]
+    proximity: Sequence[float]
+
+
+def _columns(metrics: Sequence[Metric]) -> _Columns:
+    weights = tuple(metric.weight for metric in metrics)
+    return _Columns(
+        prefix_matches=array("d", (weight.prefix_matches for weight in weights)),
+        edit_distance=array("d", (weight.edit_distance for weight in weights)),
+        recency=array("d", (weight.recency for weight in weights)),
+        proximity=array("d", (weight.proximity for weight in weights)),
     )
-    acc = asdict(zero)
-    for metric in metrics:
-        for key, val in asdict(metric.weight).items():
-            acc[key] += val
-    for key, val in asdict(adjustment).items():
-        if val:
-            acc[key] /= val
-        else:
-            acc[key] = 0
-    return Weights(**acc)
-
-
-def _sort_by(is_lower: bool, adjustment: Weights) -> Callable[[Metric], Any]:
-    adjust = asdict(adjustment)
-
-    def key_by(metric: Metric) -> Any:
-        tot = sum(
-            val / adjust[key] if adjust[key] else 0
-            for key, val in asdict(metric.weight).items()
-        )
-        key = (
+
+
+def _cum(adjustment: Weights, columns: _Columns) -> Weights:
+    def norm(column: Sequence[float], adjust: float) -> float:
+        return sum(column) / adjust if adjust else 0
+
+    return Weights(
+        prefix_matches=norm(columns.prefix_matches, adjustment.prefix_matches),
+        edit_distance=norm(columns.edit_distance, adjustment.edit_distance),
+        recency=norm(columns.recency, adjustment.recency),
+        proximity=norm(columns.proximity, adjustment.proximity),
+    )
+
+
+def _totals(adjustment: Weights, columns: _Columns) -> Iterator[float]:
+    def scaled(column: Sequence[float], adjust: float) -> Iterable[float]:
+        return (val / adjust for val in column) if adjust else repeat(0)
+
+    return map(
+        sum,
+        zip(
+            scaled(columns.prefix_matches, adjust=adjustment.prefix_matches),
+            scaled(columns.edit_distance, adjust=adjustment.edit_distance),
+            scaled(columns.recency, adjust=adjustment.recency),
+            scaled(columns.proximity, adjust=adjustment.proximity),
+        ),
+    )
+
+
+def _sort_by(
+    adjustment: Weights, columns: _Columns, metrics: Sequence[Metric]
+) -> Iterator[Any]:
+    """
+    Keys of the whole batch, but the collation, which is left to `_collate`
+    """
+
+    return (
+        (
             -(metric.comp.preselect),
             -(metric.comp.always_on_top),
             -round(tot * metric.weight_adjust * 10000),
@@ -50,15 +96,68 @@ def _sort_by(is_lower: bool, adjustment: Weights) -> Callable[[Metric], Any]:
             -(metric.comp.kind != ""),
             -(metric.comp.doc is not None),
             -metric.comp.sort_by[:1].isalnum(),
-            strxfrm(
-                metric.comp.sort_by.swapcase() if is_lower else metric.comp.sort_by
-            ),
         )
-        return key
+        for metric, tot in zip(metrics, _totals(adjustment, columns=columns))
+    )
+
+
+@lru_cache(maxsize=_COLLATION_CACHE)
+def _xfrm(sort_by: str, is_lower: bool) -> str:
+    """
+    `LC_COLLATE` is left as it was at startup, so are the keys
+    """
+
+    return strxfrm(sort_by.swapcase() if is_lower else sort_by)
+
+
+def collation_cache() -> Tuple[int, int]:
+    """
+    -> `(hits, misses)`
+    """
+
+    hits, misses, _, _ = _xfrm.cache_info()
+    return hits, misses
+
+
+def _collate(is_lower: bool) -> Callable[[Metric], str]:
+    def key_by(metric: Metric) -> str:
+        return _xfrm(metric.comp.sort_by, is_lower)
 
     return key_by
 
 
+def _ranked(
+    keys: Iterable[Any],
+    tie_break: Callable[[_T], Any],
+    lazy: bool,
+    items: Iterable[_T],
+) -> Iterator[_T]:
+    """
+    `items` sorted by `(key, tie_break(item))`, `keys` being parallel to `items`
+
+    When `lazy`, it is O(n) to heapify, then O(log n) per item actually taken,
+    with `tie_break` only ever computed for those
+
+    `_prune` usually stops after `max_results`
+    """
+
+    if not lazy:
+        ranked = sorted(
+            zip(keys, items), key=lambda pair: (pair[0], tie_break(pair[1]))
+        )
+        yield from (item for _, item in ranked)
+    else:
+        heap = [(key, idx, item) for idx, (key, item) in enumerate(zip(keys, items))]
+        heapify(heap)
+        while heap:
+            k, _, item = heappop(heap)
+            ties = [item]
+            while heap and heap[0][0] == k:
+                _, _, tie = heappop(heap)
+                ties.append(tie)
+            yield from sorted(ties, key=tie_break)
+
+
 def _prune(
     stack: Stack, context: Context, ranked: Iterable[Metric]
 ) -> Iterator[Metric]:
@@ -130,9 +229,14 @@ def trans(
     ellipsis_width = display_width(display.pum.ellipsis, tabsize=context.tabstop)
     truncate = clamp(pum_width, scr_width - context.scr_col, display.pum.x_max_len)
 
-    w_adjust = _cum(stack.settings.weights, metrics=metrics)
-    sortby = _sort_by(context.is_lower, adjustment=w_adjust)
-    ranked = sorted(metrics, key=sortby)
+    columns = _columns(metrics)
+    w_adjust = _cum(stack.settings.weights, columns=columns)
+    ranked = _ranked(
+        _sort_by(w_adjust, columns=columns, metrics=metrics),
+        tie_break=_collate(context.is_lower),
+        lazy=not context.manual,
+        items=metrics,
+    )
     pruned = tuple(_prune(stack, context=context, ranked=ranked))
     max_width = _max_width(pruned)
     for metric in pruned:
@@ -0,0 +1,106 @@
+from dataclasses import dataclass
+from threading import Lock
+from typing import Iterator, MutableMapping, Tuple
+
+from .histogram import Rolling
+
+_TRIP_AFTER = 3
+_BACKOFF = 1.0
+_MAX_BACKOFF = 60.0
+
+_MIN_SAMPLES = 8
+_SLACK = 2.0
+
+
+@dataclass(frozen=True)
+class Health:
+    source: str
+    filetype: str
+    failures: int
+    trips: int
+    # seconds left before the source is tried again
+    open_for: float
+
+
+class _State:
+    def __init__(self) -> None:
+        self.failures = 0
+        self.trips = 0
+        self.reopen_at = 0.0
+        self.latency = Rolling(span=60, slots=5, steps=4)
+
+
+class Breakers:
+    """
+    Per source, per filetype circuit breakers
+
+    Opens after `_TRIP_AFTER` deadlines blown in a row, for an exponential backoff.
+    Once the backoff is up, one more blown deadline opens it again, for longer.
+
+    Latencies over the last 5m are kept, to size the slot of untrusted sources.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._states: MutableMapping[Tuple[str, str], _State] = {}
+
+    def allow(self, source: str, filetype: str, now: float) -> bool:
+        with self._lock:
+            state = self._states.get((source, filetype))
+            return not state or state.reopen_at <= now
+
+    def trusted(self, source: str, filetype: str) -> bool:
+        """
+        No blown deadlines since the last one met
+        """
+
+        with self._lock:
+            state = self._states.get((source, filetype))
+            return not state or not (state.failures or state.trips)
+
+    def slot(self, source: str, filetype: str, timeout: float, now: float) -> float:
+        """
+        All of `timeout` while trusted, else `_SLACK` times the median latency
+        """
+
+        with self._lock:
+            state = self._states.get((source, filetype))
+            if not state or not (state.failures or state.trips):
+                return timeout
+            else:
+                latency = state.latency.window(now)
+
+        if latency.count < _MIN_SAMPLES:
+            return timeout
+        else:
+            return min(timeout, _SLACK * latency.quantile(0.5))
+
+    def record(
+        self, source: str, filetype: str, ok: bool, elapsed: float, now: float
+    ) -> None:
+        with self._lock:
+            state = self._states.setdefault((source, filetype), _State())
+            state.latency.add(elapsed, now=now)
+            if ok:
+                state.failures, state.trips = 0, 0
+            else:
+                state.failures += 1
+                if state.trips or state.failures >= _TRIP_AFTER:
+                    state.trips += 1
+                    state.failures = 0
+                    backoff = _BACKOFF * 2 ** min(16, state.trips - 1)
+                    state.reopen_at = now + min(_MAX_BACKOFF, backoff)
+
+    def health(self, now: float) -> Iterator[Health]:
+        with self._lock:
+            states = tuple(self._states.items())
+
+        for (source, filetype), state in states:
+            if state.failures or state.trips:
+                yield Health(
+                    source=source,
+                    filetype=filetype,
+                    failures=state.failures,
+                    trips=state.trips,
+                    open_for=max(0, state.reopen_at - now),
+                )
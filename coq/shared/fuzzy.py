@@ -1,7 +1,14 @@
-from collections import Counter
 from dataclasses import dataclass
-from itertools import repeat
-from typing import Iterable, MutableMapping, MutableSequence, Tuple
+from functools import lru_cache
+from itertools import accumulate, repeat
+from typing import (
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    MutableSequence,
+    Sequence,
+)
 
 
 @dataclass(frozen=True)
@@ -10,6 +17,19 @@ class MatchMetrics:
     edit_distance: float
 
 
+@dataclass(frozen=True)
+class FuzzyQuery:
+    """
+    `histogram[char][i]` counts `char` in `cword[:i]`
+
+    `masks[char]` has bit `i` set for `cword[i] == char`
+    """
+
+    cword: str
+    histogram: Mapping[str, Sequence[int]]
+    masks: Mapping[str, int]
+
+
 def _p_matches(lhs: Iterable[str], rhs: Iterable[str]) -> int:
     p_matches = 0
     for l, r in zip(lhs, rhs):
@@ -20,62 +40,104 @@ def _p_matches(lhs: Iterable[str], rhs: Iterable[str]) -> int:
     return p_matches
 
 
-def multi_set_ratio(lhs: str, rhs: str, look_ahead: int) -> float:
+@lru_cache
+def fuzzy_query(cword: str) -> FuzzyQuery:
+    masks: MutableMapping[str, int] = {}
+    for idx, char in enumerate(cword):
+        masks[char] = masks.get(char, 0) | 1 << idx
+
+    histogram = {
+        char: tuple(accumulate((1 if c == char else 0 for c in cword), initial=0))
+        for char in masks
+    }
+    return FuzzyQuery(cword=cword, histogram=histogram, masks=masks)
+
+
+def _overlap(query: FuzzyQuery, lo: int, hi: int, rhs: str) -> int:
     """
-    Test intersection size, adjust for length
+    Size of the multi set intersection of `cword[lo:hi]` and `rhs`
     """
 
-    shorter = min(len(lhs), len(rhs))
+    taken: MutableMapping[str, int] = {}
+    overlap = 0
+    for char in rhs:
+        if counts := query.histogram.get(char):
+            n = taken.get(char, 0)
+            if n < counts[hi] - counts[lo]:
+                taken[char] = n + 1
+                overlap += 1
+    return overlap
+
+
+def _multi_set_ratio(query: FuzzyQuery, lo: int, rhs: str, look_ahead: int) -> float:
+    shorter = min(len(query.cword) - lo, len(rhs))
     if not shorter:
         return 1
     else:
         cutoff = shorter + look_ahead
-        l, r = lhs[:cutoff], rhs[:cutoff]
-        longer = max(len(l), len(r))
+        hi = min(len(query.cword), lo + cutoff)
+        r = rhs[:cutoff]
+        longer = max(hi - lo, len(r))
 
-        l_c, r_c = Counter(l), Counter(r)
-        dif = l_c - r_c if len(l) > len(r) else r_c - l_c
+        dif = longer - _overlap(query, lo=lo, hi=hi, rhs=r)
 
-        ratio = 1 - sum(dif.values()) / longer
+        ratio = 1 - dif / longer
         adjust = shorter / longer
         return ratio / adjust
 
 
-def quick_ratio(lhs: str, rhs: str, look_ahead: int) -> float:
+def query_multi_set_ratio(query: FuzzyQuery, rhs: str, look_ahead: int) -> float:
+    """
+    Test intersection size, adjust for length
+    """
+
+    return _multi_set_ratio(query, lo=0, rhs=rhs, look_ahead=look_ahead)
+
+
+def multi_set_ratio(lhs: str, rhs: str, look_ahead: int) -> float:
+    return query_multi_set_ratio(fuzzy_query(lhs), rhs=rhs, look_ahead=look_ahead)
+
+
+def query_quick_ratio(query: FuzzyQuery, rhs: str, look_ahead: int) -> float:
     """
     Front end bias
     """
 
-    shorter = min(len(lhs), len(rhs))
+    shorter = min(len(query.cword), len(rhs))
     if not shorter:
         return 1
     else:
-        p_matches = _p_matches(lhs, rhs)
-        l, r = lhs[p_matches:], rhs[p_matches:]
+        p_matches = _p_matches(query.cword, rhs)
 
         l_ratio = p_matches / shorter
-        r_ratio = multi_set_ratio(l, r, look_ahead=look_ahead) * (1 - l_ratio)
+        r_ratio = _multi_set_ratio(
+            query, lo=p_matches, rhs=rhs[p_matches:], look_ahead=look_ahead
+        ) * (1 - l_ratio)
         return l_ratio + r_ratio * 0.5
 
 
-_ARRAY_CACHE: MutableMapping[Tuple[int, int], MutableSequence[int]] = {}
-_DA: MutableMapping[str, int] = {}
+def quick_ratio(lhs: str, rhs: str, look_ahead: int) -> float:
+    return query_quick_ratio(fuzzy_query(lhs), rhs=rhs, look_ahead=look_ahead)
 
 
-def dl_distance(lhs: str, rhs: str) -> int:
+def _dl_distance(
+    d: MutableSequence[int], da: MutableMapping[str, int], lhs: str, rhs: str
+) -> int:
     """
     Modified from
     https://github.com/jamesturk/jellyfish/blob/main/LICENSE
     Dont sue me
+
+    `d` is scratch space of at least `(len(lhs) + 2) * (len(rhs) + 2)`
     """
 
     len_l, len_r = len(lhs), len(rhs)
+    if not len_l or not len_r:
+        return len_l or len_r
+
     row_size = len_r + 2
     max_d = len_l + len_r
-    _DA.clear()
-
-    if not (d := _ARRAY_CACHE.get((len_l, len_r))):
-        d = [*repeat(0, row_size * (len_l + 2))]
+    da.clear()
 
     d[0] = max_d
     for i in range(0, len_l + 1):
@@ -90,7 +152,7 @@ def dl_distance(lhs: str, rhs: str) -> int:
     for i in range(1, len_l + 1):
         db = 0
         for j in range(1, len_r + 1):
-            i1 = _DA.get(rhs[j - 1], 0)
+            i1 = da.get(rhs[j - 1], 0)
             j1 = db
 
             if lhs[i - 1] == rhs[j - 1]:
@@ -105,16 +167,97 @@ def dl_distance(lhs: str, rhs: str) -> int:
                 d[row_size * i + j + 1] + 1,
                 d[row_size * i1 + j1] + (i - i1 - 1) + 1 + (j - j1 - 1),
             )
-        _DA[lhs[i - 1]] = i
+        da[lhs[i - 1]] = i
 
     return d[row_size * (len_l + 1) + len_r + 1]
 
 
-def metrics(lhs: str, rhs: str, look_ahead: int) -> MatchMetrics:
+def _osa_distance(masks: Mapping[str, int], shift: int, len_l: int, rhs: str) -> int:
     """
-    Front end bias
+    Hyyrö 2003, bit-parallel optimal string alignment distance
+
+    `masks` are for some `lhs`, this computes against `lhs[shift:shift + len_l]`
+    """
+
+    if not len_l:
+        return len(rhs)
+
+    full = (1 << len_l) - 1
+    last = 1 << (len_l - 1)
+    vp, vn, d0, pm_prev = full, 0, 0, 0
+    dist = len_l
+
+    for char in rhs:
+        pm = (masks.get(char, 0) >> shift) & full
+        tr = ((~d0 & pm) << 1) & pm_prev
+        d0 = ((((pm & vp) + vp) ^ vp) | pm | vn | tr) & full
+        hp = vn | (~(d0 | vp) & full)
+        hn = d0 & vp
+        if hp & last:
+            dist += 1
+        elif hn & last:
+            dist -= 1
+        hp = ((hp << 1) | 1) & full
+        hn = (hn << 1) & full
+        vp = hn | (~(d0 | hp) & full)
+        vn = hp & d0
+        pm_prev = pm
+
+    return dist
+
+
+def _distance(
+    d: MutableSequence[int],
+    da: MutableMapping[str, int],
+    query: FuzzyQuery,
+    lo: int,
+    hi: int,
+    rhs: str,
+) -> int:
     """
+    Distance between `cword[lo:hi]` and `rhs`
+
+    OSA >= DL, and they only differ when a transposition has edits in between
+
+    -> OSA <= 2 is exact, as is OSA == any lower bound of DL
+
+    Everything else falls back to the full matrix
+    """
+
+    len_l, len_r = hi - lo, len(rhs)
+    dist = _osa_distance(query.masks, shift=lo, len_l=len_l, rhs=rhs)
+    if (
+        dist <= 2
+        or dist <= abs(len_l - len_r)
+        or dist <= max(len_l, len_r) - _overlap(query, lo=lo, hi=hi, rhs=rhs)
+    ):
+        return dist
+    else:
+        return _dl_distance(d, da=da, lhs=query.cword[lo:hi], rhs=rhs)
+
+
+def dl_distance(lhs: str, rhs: str) -> int:
+    d = [*repeat(0, (len(lhs) + 2) * (len(rhs) + 2))]
+    return _distance(d, da={}, query=fuzzy_query(lhs), lo=0, hi=len(lhs), rhs=rhs)
+
+
+def _scratch(query: FuzzyQuery, look_ahead: int) -> MutableSequence[int]:
+    """
+    Both slices are bounded by `len(cword) + look_ahead`
+    """
+
+    size = len(query.cword) + 2
+    return [*repeat(0, size * (size + look_ahead))]
 
+
+def _metrics(
+    d: MutableSequence[int],
+    da: MutableMapping[str, int],
+    query: FuzzyQuery,
+    rhs: str,
+    look_ahead: int,
+) -> MatchMetrics:
+    lhs = query.cword
     shorter = min(len(lhs), len(rhs))
     if not shorter:
         return MatchMetrics(prefix_matches=0, edit_distance=0)
@@ -122,8 +265,45 @@ def metrics(lhs: str, rhs: str, look_ahead: int) -> MatchMetrics:
         p_matches = _p_matches(lhs, rhs)
         cutoff = min(max(len(lhs), len(rhs)), shorter + look_ahead)
         more = cutoff - shorter
-        l, r = lhs[p_matches:cutoff], rhs[p_matches:cutoff]
+        hi, r = min(len(lhs), cutoff), rhs[p_matches:cutoff]
 
-        dist = dl_distance(l, r)
+        dist = _distance(d, da=da, query=query, lo=p_matches, hi=hi, rhs=r)
         edit_dist = 1 - (dist - more) / shorter
         return MatchMetrics(prefix_matches=p_matches, edit_distance=edit_dist)
+
+
+def query_metrics(query: FuzzyQuery, rhs: str, look_ahead: int) -> MatchMetrics:
+    """
+    Front end bias
+    """
+
+    d = _scratch(query, look_ahead=look_ahead)
+    return _metrics(d, da={}, query=query, rhs=rhs, look_ahead=look_ahead)
+
+
+def metrics(lhs: str, rhs: str, look_ahead: int) -> MatchMetrics:
+    return query_metrics(fuzzy_query(lhs), rhs=rhs, look_ahead=look_ahead)
+
+
+def metrics_many(
+    query: FuzzyQuery, rhs: Iterable[str], look_ahead: int
+) -> Sequence[MatchMetrics]:
+    """
+    Same as `query_metrics`, for a batch sharing the same `query`
+
+    One scratch matrix is shared by the fallback
+    """
+
+    d = _scratch(query, look_ahead=look_ahead)
+    da: MutableMapping[str, int] = {}
+    seen: MutableMapping[str, MatchMetrics] = {}
+
+    def cont() -> Iterator[MatchMetrics]:
+        for r in rhs:
+            if (m := seen.get(r)) is None:
+                m = seen[r] = _metrics(
+                    d, da=da, query=query, rhs=r, look_ahead=look_ahead
+                )
+            yield m
+
+    return tuple(cont())
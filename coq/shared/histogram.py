@@ -0,0 +1,85 @@
+from collections import deque
+from math import ceil, log2
+from threading import Lock
+from typing import Deque, MutableSequence, Tuple
+
+_MIN = 1e-6
+_DOUBLINGS = 40
+
+
+class Histogram:
+    """
+    Log bucketed, `steps` per doubling from `_MIN`, ie. a DDSketch
+
+    Fixed size, O(1) to record, mergeable, relative error of `2 ** (1 / steps)`
+    """
+
+    def __init__(self, steps: int = 4) -> None:
+        self._lock = Lock()
+        self._steps = steps
+        self._buckets: MutableSequence[int] = [0] * (_DOUBLINGS * steps)
+        self.count = 0
+        self.max = 0.0
+
+    def add(self, value: float) -> None:
+        idx = (
+            min(len(self._buckets) - 1, ceil(log2(value / _MIN) * self._steps))
+            if value > _MIN
+            else 0
+        )
+        with self._lock:
+            self._buckets[idx] += 1
+            self.count += 1
+            self.max = max(self.max, value)
+
+    def merge(self, other: "Histogram") -> None:
+        assert other._steps == self._steps
+        with other._lock:
+            buckets, count, hi = tuple(other._buckets), other.count, other.max
+        with self._lock:
+            for idx, n in enumerate(buckets):
+                self._buckets[idx] += n
+            self.count += count
+            self.max = max(self.max, hi)
+
+    def quantile(self, q: float) -> float:
+        """
+        Upper bound of the bucket holding the `q`th value
+        """
+
+        with self._lock:
+            rank, seen = max(1, ceil(q * self.count)), 0
+            for idx, n in enumerate(self._buckets):
+                seen += n
+                if n and seen >= rank:
+                    return min(self.max, _MIN * 2 ** (idx / self._steps))
+            return self.max
+
+
+class Rolling:
+    """
+    One `Histogram` per `span` seconds, for the last `slots` of them
+    """
+
+    def __init__(self, span: float, slots: int, steps: int) -> None:
+        self._lock = Lock()
+        self._span, self._n, self._steps = span, slots, steps
+        self._slots: Deque[Tuple[int, Histogram]] = deque(maxlen=slots)
+
+    def add(self, value: float, now: float) -> None:
+        slot = int(now // self._span)
+        with self._lock:
+            if not self._slots or self._slots[-1][0] != slot:
+                self._slots.append((slot, Histogram(self._steps)))
+            _, histogram = self._slots[-1]
+        histogram.add(value)
+
+    def window(self, now: float) -> Histogram:
+        slot = int(now // self._span)
+        merged = Histogram(self._steps)
+        with self._lock:
+            slots = tuple(self._slots)
+        for idx, histogram in slots:
+            if slot - idx < self._n:
+                merged.merge(histogram)
+        return merged
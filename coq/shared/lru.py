@@ -1,5 +1,17 @@
 from collections import OrderedDict, UserDict
-from typing import Generic, TypeVar, cast
+from dataclasses import dataclass
+from typing import (
+    Callable,
+    Generic,
+    Iterator,
+    Mapping,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    cast,
+)
 
 K = TypeVar("K")
 V = TypeVar("V")
@@ -15,3 +27,74 @@ class LRU(UserDict, Generic[K, V]):
         if len(self) >= self._size:
             cast(OrderedDict, self.data).popitem(last=False)
         return super().__setitem__(key, item)
+
+
+@dataclass(frozen=True)
+class Usage:
+    entries: int
+    size: int
+    hits: int
+    misses: int
+    evicted: int
+
+
+class SizedLRU(Generic[K, V]):
+    """
+    Evicts the least recently used items, once their `sizeof` add up over `budget`
+
+    `sizeof` is only computed once per item, on the way in
+    """
+
+    def __init__(self, budget: int, sizeof: Callable[[V], int]) -> None:
+        self._budget, self._sizeof = budget, sizeof
+        self._data: "OrderedDict[K, Tuple[V, int]]" = OrderedDict()
+        self._size = 0
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, key: K) -> Optional[V]:
+        if (hit := self._data.get(key)) is None:
+            return None
+        else:
+            self._data.move_to_end(key)
+            val, _ = hit
+            return val
+
+    def values(self) -> Iterator[V]:
+        """
+        Does not count as use
+        """
+
+        return (val for val, _ in self._data.values())
+
+    def update(self, items: Mapping[K, V]) -> Sequence[K]:
+        """
+        -> evicted keys
+        """
+
+        for key, val in items.items():
+            if (old := self._data.pop(key, None)) is not None:
+                _, size = old
+                self._size -= size
+            size = self._sizeof(val)
+            self._data[key] = val, size
+            self._size += size
+
+        evicted: MutableSequence[K] = []
+        while self._size > self._budget and self._data:
+            key, (_, size) = self._data.popitem(last=False)
+            self._size -= size
+            evicted.append(key)
+
+        self.evicted += len(evicted)
+        return evicted
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._size = 0
@@ -0,0 +1,70 @@
+from typing import Optional
+
+from .fuzzy import fuzzy_query, query_quick_ratio
+from .repeat import sanitize_cached
+from .settings import MatchOptions
+from .types import Completion, Context, SnippetEdit
+from .word_index import sql_lower
+
+
+def narrowable(prev: Context, cur: Context) -> bool:
+    """
+    `cur` is `prev`, with more typed onto the same word
+    """
+
+    p_row, _ = prev.position
+    row, _ = cur.position
+    return (
+        not cur.manual
+        and cur.commit_id == prev.commit_id
+        and cur.buf_id == prev.buf_id
+        and row == p_row
+        and cur.line_before.startswith(prev.line_before)
+        and cur.words_before.startswith(prev.words_before)
+        and len(cur.words_before) > len(prev.words_before)
+    )
+
+
+def _matches(match: MatchOptions, cword: str, sort_by: str) -> bool:
+    """
+    Same filter as the `words.sql` of the sources
+    """
+
+    lhs, lword = sql_lower(cword), sql_lower(sort_by)
+    return (
+        lhs != ""
+        and lword.startswith(lhs[: match.exact_matches])
+        and len(sort_by) + match.look_ahead >= len(cword)
+        and query_quick_ratio(fuzzy_query(lhs), rhs=lword, look_ahead=match.look_ahead)
+        > match.fuzzy_cutoff
+    )
+
+
+def narrow(
+    match: MatchOptions, context: Context, comp: Completion
+) -> Optional[Completion]:
+    """
+    `comp` from the previous batch, if it still applies to `context`
+    """
+
+    if not (
+        _matches(match, cword=context.words, sort_by=comp.sort_by)
+        or _matches(match, cword=context.syms, sort_by=comp.sort_by)
+    ):
+        return None
+    elif not (
+        cached := sanitize_cached(False, cursor=context.cursor, comp=comp, sort_by=None)
+    ):
+        return None
+    elif (
+        context.words.startswith(cached.sort_by)
+        or context.syms.startswith(cached.sort_by)
+    ) and not (
+        isinstance(cached.primary_edit, SnippetEdit)
+        or cached.secondary_edits
+        or cached.extern
+        or cached.always_on_top
+    ):
+        return None
+    else:
+        return cached
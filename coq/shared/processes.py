@@ -0,0 +1,127 @@
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import suppress
+from itertools import islice
+from multiprocessing import get_context
+from threading import Lock
+from typing import AbstractSet, Iterator, Optional, Sequence
+
+from pynvim_pp.logging import log
+
+from .parse import coalesce
+from .sql import BIGGEST_INT
+
+if sys.platform == "win32":
+    nice = lambda _: None
+else:
+    from os import nice
+
+# Below this many chars, the round trip costs more than tokenizing in thread
+_OFFLOAD_AT = 2**16
+# Never part of a token, which all split on whitespace
+_SEP = "\n"
+
+
+def _nice() -> None:
+    with suppress(PermissionError):
+        nice(19)
+
+
+def _words(
+    limit: int,
+    budget: int,
+    unifying_chars: AbstractSet[str],
+    include_syms: bool,
+    texts: Sequence[str],
+) -> Iterator[Sequence[str]]:
+    for text in texts:
+        words = coalesce(
+            unifying_chars, include_syms=include_syms, backwards=None, chars=text
+        )
+        acc = tuple(islice(words, min(limit, budget)))
+        budget -= len(acc)
+        yield acc
+
+
+def _tokenize(
+    limit: int,
+    budget: int,
+    unifying_chars: AbstractSet[str],
+    include_syms: bool,
+    texts: Sequence[str],
+) -> Sequence[str]:
+    """
+    `_words`, `_SEP` joined, ie. one `str` per text to pickle
+    """
+
+    words = _words(
+        limit,
+        budget=budget,
+        unifying_chars=unifying_chars,
+        include_syms=include_syms,
+        texts=texts,
+    )
+    return tuple(_SEP.join(acc) for acc in words)
+
+
+class Processes:
+    """
+    Optional tier of processes, for CPU bound indexing outside of the GIL
+
+    Blocks the calling thread, so call from a worker's thread, never the RPC loop
+    """
+
+    def __init__(self, workers: int) -> None:
+        self._workers = workers
+        self._lock = Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get(self) -> Optional[ProcessPoolExecutor]:
+        with self._lock:
+            if self._workers and not self._pool:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self._workers,
+                    # `fork` would copy the locks of every other thread
+                    mp_context=get_context("spawn"),
+                    initializer=_nice,
+                )
+            return self._pool
+
+    def tokenize(
+        self,
+        limit: int,
+        unifying_chars: AbstractSet[str],
+        include_syms: bool,
+        texts: Sequence[str],
+        budget: int = BIGGEST_INT,
+    ) -> Sequence[Sequence[str]]:
+        """
+        At most `limit` tokens per text, `budget` in total
+        """
+
+        if sum(map(len, texts)) >= _OFFLOAD_AT and (pool := self._get()):
+            try:
+                joined = pool.submit(
+                    _tokenize,
+                    limit,
+                    budget,
+                    unifying_chars,
+                    include_syms,
+                    texts,
+                ).result()
+            except BrokenProcessPool as e:
+                log.warning("%s", e)
+                with self._lock:
+                    self._pool, self._workers = None, 0
+            else:
+                return tuple(words.split(_SEP) if words else () for words in joined)
+
+        words = _words(
+            limit,
+            budget=budget,
+            unifying_chars=unifying_chars,
+            include_syms=include_syms,
+            texts=texts,
+        )
+        return tuple(words)
@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+from pathlib import Path
+from pickle import HIGHEST_PROTOCOL, UnpicklingError, dump, load
+from threading import Lock
+from typing import Iterator, Sequence, Tuple, Union
+from uuid import UUID
+
+from .types import Completion, Context
+
+
+@dataclass(frozen=True)
+class Batch:
+    batch: UUID
+    context: Context
+    timeout: float
+
+
+@dataclass(frozen=True)
+class Sourced:
+    """
+    `yielded` -> `(seconds since the worker started, completion)`
+    """
+
+    batch: UUID
+    source: str
+    always_wait: bool
+    interrupted: bool
+    elapsed: float
+    yielded: Sequence[Tuple[float, Completion]]
+
+
+Record = Union[Batch, Sourced]
+
+
+class Recorder:
+    """
+    Appends every batch, and what each worker yielded for it, to `path`
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path, self._lock = path, Lock()
+
+    def record(self, record: Record) -> None:
+        with self._lock:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            with self._path.open("ab") as fd:
+                dump(record, fd, protocol=HIGHEST_PROTOCOL)
+
+
+def records(path: Path) -> Iterator[Record]:
+    with path.open("rb") as fd:
+        while True:
+            try:
+                record = load(fd)
+            except (EOFError, UnpicklingError):
+                break
+            else:
+                if isinstance(record, (Batch, Sourced)):
+                    yield record
@@ -9,6 +9,7 @@ from .types import (
     UTF16,
     UTF32,
     BaseRangeEdit,
+    Completion,
     Cursors,
     Edit,
     RangeEdit,
@@ -84,3 +85,26 @@ def sanitize(inline_shift: bool, cursor: Cursors, edit: Edit) -> Optional[Edit]:
         return edit
     else:
         return Edit(new_text=edit.new_text)
+
+
+def _overlap(row: int, edit: BaseRangeEdit) -> bool:
+    (b_row, _), (e_row, _) = edit.begin, edit.end
+    return b_row == row or e_row == row
+
+
+def sanitize_cached(
+    inline_shift: bool, cursor: Cursors, comp: Completion, sort_by: Optional[str]
+) -> Optional[Completion]:
+    if edit := sanitize(inline_shift, cursor, edit=comp.primary_edit):
+        row, *_ = cursor
+        cached = replace(
+            comp,
+            primary_edit=edit,
+            secondary_edits=tuple(
+                edit for edit in comp.secondary_edits if not _overlap(row, edit=edit)
+            ),
+            sort_by=sort_by or comp.sort_by,
+        )
+        return cached
+    else:
+        return None
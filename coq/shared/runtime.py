@@ -18,7 +18,8 @@ from collections import deque
 from concurrent.futures import Future as CFuture
 from concurrent.futures import InvalidStateError, ThreadPoolExecutor
 from contextlib import contextmanager, suppress
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
+from math import inf
 from pathlib import Path
 from threading import Lock
 from time import monotonic
@@ -26,24 +27,33 @@ from typing import (
     Any,
     AsyncIterator,
     Awaitable,
+    Callable,
     Coroutine,
     Deque,
     Generic,
     Iterator,
+    Mapping,
+    MutableMapping,
     MutableSequence,
     Optional,
     Protocol,
     Sequence,
+    Tuple,
     TypeVar,
 )
 from uuid import UUID, uuid4
 from weakref import WeakSet
 
 from pynvim_pp.logging import suppress_and_log
-from std2.aitertools import aenumerate
 from std2.asyncio import cancel
 
+from ..consts import DEBUG_RECORD, RECORD_LOG
+from .breaker import Breakers, Health
 from .executor import AsyncExecutor
+from .lru import Usage
+from .narrow import narrow, narrowable
+from .processes import Processes
+from .record import Batch, Recorder, Sourced
 from .settings import (
     BaseClient,
     CompleteOptions,
@@ -52,7 +62,7 @@ from .settings import (
     MatchOptions,
     Weights,
 )
-from .timeit import TracingLocker, timeit
+from .timeit import TracingLocker, measure, timeit
 from .types import Completion, Context, Interruptible
 
 _T = TypeVar("_T")
@@ -70,6 +80,13 @@ class Metric:
     kind_width: int
 
 
+@dataclass(frozen=True)
+class _Batch:
+    context: Context
+    token: Any
+    metrics: Sequence[Metric]
+
+
 class PReviewer(Protocol[_T]):
     def s_register(self, assoc: BaseClient) -> None: ...
 
@@ -79,6 +96,14 @@ class PReviewer(Protocol[_T]):
 
     def trans(self, token: _T, instance: UUID, completion: Completion) -> Metric: ...
 
+    def trans_many(
+        self, token: _T, instance: UUID, completions: Sequence[Completion]
+    ) -> Sequence[Metric]: ...
+
+    def rescore(
+        self, token: _T, context: Context, metrics: Sequence[Metric]
+    ) -> Sequence[Metric]: ...
+
     async def s_end(
         self, instance: UUID, interrupted: bool, elapsed: float, items: int
     ) -> None: ...
@@ -100,13 +125,17 @@ class Supervisor:
         self.match, self.display = match, display
         self.comp, self.limits = comp, limits
         self._reviewer = reviewer
+        self.recorder = Recorder(RECORD_LOG) if DEBUG_RECORD else None
+        self.breakers = Breakers()
 
         self.threadpool = th
+        self.processes = Processes(limits.tokenization_processes)
         self._thread_lock = Lock()
         self._workers: WeakSet[Worker] = WeakSet()
 
         self._lock = TracingLocker(name="Supervisor", force=True)
         self._work_task: Optional[Task] = None
+        self._batch: Optional[_Batch] = None
 
     def register(self, worker: Worker, assoc: BaseClient) -> None:
         with suppress_and_log():
@@ -126,7 +155,20 @@ class Supervisor:
         if task:
             await cancel(task)
 
-    def collect(self, context: Context) -> Awaitable[Sequence[Metric]]:
+    def collect(
+        self,
+        context: Context,
+        progress: Optional[
+            Callable[[Sequence[Metric]], Coroutine[Any, Any, Any]]
+        ] = None,
+        shown: int = 0,
+    ) -> Awaitable[Sequence[Metric]]:
+        """
+        `progress` is handed what has arrived so far, while slower sources are out
+
+        Only when it is more than `shown`, ie. what is already on screen
+        """
+
         self.current_context = context
         now = monotonic()
         timeout = (
@@ -140,22 +182,82 @@ class Supervisor:
                 if prev:
                     await cancel(prev)
 
-            with suppress_and_log(), timeit("COLLECTED -- ALL"):
+            with suppress_and_log(), timeit("COLLECTED -- ALL"), measure("collect"):
                 async with self._lock:
                     acc: Deque[Metric] = deque()
 
+                    batch = uuid4()
+                    if self.recorder:
+                        self.recorder.record(
+                            Batch(batch=batch, context=context, timeout=timeout)
+                        )
+
                     token = self._reviewer.begin(context)
-                    tasks = {
-                        worker.supervised(
-                            context, token=token, now=now, timeout=timeout, acc=acc
-                        ): worker._options.always_wait
-                        for worker in self._workers
-                    }
+                    tasks: MutableMapping[Future, bool] = {}
+                    slots: MutableMapping[Future, float] = {}
+                    for worker in self._workers:
+                        name = worker._options.short_name
+                        if context.manual or self.breakers.allow(
+                            name, filetype=context.filetype, now=now
+                        ):
+                            slot = (
+                                timeout
+                                if context.manual
+                                else self.breakers.slot(
+                                    name,
+                                    filetype=context.filetype,
+                                    timeout=timeout,
+                                    now=now,
+                                )
+                            )
+                            fut = worker.supervised(
+                                context,
+                                token=token,
+                                batch=batch,
+                                now=now,
+                                timeout=slot,
+                                acc=acc,
+                            )
+                            trusted = self.breakers.trusted(
+                                name, filetype=context.filetype
+                            )
+                            tasks[fut] = worker._options.always_wait and trusted
+                            if slot < timeout:
+                                slots[fut] = now + slot
                     waiting = sum(tasks.values())
 
-                    done, pending = await wait(tuple(tasks), timeout=timeout)
-                    for fut in done:
-                        waiting -= tasks.get(fut) or 0
+                    interval = self.comp.progressive if progress else None
+                    pending, on_screen, shown_at = {*tasks}, shown, -inf
+                    redraw: Optional[Task] = None
+                    while pending and (remaining := now + timeout - monotonic()) > 0:
+                        t = monotonic()
+                        if cut := {fut for fut in pending if slots.get(fut, inf) <= t}:
+                            pending -= cut
+                            await cancel(*cut)
+                            continue
+                        cut_at = min(
+                            (slots[fut] for fut in pending if fut in slots), default=inf
+                        )
+                        remaining = min(remaining, cut_at - t)
+                        if interval is not None and len(acc) > on_screen:
+                            due = shown_at + interval - monotonic()
+                            remaining = min(remaining, max(0, due))
+                        done, pending = await wait(
+                            pending, timeout=remaining, return_when=FIRST_COMPLETED
+                        )
+                        for fut in done:
+                            waiting -= tasks.get(fut) or 0
+                        if (
+                            progress
+                            and interval is not None
+                            and pending
+                            and len(acc) > on_screen
+                            and monotonic() - shown_at >= interval
+                        ):
+                            on_screen, shown_at = len(acc), monotonic()
+                            if redraw:
+                                redraw.cancel()
+                            redraw = create_task(progress(tuple(acc)))
                     if not acc or waiting:
                         for fut in as_completed(pending):
                             await fut
@@ -163,12 +265,48 @@ class Supervisor:
                             if acc and not waiting:
                                 break
 
+                    if redraw:
+                        await cancel(redraw)
                     await cancel(*pending)
+                    self._batch = _Batch(
+                        context=context, token=token, metrics=tuple(acc)
+                    )
                     return acc
 
         self._work_task = task = create_task(cont(self._work_task))
         return task
 
+    def health(self) -> Sequence[Health]:
+        return tuple(self.breakers.health(monotonic()))
+
+    def usage(self) -> Mapping[str, Usage]:
+        with self._thread_lock:
+            workers = tuple(self._workers)
+        return {
+            worker._options.short_name: usage
+            for worker in workers
+            if (usage := worker.usage())
+        }
+
+    def narrow(self, context: Context) -> Sequence[Metric]:
+        """
+        Last batch, refined to `context`, while `collect` catches up
+        """
+
+        if not (
+            self.comp.narrow
+            and (batch := self._batch)
+            and narrowable(batch.context, cur=context)
+        ):
+            return ()
+        else:
+            metrics = tuple(
+                replace(metric, comp=comp)
+                for metric in batch.metrics
+                if (comp := narrow(self.match, context=context, comp=metric.comp))
+            )
+            return self._reviewer.rescore(batch.token, context=context, metrics=metrics)
+
 
 class Worker(Interruptible, Generic[_O_co, _T_co]):
     @classmethod
@@ -225,7 +363,12 @@ class Worker(Interruptible, Generic[_O_co, _T_co]):
             await cancel(task)
 
     @abstractmethod
-    def _work(self, context: Context, timeout: float) -> AsyncIterator[Completion]: ...
+    def _work(
+        self, context: Context, timeout: float
+    ) -> AsyncIterator[Sequence[Completion]]:
+        """
+        Yields completions in chunks, each reviewed in one go
+        """
 
     async def idle(self) -> None:
         async def cont() -> None:
@@ -234,10 +377,18 @@ class Worker(Interruptible, Generic[_O_co, _T_co]):
 
         await self._ex.submit(cont())
 
+    def usage(self) -> Optional[Usage]:
+        """
+        Of the completion cache, if any
+        """
+
+        return None
+
     def supervised(
         self,
         context: Context,
         token: Any,
+        batch: UUID,
         now: float,
         timeout: float,
         acc: MutableSequence[Metric],
@@ -247,6 +398,8 @@ class Worker(Interruptible, Generic[_O_co, _T_co]):
         async def cont() -> None:
             instance, items = uuid4(), 0
             interrupted = False
+            recorder = self._supervisor.recorder
+            recorded: MutableSequence[Tuple[float, Completion]] = []
 
             with timeit(f"CANCEL WORKER -- {self._options.short_name}"):
                 if prev:
@@ -256,25 +409,50 @@ class Worker(Interruptible, Generic[_O_co, _T_co]):
                 await self._supervisor._reviewer.s_begin(
                     token, assoc=self._options, instance=instance
                 )
+                t0 = monotonic()
                 try:
-                    async for items, completion in aenumerate(
-                        self._work(context, timeout=timeout), start=1
-                    ):
-                        metric = self._supervisor._reviewer.trans(
-                            token, instance=instance, completion=completion
-                        )
-                        acc.append(metric)
+                    async for completions in self._work(context, timeout=timeout):
+                        if not completions:
+                            continue
+                        items += len(completions)
+                        if recorder:
+                            at = monotonic() - t0
+                            recorded.extend((at, comp) for comp in completions)
+                        with suppress_and_log(), measure("review"):
+                            metrics = self._supervisor._reviewer.trans_many(
+                                token, instance=instance, completions=completions
+                            )
+                            acc.extend(metrics)
                 except CancelledError:
                     interrupted = True
                     raise
                 finally:
                     elapsed = monotonic() - now
+                    if not interrupted or elapsed >= timeout:
+                        self._supervisor.breakers.record(
+                            self._options.short_name,
+                            filetype=context.filetype,
+                            ok=elapsed < timeout,
+                            elapsed=elapsed,
+                            now=now + elapsed,
+                        )
                     await self._supervisor._reviewer.s_end(
                         instance,
                         interrupted=interrupted,
                         elapsed=elapsed,
                         items=items,
                     )
+                    if recorder:
+                        recorder.record(
+                            Sourced(
+                                batch=batch,
+                                source=self._options.short_name,
+                                always_wait=self._options.always_wait,
+                                interrupted=interrupted,
+                                elapsed=elapsed,
+                                yielded=tuple(recorded),
+                            )
+                        )
 
         self.interrupt()
         f = run_coroutine_threadsafe(cont(), self._ex.loop)
@@ -8,7 +8,9 @@ from pynvim_pp.float_win import Border
 
 @dataclass(frozen=True)
 class Limits:
+    cache_budget: int
     tokenization_limit: int
+    tokenization_processes: int
     idle_timeout: float
     completion_auto_timeout: float
     completion_manual_timeout: float
@@ -87,6 +89,11 @@ class Display:
     statusline: Statusline
 
 
+class MatchBackend(Enum):
+    sqlite = auto()
+    memory = auto()
+
+
 @dataclass(frozen=True)
 class MatchOptions:
     unifying_chars: AbstractSet[str]
@@ -94,6 +101,7 @@ class MatchOptions:
     look_ahead: int
     exact_matches: int
     fuzzy_cutoff: float
+    backend: MatchBackend
 
 
 @dataclass(frozen=True)
@@ -108,6 +116,8 @@ class Weights:
 class CompleteOptions:
     always: bool
     smart: bool
+    narrow: bool
+    progressive: Optional[float]
     replace_prefix_threshold: int
     replace_suffix_threshold: int
     skip_after: AbstractSet[str]
@@ -200,12 +210,18 @@ class SnippetClient(BaseClient, _AlwaysTop):
 
 
 @dataclass(frozen=True)
-class LSPClient(BaseClient, _AlwaysTops):
+class _LSPClient(BaseClient, _AlwaysTops):
     resolve_timeout: float
 
 
 @dataclass(frozen=True)
-class LSPInlineClient(LSPClient):
+class LSPClient(_LSPClient):
+    prefilter: bool
+    defer_docs: bool
+
+
+@dataclass(frozen=True)
+class LSPInlineClient(_LSPClient):
     live_pulling: bool
 
 
@@ -298,10 +314,13 @@ EMPTY_MATCH = MatchOptions(
     look_ahead=0,
     exact_matches=0,
     fuzzy_cutoff=0,
+    backend=MatchBackend.sqlite,
 )
 EMPTY_COMP = CompleteOptions(
     always=False,
     smart=True,
+    narrow=False,
+    progressive=None,
     replace_prefix_threshold=0,
     replace_suffix_threshold=0,
     skip_after=set(),
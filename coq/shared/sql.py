@@ -8,7 +8,7 @@ from pynvim_pp.lib import decode
 from std2.pathlib import AnyPath
 from std2.sqlite3 import add_functions, escape
 
-from .fuzzy import quick_ratio
+from .fuzzy import fuzzy_query, query_quick_ratio
 
 BIGGEST_INT = 2**63 - 1
 
@@ -32,7 +32,16 @@ def like_esc(like: str) -> str:
     return f"{escaped}%"
 
 
+def _similarity(lhs: str, rhs: str, look_ahead: int) -> float:
+    """
+    `lhs` is the same cword for every row of a query
+    """
+
+    query = fuzzy_query(lhs)
+    return query_quick_ratio(query, rhs=rhs, look_ahead=look_ahead)
+
+
 def init_db(conn: Connection) -> None:
     add_functions(conn)
-    conn.create_function("X_SIMILARITY", narg=3, func=quick_ratio, deterministic=True)
+    conn.create_function("X_SIMILARITY", narg=3, func=_similarity, deterministic=True)
     conn.create_function("X_NORM_CASE", narg=1, func=normcase, deterministic=True)
@@ -0,0 +1,101 @@
+from string import ascii_lowercase, ascii_uppercase
+from typing import (
+    AbstractSet,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    MutableSet,
+    Tuple,
+)
+
+from .fuzzy import fuzzy_query, query_quick_ratio
+
+_Postings = MutableMapping[str, MutableSet[str]]
+
+_SQL_LOWER = str.maketrans(ascii_uppercase, ascii_lowercase)
+
+
+def sql_lower(text: str) -> str:
+    """
+    Same as `LOWER()` in sqlite, which only folds ASCII
+    """
+
+    return text.translate(_SQL_LOWER)
+
+
+def _trigrams(lword: str) -> AbstractSet[str]:
+    return {lword[idx : idx + 3] for idx in range(len(lword) - 2)}
+
+
+class WordIndex:
+    """
+    Refcounted `lword`s of some word table
+
+    `prefixes` is a trie flattened down to `exact_matches` levels,
+    each node holding every `lword` under it
+
+    `trigrams` are the postings used to pre-rank hits
+    """
+
+    def __init__(self, exact_matches: int) -> None:
+        self._depth = exact_matches
+        self._counts: MutableMapping[str, int] = {}
+        self._prefixes: _Postings = {}
+        self._trigrams: _Postings = {}
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def _keys(self, lword: str) -> Iterator[Tuple[_Postings, str]]:
+        for idx in range(min(len(lword), self._depth) + 1):
+            yield self._prefixes, lword[:idx]
+        for gram in _trigrams(lword):
+            yield self._trigrams, gram
+
+    def update(self, deltas: Iterable[Tuple[str, int]]) -> None:
+        for lword, delta in deltas:
+            count = self._counts.get(lword, 0)
+            if (total := count + delta) > 0:
+                self._counts[lword] = total
+                if not count:
+                    for postings, key in self._keys(lword):
+                        postings.setdefault(key, set()).add(lword)
+            elif count:
+                self._counts.pop(lword)
+                for postings, key in self._keys(lword):
+                    if (words := postings.get(key)) is not None:
+                        words.discard(lword)
+                        if not words:
+                            postings.pop(key)
+
+    def hits(
+        self, word: str, look_ahead: int, cut_off: float
+    ) -> Mapping[str, Tuple[int, float]]:
+        """
+        `lword LIKE word[:exact_matches] || '%'`
+        `AND X_SIMILARITY(LOWER(word), lword, look_ahead) > cut_off`
+
+        -> `lword` to `(shared trigrams, similarity)`
+        """
+
+        lword = sql_lower(word)
+        if not lword:
+            return {}
+
+        query = fuzzy_query(lword)
+        candidates = self._prefixes.get(lword[: self._depth], set())
+        acc: MutableMapping[str, float] = {}
+        for candidate in candidates:
+            ratio = query_quick_ratio(query, rhs=candidate, look_ahead=look_ahead)
+            if ratio > cut_off:
+                acc[candidate] = ratio
+
+        shared = dict.fromkeys(acc, 0)
+        for gram in _trigrams(lword):
+            postings = self._trigrams.get(gram, set())
+            for hit in postings if len(postings) < len(shared) else shared:
+                if hit in shared and hit in postings:
+                    shared[hit] += 1
+
+        return {hit: (shared[hit], ratio) for hit, ratio in acc.items()}
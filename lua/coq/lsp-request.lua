@@ -33,6 +33,103 @@
 
   local cids = {}
   local accs = {}
+  local prefilters = {}
+
+  -- conservative version of `_use_comp` in `coq/clients/lsp/worker.py`
+  -- for ascii only, anything it cannot be sure about is kept
+  local make_prefilter = function(spec)
+    coq.validate {
+      cword = {spec.cword, "string"},
+      look_ahead = {spec.look_ahead, "number"},
+      fuzzy_cutoff = {spec.fuzzy_cutoff, "number"},
+      unifying_chars = {spec.unifying_chars, "string"}
+    }
+    local cword = spec.cword
+    local look_ahead = spec.look_ahead
+    local fuzzy_cutoff = spec.fuzzy_cutoff
+
+    local unifying = {}
+    for i = 1, #spec.unifying_chars do
+      unifying[spec.unifying_chars:sub(i, i)] = true
+    end
+
+    local matches = function(text)
+      if type(text) ~= "string" or text:find("[\128-\255]") then
+        return true
+      end
+
+      local char = text:sub(1, 1)
+      if not (char:find("^%w") or unifying[char]) then
+        return true
+      elseif #text + look_ahead < #cword then
+        return false
+      end
+
+      local shorter = math.min(#cword, #text)
+      local cutoff = shorter + look_ahead
+      local counts = {}
+      for i = 1, math.min(#cword, cutoff) do
+        local c = cword:sub(i, i)
+        counts[c] = (counts[c] or 0) + 1
+      end
+
+      local lower = text:lower()
+      local overlap = 0
+      for i = 1, math.min(#lower, cutoff) do
+        local c = lower:sub(i, i)
+        local n = counts[c]
+        if n and n > 0 then
+          counts[c] = n - 1
+          overlap = overlap + 1
+        end
+      end
+
+      return overlap >= fuzzy_cutoff * shorter - 1e-9
+    end
+
+    return function(item)
+      if #cword <= 0 or type(item) ~= "table" then
+        return true
+      end
+
+      local text_edit = item.textEdit
+      local candidates = {
+        item.filterText,
+        item.label,
+        item.insertText,
+        item.textEditText,
+        type(text_edit) == "table" and text_edit.newText or nil
+      }
+      for _, text in pairs(candidates) do
+        if matches(text) then
+          return true
+        end
+      end
+      return false
+    end
+  end
+
+  -- -> kept items, if any were dropped
+  local prefilter = function(spec, items)
+    if type(spec) ~= "table" then
+      return items, false
+    end
+
+    local keep = make_prefilter(spec)
+    local acc = {}
+    local dropped = false
+    for _, item in ipairs(items) do
+      if keep(item) then
+        if spec.defer_docs and type(item) == "table" then
+          item.documentation = nil
+        end
+        table.insert(acc, item)
+      else
+        dropped = true
+      end
+    end
+    return acc, dropped
+  end
 
   COQ.lsp_pull = function(client, name, uid, lo, hi)
     coq.validate {
@@ -79,12 +176,22 @@
       end
       if type(reply) == "table" then
         accs[name] = accs[name] or {}
+        local spec = prefilters[name]
         if type(reply.items) == "table" then
-          accs[name][client] = reply.items
+          local items, dropped = prefilter(spec, reply.items)
+          accs[name][client] = items
           reply.items = {}
+          if dropped then
+            reply.isIncomplete = true
+          end
         else
-          accs[name][client] = reply
-          payload.reply = {}
+          local items, dropped = prefilter(spec, reply)
+          accs[name][client] = items
+          if dropped then
+            payload.reply = {isIncomplete = true, items = {}}
+          else
+            payload.reply = {}
+          end
         end
       end
     end
@@ -354,7 +461,14 @@
       )
     end
 
-    COQ.lsp_comp = function(name, multipart, session_id, client_names, pos)
+    COQ.lsp_comp = function(
+      name,
+      multipart,
+      session_id,
+      client_names,
+      pos,
+      spec)
+      prefilters[name] = type(spec) == "table" and spec or nil
       lsp_comp_base(
         "textDocument/completion",
         nil,
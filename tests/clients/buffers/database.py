@@ -0,0 +1,158 @@
+from contextlib import closing
+from random import Random
+from typing import AbstractSet, MutableSequence, MutableSet, Sequence
+from unittest import TestCase
+
+from ....coq.clients.buffers.db.database import BDB
+from ....coq.shared.processes import Processes
+from ....coq.shared.settings import MatchBackend, MatchOptions
+from ....coq.shared.sql import BIGGEST_INT
+
+_MATCH = MatchOptions(
+    unifying_chars={"_"},
+    max_results=33,
+    look_ahead=2,
+    exact_matches=2,
+    fuzzy_cutoff=0.6,
+    backend=MatchBackend.sqlite,
+)
+_PREFIXES = ("abc", "xyz")
+
+
+def _db() -> BDB:
+    return BDB(
+        Processes(0),
+        tokenization_limit=BIGGEST_INT,
+        unifying_chars=_MATCH.unifying_chars,
+        include_syms=False,
+        match=_MATCH,
+    )
+
+
+def _line(rand: Random) -> str:
+    words = (
+        f"{rand.choice(_PREFIXES)}{rand.randint(0, 9)}"
+        for _ in range(rand.randint(0, 3))
+    )
+    return " ".join(words)
+
+
+def _splice(lines: MutableSequence[str], lo: int, hi: int, new: Sequence[str]) -> None:
+    """
+    `nvim_buf_set_lines`, padding past the end with lines never seen
+    """
+
+    hi = len(lines) if hi < 0 else min(hi, len(lines))
+    lines.extend("" for _ in range(lo - len(lines)))
+    lines[lo : max(lo, hi)] = new
+
+
+class Lines(TestCase):
+    def _check(self, db: BDB, lines: Sequence[str]) -> None:
+        expected: AbstractSet[str] = {word for line in lines for word in line.split()}
+        acc: MutableSet[str] = set()
+        for prefix in _PREFIXES:
+            for word in db.words(
+                _MATCH,
+                filetype=None,
+                word=prefix,
+                sym="",
+                limit=BIGGEST_INT,
+                update=None,
+            ):
+                acc.add(word.text)
+                self.assertIn(word.text, lines[word.line_num - 1].split())
+        self.assertEqual(acc, expected)
+
+    def test_1(self) -> None:
+        rand = Random(0)
+        db = _db()
+        lines: MutableSequence[str] = []
+
+        for _ in range(300):
+            size = len(lines)
+            lo = rand.randint(0, size + 2)
+            hi = rand.choice((-1, lo, lo + rand.randint(0, 3)))
+            new = [
+                rand.choice(lines) if lines and rand.random() < 0.3 else _line(rand)
+                for _ in range(rand.randint(0, 4))
+            ]
+            db.set_lines(1, filetype="py", filename="a.py", lo=lo, hi=hi, lines=new)
+            _splice(lines, lo=lo, hi=hi, new=new)
+            self._check(db, lines=lines)
+
+    def test_2(self) -> None:
+        db = _db()
+        db.set_lines(1, filetype="py", filename="a.py", lo=0, hi=0, lines=("abc1",))
+        db.set_lines(1, filetype="py", filename="a.py", lo=3, hi=3, lines=("abc2",))
+        self._check(db, lines=("abc1", "", "", "abc2"))
+
+        db.set_lines(1, filetype="py", filename="a.py", lo=1, hi=-1, lines=())
+        self._check(db, lines=("abc1",))
+
+
+class UniqueWords(TestCase):
+    def _check(self, db: BDB) -> None:
+        with closing(db._conn.cursor()) as cursor:
+            cursor.execute("""
+                SELECT word, COUNT(*) AS refcount
+                FROM words
+                WHERE word <> ''
+                GROUP BY word
+                """)
+            expected = {row["word"]: row["refcount"] for row in cursor.fetchall()}
+            cursor.execute("""
+                SELECT
+                  unique_words.word,
+                  unique_words.refcount,
+                  unique_words.filetype,
+                  buffers.filetype AS buf_filetype,
+                  words.word AS sample_word
+                FROM unique_words
+                LEFT JOIN lines
+                ON
+                  lines.rowid = unique_words.sample_line
+                LEFT JOIN buffers
+                ON
+                  buffers.rowid = lines.buffer_id
+                LEFT JOIN words
+                ON
+                  words.line_id = unique_words.sample_line
+                  AND
+                  words.word = unique_words.word
+                """)
+            rows = cursor.fetchall()
+
+        self.assertEqual({row["word"]: row["refcount"] for row in rows}, expected)
+        for row in rows:
+            self.assertEqual(row["sample_word"], row["word"])
+            self.assertEqual(row["filetype"], row["buf_filetype"])
+
+    def test_1(self) -> None:
+        rand = Random(1)
+        db = _db()
+        filetypes = {1: "py", 2: "lua"}
+        sizes = {1: 0, 2: 0}
+
+        for _ in range(200):
+            buf_id = rand.choice((1, 2))
+            if rand.random() < 0.1:
+                filetypes[buf_id] = rand.choice(("py", "lua", "c"))
+                db.buf_update(buf_id, filetype=filetypes[buf_id], filename="")
+            else:
+                lo = rand.randint(0, sizes[buf_id])
+                hi = lo + rand.randint(0, 2)
+                new = [_line(rand) for _ in range(rand.randint(0, 3))]
+                db.set_lines(
+                    buf_id,
+                    filetype=filetypes[buf_id],
+                    filename="",
+                    lo=lo,
+                    hi=hi,
+                    lines=new,
+                )
+                sizes[buf_id] += len(new) - (min(hi, sizes[buf_id]) - lo)
+            self._check(db)
+
+        db.vacuum({1: sizes[1] // 2})
+        self._check(db)
@@ -0,0 +1,79 @@
+from itertools import islice
+from random import choice, randint
+from typing import Iterable, Iterator, Tuple
+from unittest import TestCase
+
+from ....coq.clients.cache.index import Index
+from ....coq.shared.fuzzy import quick_ratio
+from ....coq.shared.settings import MatchBackend, MatchOptions
+from ....coq.shared.word_index import sql_lower
+
+_MATCH = MatchOptions(
+    unifying_chars={"_"},
+    max_results=9,
+    look_ahead=2,
+    exact_matches=2,
+    fuzzy_cutoff=0.6,
+    backend=MatchBackend.sqlite,
+)
+
+
+def _like(rows: Iterable[Tuple[bytes, str]], word: str) -> Iterator[bytes]:
+    lhs = sql_lower(word)
+    for key, rhs in rows:
+        lword = sql_lower(rhs)
+        if (
+            rhs
+            and lword.startswith(lhs[: _MATCH.exact_matches])
+            and len(rhs) + _MATCH.look_ahead >= len(word)
+            and quick_ratio(lhs, lword, look_ahead=_MATCH.look_ahead)
+            > _MATCH.fuzzy_cutoff
+        ):
+            yield key
+
+
+class Select(TestCase):
+    def test_1(self) -> None:
+        index = Index(exact_matches=_MATCH.exact_matches)
+        rows = ((b"a", "Super"), (b"a", "super_man"), (b"b", "supper"), (b"c", ""))
+        index.insert(rows)
+        hits = tuple(index.select(_MATCH, word="sup", sym="sup", limitless=False))
+        self.assertEqual(sorted(key for key, _ in hits), [b"a", b"b"])
+
+        index.clear()
+        hits = tuple(index.select(_MATCH, word="sup", sym="sup", limitless=False))
+        self.assertEqual(hits, ())
+
+    def test_2(self) -> None:
+        index = Index(exact_matches=_MATCH.exact_matches)
+        index.insert((str(idx).encode(), f"ab{idx}") for idx in range(99))
+        hits = tuple(index.select(_MATCH, word="ab", sym="", limitless=False))
+        self.assertEqual(len(hits), _MATCH.max_results)
+        hits = tuple(index.select(_MATCH, word="ab", sym="", limitless=True))
+        self.assertEqual(len(hits), 99)
+
+    def test_3(self) -> None:
+        index = Index(exact_matches=_MATCH.exact_matches)
+        index.insert(((b"a", "super"), (b"a", "super_man"), (b"b", "supper")))
+        index.remove((b"a", b"c"))
+        hits = tuple(index.select(_MATCH, word="sup", sym="", limitless=False))
+        self.assertEqual(hits, ((b"b", "supper"),))
+
+        index.remove((b"b",))
+        self.assertEqual(index._prefixes, {})
+
+    def test_4(self) -> None:
+        gen = iter(lambda: choice("abcAB_"), None)
+        index = Index(exact_matches=_MATCH.exact_matches)
+        rows = []
+
+        for idx in range(200):
+            row = (str(idx % 50).encode(), "".join(islice(gen, randint(0, 8))))
+            rows.append(row)
+            index.insert((row,))
+
+            word = "".join(islice(gen, randint(0, 6)))
+            sym = "".join(islice(gen, randint(0, 6)))
+            hits = index.select(_MATCH, word=word, sym=sym, limitless=True)
+            expected = {*_like(rows, word=word), *_like(rows, word=sym)}
+            self.assertEqual({key for key, _ in hits}, expected)
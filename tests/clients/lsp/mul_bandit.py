@@ -0,0 +1,40 @@
+from datetime import timedelta
+from unittest import TestCase
+
+from ....coq.clients.lsp.mul_bandit import MultiArmedBandit, _Dist
+
+
+class Dist(TestCase):
+    def test_1(self) -> None:
+        dist = _Dist()
+        self.assertEqual(dist.cdf(0.01), 1)
+
+        for _ in range(20):
+            dist.update(0.015)
+        self.assertEqual(dist.cdf(0.01), 0)
+        self.assertEqual(dist.cdf(0.02), 1)
+
+        for _ in range(20):
+            dist.update(1)
+        self.assertLess(dist.cdf(0.02), 0.5)
+
+
+class Bandit(TestCase):
+    def test_1(self) -> None:
+        bandit = MultiArmedBandit()
+        clients = {"fast", "slow"}
+        for _ in range(20):
+            bandit.skip(0.05)
+            bandit.update(clients, client="fast", elapsed=timedelta(seconds=0.01))
+            bandit.update(clients, client="slow", elapsed=timedelta(seconds=0.5))
+
+        skipped = sum("slow" in bandit.skip(0.05) for _ in range(1000))
+        self.assertGreater(skipped, 900)
+        self.assertLess(skipped, 1000)
+        self.assertEqual(bandit.skip(None), set())
+
+    def test_2(self) -> None:
+        bandit = MultiArmedBandit()
+        bandit.update({"slow"}, client="slow", elapsed=timedelta(seconds=0.5))
+        for _ in range(100):
+            self.assertEqual(bandit.skip(0.05), set())
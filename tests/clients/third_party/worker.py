@@ -0,0 +1,117 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, AsyncIterator, Sequence, cast
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import patch
+
+from ....coq.clients.third_party import worker
+from ....coq.lsp.types import LSPcomp
+from ....coq.shared.context import EMPTY_CONTEXT
+from ....coq.shared.runtime import PReviewer, Supervisor
+from ....coq.shared.settings import (
+    EMPTY_COMP,
+    EMPTY_MATCH,
+    Display,
+    Limits,
+    LSPClient,
+    ThirdPartyClient,
+)
+from ....coq.shared.types import Completion, Edit
+
+_MATCH = replace(
+    EMPTY_MATCH,
+    unifying_chars={"_"},
+    max_results=100,
+    look_ahead=2,
+    exact_matches=2,
+    fuzzy_cutoff=0.6,
+)
+
+_LIMITS = Limits(
+    cache_budget=2**20,
+    tokenization_limit=0,
+    tokenization_processes=0,
+    idle_timeout=0,
+    completion_auto_timeout=1,
+    completion_manual_timeout=1,
+    download_retries=0,
+    download_timeout=0,
+)
+
+_OPTIONS = ThirdPartyClient(
+    always_wait=False,
+    enabled=True,
+    max_pulls=None,
+    short_name="3P",
+    weight_adjust=0,
+    always_on_top=None,
+)
+
+_CONTEXT = replace(
+    EMPTY_CONTEXT,
+    manual=False,
+    position=(0, 4),
+    cursor=(0, 4, 4, 4),
+    line="a he",
+    line_before="a he",
+    words="he",
+    words_before="he",
+    syms="he",
+    syms_before="he",
+    l_words_before="he",
+    l_syms_before="he",
+)
+
+
+def _comp(sort_by: str) -> Completion:
+    return Completion(
+        source=_OPTIONS.short_name,
+        always_on_top=False,
+        weight_adjust=0,
+        label=sort_by,
+        sort_by=sort_by,
+        primary_edit=Edit(new_text=sort_by),
+        adjust_indent=False,
+        icon_match=None,
+    )
+
+
+async def _reply(**_: Any) -> AsyncIterator[LSPcomp]:
+    yield LSPcomp(
+        client=None,
+        local_cache=True,
+        items=map(_comp, ("hello", "help", "world")),
+    )
+
+
+class _Reviewer:
+    def s_register(self, assoc: Any) -> None:
+        pass
+
+
+class Worker(IsolatedAsyncioTestCase):
+    async def test_1(self) -> None:
+        supervisor = Supervisor(
+            th=ThreadPoolExecutor(),
+            vars_dir=Path(),
+            display=cast(Display, None),
+            match=_MATCH,
+            comp=EMPTY_COMP,
+            limits=_LIMITS,
+            reviewer=cast(PReviewer, _Reviewer()),
+        )
+        third_party = worker.Worker.init(
+            supervisor, always_wait=False, options=cast(LSPClient, _OPTIONS), misc=None
+        )
+
+        async def cont() -> Sequence[str]:
+            return [
+                comp.sort_by
+                async for comps in third_party._work(_CONTEXT, timeout=1)
+                for comp in comps
+            ]
+
+        with patch.object(worker, "comp_thirdparty", _reply):
+            sort_by = await third_party._ex.submit(cont())
+        self.assertEqual(sort_by, ["hello", "help"])
@@ -0,0 +1,113 @@
+from copy import deepcopy
+from dataclasses import replace
+from typing import Any, Sequence, cast
+from unittest import TestCase
+
+from ...coq.lsp.parse import eager, parse, parse_lazy
+from ...coq.lsp.protocol import LSProtocol
+from ...coq.lsp.types import CompletionResponse
+from ...coq.shared.types import UTF16, Completion, ExternLSP
+
+_PROTOCOL = LSProtocol(
+    CompletionItemKind={1: "Text", 3: "Function"},
+    InsertTextFormat={1: "PlainText", 2: "Snippet"},
+)
+_CURSORS = (0, 2, 2, 2)
+_RANGE = {"start": {"line": 0, "character": 0}, "end": {"line": 0, "character": 2}}
+_ITEMS: Sequence[Any] = (
+    {"label": "abc"},
+    {"label": "abc", "insertText": "abcd", "kind": 3},
+    {"label": "abc", "filterText": "xyz", "documentation": "doc"},
+    {"label": "f", "insertText": "f($1)", "insertTextFormat": 2},
+    {
+        "label": "g",
+        "insertTextFormat": 2,
+        "textEdit": {"newText": "g($1)", "range": _RANGE},
+    },
+    {"label": "h", "textEdit": {"newText": "hh", "insert": _RANGE, "replace": _RANGE}},
+    {"label": "i", "additionalTextEdits": [{"newText": "import i", "range": _RANGE}]},
+    {"label": "j", "textEdit": {"range": _RANGE}},
+    {"label": 1},
+    None,
+)
+
+
+def _parse(resp: CompletionResponse) -> Any:
+    eager = parse(
+        _PROTOCOL,
+        extern_type=ExternLSP,
+        always_on_top=None,
+        client="a",
+        encoding=UTF16,
+        short_name="LSP",
+        cursors=_CURSORS,
+        weight_adjust=0,
+        resp=deepcopy(resp),
+    )
+    lazy = parse_lazy(
+        _PROTOCOL,
+        extern_type=ExternLSP,
+        always_on_top=None,
+        client="a",
+        encoding=UTF16,
+        short_name="LSP",
+        cursors=_CURSORS,
+        weight_adjust=0,
+        resp=deepcopy(resp),
+    )
+    return eager, lazy
+
+
+def _same(lhs: Completion, rhs: Completion) -> bool:
+    return replace(lhs, uid=rhs.uid) == rhs
+
+
+class Lazy(TestCase):
+    def test_1(self) -> None:
+        eager, lazy = _parse(_ITEMS)
+        eagers = tuple(eager.items)
+        lazies = tuple(lazy.items)
+        decoded = tuple(comp for comp in (lz.decode() for lz in lazies) if comp)
+
+        self.assertEqual(eager.local_cache, lazy.local_cache)
+        self.assertEqual(len(eagers), 7)
+        self.assertEqual(len(decoded), len(eagers))
+        for comp, dec in zip(eagers, decoded):
+            self.assertTrue(_same(comp, dec))
+
+    def test_2(self) -> None:
+        _, lazy = _parse(_ITEMS)
+        for lz in lazy.items:
+            if comp := lz.decode():
+                self.assertEqual(lz.new_text, comp.primary_edit.new_text)
+                self.assertEqual(lz.sort_by, comp.sort_by)
+
+    def test_3(self) -> None:
+        resp = cast(
+            CompletionResponse,
+            {
+                "isIncomplete": True,
+                "itemDefaults": {"editRange": _RANGE, "insertTextFormat": 2},
+                "items": [{"label": "k"}, {"label": "l", "insertText": "l($1)"}],
+            },
+        )
+        eager, lazy = _parse(resp)
+        eagers = tuple(eager.items)
+        lazies = tuple(lazy.items)
+
+        self.assertFalse(lazy.local_cache)
+        self.assertEqual(len(eagers), len(lazies))
+        for comp, lz in zip(eagers, lazies):
+            self.assertEqual(lz.new_text, comp.primary_edit.new_text)
+            self.assertEqual(lz.sort_by, comp.sort_by)
+            dec = lz.decode()
+            assert dec
+            self.assertTrue(_same(comp, dec))
+
+    def test_4(self) -> None:
+        eager_comp, _ = _parse(_ITEMS)
+        for comp in eager_comp.items:
+            lz = eager(comp)
+            self.assertEqual(lz.new_text, comp.primary_edit.new_text)
+            self.assertEqual(lz.sort_by, comp.sort_by)
+            self.assertIs(lz.decode(), comp)
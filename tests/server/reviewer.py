@@ -1,7 +1,9 @@
-from random import uniform
+from collections import Counter
+from random import choice, randint, uniform
 from unittest import TestCase
 
-from ...coq.server.reviewer import sigmoid
+from ...coq.server.reviewer import _Proximity, sigmoid
+from ...coq.shared.parse import coalesce
 
 
 class Sigmoid(TestCase):
@@ -13,3 +15,45 @@ class Sigmoid(TestCase):
         for _ in range(0, 10000):
             y = sigmoid(uniform(-10, 10))
             self.assertTrue(y >= 0.5 and y <= 1.5)
+
+
+class Proximity(TestCase):
+    def test_1(self) -> None:
+        unifying_chars = {"_"}
+        proximity = _Proximity(unifying_chars)
+
+        def gen() -> str:
+            return "".join(choice("ab_ .(") for _ in range(randint(0, 9)))
+
+        lines = [gen() for _ in range(20)]
+
+        for _ in range(200):
+            buf_id = randint(1, 2)
+            idx = randint(0, len(lines))
+            edit = randint(0, 2)
+            if edit == 0 and lines:
+                lines.pop(min(idx, len(lines) - 1))
+            elif edit == 1 and lines:
+                lines[min(idx, len(lines) - 1)] = gen()
+            else:
+                lines.insert(idx, gen())
+
+            lo = randint(0, len(lines))
+            window = lines[lo : randint(lo, len(lines))]
+            expected = Counter(
+                word
+                for line in window
+                for word in coalesce(
+                    unifying_chars, include_syms=True, backwards=None, chars=line
+                )
+            )
+            actual = proximity.update(buf_id, lo=lo, lines=window)
+            self.assertEqual(actual, expected)
+
+    def test_2(self) -> None:
+        proximity = _Proximity(set())
+        view = proximity.update(1, lo=0, lines=("a b", "b c"))
+        self.assertEqual(view, {"a": 1, "b": 2, "c": 1})
+
+        proximity.update(1, lo=1, lines=("b c", "c"))
+        self.assertEqual(view, {"b": 1, "c": 2})
@@ -0,0 +1,33 @@
+from locale import strxfrm
+from random import randint
+from unittest import TestCase
+
+from ...coq.server.trans import _ranked, _xfrm, collation_cache
+
+
+class Ranked(TestCase):
+    def test_1(self) -> None:
+        for lazy in (True, False):
+            ranked = _ranked((), tie_break=str.lower, lazy=lazy, items=())
+            self.assertEqual(tuple(ranked), ())
+
+    def test_2(self) -> None:
+        for _ in range(100):
+            items = tuple(
+                "".join(chr(randint(65, 70)) for _ in range(randint(0, 3)))
+                for _ in range(randint(0, 50))
+            )
+            expected = sorted(items, key=lambda item: (len(item), item.lower()))
+            for lazy in (True, False):
+                keys = tuple(map(len, items))
+                ranked = _ranked(keys, tie_break=str.lower, lazy=lazy, items=items)
+                self.assertEqual(tuple(ranked), tuple(expected))
+
+
+class Xfrm(TestCase):
+    def test_1(self) -> None:
+        _xfrm.cache_clear()
+        for _ in range(2):
+            self.assertEqual(_xfrm("aB", False), strxfrm("aB"))
+            self.assertEqual(_xfrm("aB", True), strxfrm("Ab"))
+        self.assertEqual(collation_cache(), (2, 2))
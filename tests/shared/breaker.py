@@ -0,0 +1,57 @@
+from unittest import TestCase
+
+from ...coq.shared.breaker import Breakers
+
+
+class Breaker(TestCase):
+    def test_1(self) -> None:
+        breakers = Breakers()
+        self.assertTrue(breakers.allow("A", filetype="py", now=0))
+        self.assertTrue(breakers.trusted("A", filetype="py"))
+
+        for now in range(3):
+            breakers.record("A", filetype="py", ok=False, elapsed=1, now=now)
+        self.assertFalse(breakers.allow("A", filetype="py", now=2.5))
+        self.assertTrue(breakers.allow("A", filetype="lua", now=2.5))
+        self.assertTrue(breakers.allow("B", filetype="py", now=2.5))
+        self.assertTrue(breakers.allow("A", filetype="py", now=3))
+
+    def test_2(self) -> None:
+        breakers = Breakers()
+        for now in range(3):
+            breakers.record("A", filetype="py", ok=False, elapsed=1, now=now)
+        breakers.record("A", filetype="py", ok=False, elapsed=1, now=3)
+        self.assertFalse(breakers.allow("A", filetype="py", now=4.5))
+        self.assertTrue(breakers.allow("A", filetype="py", now=5))
+
+        (health,) = breakers.health(now=4)
+        self.assertEqual(health.trips, 2)
+        self.assertEqual(health.open_for, 1)
+
+    def test_3(self) -> None:
+        breakers = Breakers()
+        breakers.record("A", filetype="py", ok=False, elapsed=1, now=0)
+        self.assertFalse(breakers.trusted("A", filetype="py"))
+
+        breakers.record("A", filetype="py", ok=True, elapsed=1, now=1)
+        self.assertTrue(breakers.trusted("A", filetype="py"))
+        self.assertEqual(tuple(breakers.health(now=1)), ())
+
+    def test_4(self) -> None:
+        breakers = Breakers()
+        for now in range(8):
+            breakers.record("A", filetype="py", ok=True, elapsed=0.01, now=now)
+        self.assertEqual(breakers.slot("A", filetype="py", timeout=0.1, now=8), 0.1)
+
+        breakers.record("A", filetype="py", ok=False, elapsed=0.2, now=8)
+        slot = breakers.slot("A", filetype="py", timeout=0.1, now=8)
+        self.assertLess(slot, 0.1)
+        self.assertAlmostEqual(slot, 0.02, delta=0.005)
+
+        breakers.record("A", filetype="py", ok=True, elapsed=0.01, now=9)
+        self.assertEqual(breakers.slot("A", filetype="py", timeout=0.1, now=9), 0.1)
+
+    def test_5(self) -> None:
+        breakers = Breakers()
+        breakers.record("A", filetype="py", ok=False, elapsed=0.2, now=0)
+        self.assertEqual(breakers.slot("A", filetype="py", timeout=0.1, now=0), 0.1)
@@ -1,10 +1,69 @@
+from collections import Counter
+from itertools import islice, repeat
+from random import choice, randint
+from string import ascii_lowercase
+from typing import MutableMapping
 from unittest import TestCase
 
-from ...coq.shared.fuzzy import dl_distance, metrics, multi_set_ratio, quick_ratio
+from ...coq.shared.fuzzy import (
+    dl_distance,
+    fuzzy_query,
+    metrics,
+    metrics_many,
+    multi_set_ratio,
+    query_multi_set_ratio,
+    query_quick_ratio,
+    quick_ratio,
+)
 
 _LOOK_AHEAD = 2
 
 
+def _dl_oracle(lhs: str, rhs: str) -> int:
+    """
+    Reference Damerau-Levenshtein, modified from
+    https://github.com/jamesturk/jellyfish/blob/main/LICENSE
+    """
+
+    len_l, len_r = len(lhs), len(rhs)
+    row_size = len_r + 2
+    max_d = len_l + len_r
+    da: MutableMapping[str, int] = {}
+    d = [*repeat(0, row_size * (len_l + 2))]
+
+    d[0] = max_d
+    for i in range(0, len_l + 1):
+        i1 = i + 1
+        d[row_size * i1] = max_d
+        d[row_size * i1 + 1] = i
+
+    for j in range(0, len_r + 1):
+        d[j + 1] = max_d
+        d[row_size + j + 1] = j
+
+    for i in range(1, len_l + 1):
+        db = 0
+        for j in range(1, len_r + 1):
+            i1 = da.get(rhs[j - 1], 0)
+            j1 = db
+
+            if lhs[i - 1] == rhs[j - 1]:
+                cost = 0
+                db = j
+            else:
+                cost = 1
+
+            d[row_size * (i + 1) + j + 1] = min(
+                d[row_size * i + j] + cost,
+                d[row_size * (i + 1) + j] + 1,
+                d[row_size * i + j + 1] + 1,
+                d[row_size * i1 + j1] + (i - i1 - 1) + 1 + (j - j1 - 1),
+            )
+        da[lhs[i - 1]] = i
+
+    return d[row_size * (len_l + 1) + len_r + 1]
+
+
 class MultiSetRatio(TestCase):
     def test_1(self) -> None:
         lhs = ""
@@ -125,6 +184,86 @@ class EditD(TestCase):
         self.assertEqual(d, 2)
 
 
+def _ms_oracle(lhs: str, rhs: str, look_ahead: int) -> float:
+    shorter = min(len(lhs), len(rhs))
+    if not shorter:
+        return 1
+    else:
+        cutoff = shorter + look_ahead
+        l, r = lhs[:cutoff], rhs[:cutoff]
+        longer = max(len(l), len(r))
+
+        l_c, r_c = Counter(l), Counter(r)
+        dif = l_c - r_c if len(l) > len(r) else r_c - l_c
+
+        ratio = 1 - sum(dif.values()) / longer
+        adjust = shorter / longer
+        return ratio / adjust
+
+
+def _quick_oracle(lhs: str, rhs: str, look_ahead: int) -> float:
+    shorter = min(len(lhs), len(rhs))
+    if not shorter:
+        return 1
+    else:
+        p_matches = 0
+        for l, r in zip(lhs, rhs):
+            if l != r:
+                break
+            p_matches += 1
+
+        l_ratio = p_matches / shorter
+        r_ratio = _ms_oracle(
+            lhs[p_matches:], rhs[p_matches:], look_ahead=look_ahead
+        ) * (1 - l_ratio)
+        return l_ratio + r_ratio * 0.5
+
+
+class Query(TestCase):
+    def test_1(self) -> None:
+        query = fuzzy_query("abca")
+        self.assertEqual(query.masks, {"a": 0b1001, "b": 0b0010, "c": 0b0100})
+        self.assertEqual(query.histogram["a"], (0, 1, 1, 1, 2))
+
+    def test_2(self) -> None:
+        gen = iter(lambda: choice(ascii_lowercase[:4]), None)
+
+        for _ in range(2000):
+            lhs = "".join(islice(gen, randint(0, 9)))
+            rhs = "".join(islice(gen, randint(0, 9)))
+            query = fuzzy_query(lhs)
+            ratio = query_multi_set_ratio(query, rhs, look_ahead=_LOOK_AHEAD)
+            self.assertEqual(ratio, _ms_oracle(lhs, rhs, look_ahead=_LOOK_AHEAD))
+
+    def test_3(self) -> None:
+        gen = iter(lambda: choice(ascii_lowercase[:4]), None)
+
+        for _ in range(2000):
+            lhs = "".join(islice(gen, randint(0, 9)))
+            rhs = "".join(islice(gen, randint(0, 9)))
+            query = fuzzy_query(lhs)
+            ratio = query_quick_ratio(query, rhs, look_ahead=_LOOK_AHEAD)
+            self.assertEqual(ratio, _quick_oracle(lhs, rhs, look_ahead=_LOOK_AHEAD))
+
+
+class EditOracle(TestCase):
+    def test_1(self) -> None:
+        gen = iter(lambda: choice(ascii_lowercase[:4]), None)
+
+        for _ in range(5000):
+            lhs = "".join(islice(gen, randint(0, 9)))
+            rhs = "".join(islice(gen, randint(0, 9)))
+            self.assertEqual(dl_distance(lhs, rhs), _dl_oracle(lhs, rhs))
+
+    def test_2(self) -> None:
+        gen = iter(lambda: choice(ascii_lowercase), None)
+
+        for _ in range(200):
+            lhs = "".join(islice(gen, randint(0, 70)))
+            rhs = "".join(islice(gen, randint(0, 70)))
+            self.assertEqual(dl_distance(lhs, rhs), _dl_oracle(lhs, rhs))
+
+
 class Metrics(TestCase):
     def test_1(self) -> None:
         cword = "ab"
@@ -167,3 +306,22 @@ class Metrics(TestCase):
         m = metrics(cword, match, look_ahead=_LOOK_AHEAD)
         self.assertEqual(m.prefix_matches, 0)
         self.assertAlmostEqual(m.edit_distance, 0)
+
+
+class MetricsMany(TestCase):
+    def test_1(self) -> None:
+        ms = metrics_many(fuzzy_query("ab"), (), look_ahead=_LOOK_AHEAD)
+        self.assertEqual(ms, ())
+
+    def test_2(self) -> None:
+        gen = iter(lambda: choice(ascii_lowercase[:6]), None)
+
+        for _ in range(20):
+            cword = "".join(islice(gen, randint(0, 9)))
+            matches = tuple("".join(islice(gen, randint(0, 12))) for _ in range(50))
+            lhs = tuple(
+                metrics(cword, match, look_ahead=_LOOK_AHEAD) for match in matches
+            )
+            query = fuzzy_query(cword)
+            rhs = metrics_many(query, matches, look_ahead=_LOOK_AHEAD)
+            self.assertEqual(lhs, rhs)
@@ -0,0 +1,53 @@
+from random import expovariate
+from unittest import TestCase
+
+from ...coq.shared.histogram import Histogram, Rolling
+
+
+class Hist(TestCase):
+    def test_1(self) -> None:
+        histogram = Histogram()
+        self.assertEqual(histogram.quantile(0.5), 0)
+
+        histogram.add(0.01)
+        self.assertEqual(histogram.quantile(0.5), 0.01)
+        self.assertEqual(histogram.max, 0.01)
+
+    def test_2(self) -> None:
+        histogram = Histogram()
+        samples = sorted(expovariate(100) for _ in range(10000))
+        for sample in samples:
+            histogram.add(sample)
+
+        self.assertEqual(histogram.count, len(samples))
+        self.assertEqual(histogram.max, samples[-1])
+        for q in (0.5, 0.95, 0.99):
+            exact = samples[int(q * len(samples)) - 1]
+            self.assertAlmostEqual(histogram.quantile(q) / exact, 1, delta=0.2)
+
+    def test_3(self) -> None:
+        lhs, rhs, both = Histogram(16), Histogram(16), Histogram(16)
+        for idx in range(1, 1000):
+            (lhs if idx % 3 else rhs).add(idx)
+            both.add(idx)
+        lhs.merge(rhs)
+
+        self.assertEqual(lhs.count, both.count)
+        self.assertEqual(lhs.max, both.max)
+        for q in (0.1, 0.5, 0.99):
+            self.assertEqual(lhs.quantile(q), both.quantile(q))
+
+
+class Window(TestCase):
+    def test_1(self) -> None:
+        rolling = Rolling(60, slots=5, steps=16)
+        rolling.add(1, now=0)
+        rolling.add(2, now=59)
+        rolling.add(3, now=299)
+        self.assertEqual(rolling.window(299).count, 3)
+        self.assertEqual(rolling.window(300).count, 1)
+
+        rolling.add(4, now=600)
+        window = rolling.window(600)
+        self.assertEqual(window.count, 1)
+        self.assertEqual(window.max, 4)
@@ -0,0 +1,29 @@
+from unittest import TestCase
+
+from ...coq.shared.lru import SizedLRU
+
+
+class Sized(TestCase):
+    def test_1(self) -> None:
+        lru: SizedLRU[str, str] = SizedLRU(6, sizeof=len)
+        self.assertEqual(lru.update({"a": "aa", "b": "bb", "c": "cc"}), [])
+        self.assertEqual(lru.size, 6)
+
+        self.assertEqual(lru.get("a"), "aa")
+        self.assertEqual(lru.update({"d": "dd"}), ["b"])
+        self.assertIsNone(lru.get("b"))
+        self.assertEqual(sorted(lru.values()), ["aa", "cc", "dd"])
+        self.assertEqual((lru.size, lru.evicted), (6, 1))
+
+    def test_2(self) -> None:
+        lru: SizedLRU[str, str] = SizedLRU(4, sizeof=len)
+        lru.update({"a": "aa", "b": "bb"})
+        lru.update({"a": "a"})
+        self.assertEqual(lru.size, 3)
+
+        self.assertEqual(lru.update({"c": "ccccc"}), ["b", "a", "c"])
+        self.assertEqual((len(lru), lru.size), (0, 0))
+
+        lru.update({"a": "aa"})
+        lru.clear()
+        self.assertEqual((len(lru), lru.size, lru.evicted), (0, 0, 3))
@@ -0,0 +1,110 @@
+from dataclasses import replace
+from typing import Sequence
+from unittest import TestCase
+from uuid import uuid4
+
+from ...coq.shared.context import EMPTY_CONTEXT
+from ...coq.shared.narrow import narrow, narrowable
+from ...coq.shared.settings import EMPTY_MATCH
+from ...coq.shared.types import Completion, Context, Edit, SnippetEdit
+
+_MATCH = replace(
+    EMPTY_MATCH,
+    unifying_chars={"_"},
+    max_results=100,
+    look_ahead=2,
+    exact_matches=2,
+    fuzzy_cutoff=0.6,
+)
+
+
+def _context(line_before: str, row: int = 0) -> Context:
+    words = line_before.split(" ")[-1]
+    return replace(
+        EMPTY_CONTEXT,
+        manual=False,
+        position=(row, len(line_before.encode())),
+        cursor=(row, len(line_before.encode()), len(line_before), len(line_before)),
+        line=line_before,
+        line_before=line_before,
+        words=words,
+        words_before=words,
+        syms=words,
+        syms_before=words,
+    )
+
+
+def _comp(sort_by: str, snippet: bool = False) -> Completion:
+    edit = (
+        SnippetEdit(new_text=sort_by, grammar="lsp")
+        if snippet
+        else Edit(new_text=sort_by)
+    )
+    return Completion(
+        source="",
+        always_on_top=False,
+        weight_adjust=0,
+        label=sort_by,
+        sort_by=sort_by,
+        primary_edit=edit,
+        adjust_indent=False,
+        icon_match=None,
+    )
+
+
+def _narrow(context: Context, comps: Sequence[Completion]) -> Sequence[Completion]:
+    return tuple(
+        comp for c in comps if (comp := narrow(_MATCH, context=context, comp=c))
+    )
+
+
+def _sort_by(comps: Sequence[Completion]) -> Sequence[str]:
+    return tuple(comp.sort_by for comp in comps)
+
+
+class Narrowable(TestCase):
+    def test_1(self) -> None:
+        prev, cur = _context("a hel"), _context("a hell")
+        self.assertTrue(narrowable(prev, cur=cur))
+
+    def test_2(self) -> None:
+        prev = _context("a hel")
+        self.assertFalse(narrowable(prev, cur=prev))
+
+    def test_3(self) -> None:
+        prev, cur = _context("a hel"), _context("a he")
+        self.assertFalse(narrowable(prev, cur=cur))
+
+    def test_4(self) -> None:
+        prev, cur = _context("a hel"), _context("a hel w")
+        self.assertFalse(narrowable(prev, cur=cur))
+
+    def test_5(self) -> None:
+        prev, cur = _context("a hel"), _context("a hell", row=1)
+        self.assertFalse(narrowable(prev, cur=cur))
+
+    def test_6(self) -> None:
+        prev, cur = _context("a hel"), _context("a hell")
+        self.assertFalse(narrowable(prev, cur=replace(cur, manual=True)))
+        self.assertFalse(narrowable(prev, cur=replace(cur, buf_id=1)))
+        self.assertFalse(narrowable(prev, cur=replace(cur, commit_id=uuid4())))
+
+
+class Narrow(TestCase):
+    def test_1(self) -> None:
+        comps = tuple(map(_comp, ("hello", "help", "helium", "world")))
+        narrowed = _narrow(_context("a hel"), comps)
+        self.assertEqual(_sort_by(narrowed), ("hello", "help", "helium"))
+
+    def test_2(self) -> None:
+        comps = tuple(map(_comp, ("hello", "hexagon", "heap", "world")))
+        prev, cur = _context("a he"), _context("a hell")
+        self.assertTrue(narrowable(prev, cur=cur))
+        batch = _narrow(prev, comps)
+        self.assertEqual(_sort_by(batch), ("hello", "hexagon", "heap"))
+        self.assertEqual(_sort_by(_narrow(cur, batch)), ("hello",))
+
+    def test_3(self) -> None:
+        comps = (_comp("hello"), _comp("hello", snippet=True))
+        narrowed = _narrow(_context("a hello"), comps)
+        self.assertEqual(narrowed, comps[1:])
@@ -0,0 +1,32 @@
+from unittest import TestCase
+
+from ...coq.shared.processes import _OFFLOAD_AT, Processes
+
+
+class Tokenize(TestCase):
+    def test_1(self) -> None:
+        processes = Processes(0)
+        texts = ("a b", "", "c d e")
+        words = processes.tokenize(
+            2, unifying_chars=set(), include_syms=False, texts=texts
+        )
+        self.assertEqual(tuple(map(len, words)), (2, 0, 2))
+        self.assertEqual(sorted(words[0]), ["a", "b"])
+
+    def test_2(self) -> None:
+        processes = Processes(0)
+        texts = ("a b", "c d", "e f")
+        words = processes.tokenize(
+            9, unifying_chars=set(), include_syms=False, texts=texts, budget=3
+        )
+        self.assertEqual(tuple(map(len, words)), (2, 1, 0))
+
+    def test_3(self) -> None:
+        texts = ("ab " * (_OFFLOAD_AT // 3 + 1), "", "c_d e")
+        inline = Processes(0).tokenize(
+            9, unifying_chars={"_"}, include_syms=False, texts=texts
+        )
+        offloaded = Processes(1).tokenize(
+            9, unifying_chars={"_"}, include_syms=False, texts=texts
+        )
+        self.assertEqual(tuple(map(sorted, offloaded)), tuple(map(sorted, inline)))
@@ -0,0 +1,195 @@
+from asyncio import Future, create_task, sleep
+from concurrent.futures import ThreadPoolExecutor
+from copy import deepcopy
+from dataclasses import dataclass, replace
+from pathlib import Path
+from pickle import dumps, loads
+from time import monotonic
+from typing import Any, MutableSequence, Optional, Sequence, Tuple, cast
+from unittest import IsolatedAsyncioTestCase, TestCase
+from uuid import UUID, uuid4
+
+from ...coq.shared.context import EMPTY_CONTEXT
+from ...coq.shared.runtime import Metric, PReviewer, Supervisor, Worker
+from ...coq.shared.settings import (
+    EMPTY_COMP,
+    EMPTY_MATCH,
+    BaseClient,
+    Display,
+    Limits,
+    Weights,
+)
+from ...coq.shared.types import Completion, Context, Edit
+
+_TIMEOUT = 0.5
+
+_LIMITS = Limits(
+    cache_budget=0,
+    tokenization_limit=0,
+    tokenization_processes=0,
+    idle_timeout=0,
+    completion_auto_timeout=_TIMEOUT,
+    completion_manual_timeout=_TIMEOUT,
+    download_retries=0,
+    download_timeout=0,
+)
+
+_CONTEXT = replace(EMPTY_CONTEXT, manual=False, filetype="py")
+
+
+def _metric(source: str) -> Metric:
+    comp = Completion(
+        source=source,
+        always_on_top=False,
+        weight_adjust=0,
+        label=source,
+        sort_by=source,
+        primary_edit=Edit(new_text=source),
+        adjust_indent=False,
+        icon_match=None,
+    )
+    return Metric(
+        instance=uuid4(),
+        comp=comp,
+        weight_adjust=0,
+        weight=Weights(prefix_matches=0, edit_distance=0, recency=0, proximity=0),
+        label_width=0,
+        kind_width=0,
+    )
+
+
+@dataclass(frozen=True)
+class _Options:
+    short_name: str
+    always_wait: bool
+
+
+class _Reviewer:
+    def s_register(self, assoc: BaseClient) -> None:
+        pass
+
+    def begin(self, context: Context) -> None:
+        pass
+
+
+class _Worker:
+    def __init__(self, name: str, delay: float, always_wait: bool = False) -> None:
+        self._options = _Options(short_name=name, always_wait=always_wait)
+        self._delay = delay
+        self.timeouts: MutableSequence[float] = []
+
+    def supervised(
+        self,
+        context: Context,
+        token: Any,
+        batch: UUID,
+        now: float,
+        timeout: float,
+        acc: MutableSequence[Metric],
+    ) -> Future:
+        self.timeouts.append(timeout)
+
+        async def cont() -> None:
+            await sleep(self._delay)
+            acc.append(_metric(self._options.short_name))
+
+        return create_task(cont())
+
+
+def _supervisor(*workers: _Worker, progressive: Optional[float] = None) -> Supervisor:
+    supervisor = Supervisor(
+        th=ThreadPoolExecutor(),
+        vars_dir=Path(),
+        display=cast(Display, None),
+        match=EMPTY_MATCH,
+        comp=replace(EMPTY_COMP, progressive=progressive),
+        limits=_LIMITS,
+        reviewer=cast(PReviewer, _Reviewer()),
+    )
+    for worker in workers:
+        supervisor.register(
+            cast(Worker, worker), assoc=cast(BaseClient, worker._options)
+        )
+    return supervisor
+
+
+class Slots(IsolatedAsyncioTestCase):
+    async def test_1(self) -> None:
+        fast, slow = _Worker("fast", delay=0), _Worker("slow", delay=_TIMEOUT * 2)
+        supervisor = _supervisor(fast, slow)
+        for _ in range(8):
+            supervisor.breakers.record(
+                "slow", filetype="py", ok=True, elapsed=0.01, now=monotonic()
+            )
+        supervisor.breakers.record(
+            "slow", filetype="py", ok=False, elapsed=_TIMEOUT, now=monotonic()
+        )
+
+        t0 = monotonic()
+        metrics = await supervisor.collect(_CONTEXT)
+        self.assertLess(monotonic() - t0, _TIMEOUT / 2)
+        self.assertEqual(fast.timeouts, [_TIMEOUT])
+        (slot,) = slow.timeouts
+        self.assertLess(slot, _TIMEOUT / 2)
+        self.assertEqual([metric.comp.source for metric in metrics], ["fast"])
+
+    async def test_2(self) -> None:
+        slow = _Worker("slow", delay=_TIMEOUT / 4)
+        supervisor = _supervisor(slow)
+        metrics = await supervisor.collect(_CONTEXT)
+        self.assertEqual(slow.timeouts, [_TIMEOUT])
+        self.assertEqual([metric.comp.source for metric in metrics], ["slow"])
+
+
+class _Progress:
+    def __init__(self, delay: float = 0) -> None:
+        self._delay = delay
+        self.began: MutableSequence[Tuple[float, int]] = []
+        self.ended: MutableSequence[int] = []
+
+    async def __call__(self, metrics: Sequence[Metric]) -> None:
+        self.began.append((monotonic(), len(metrics)))
+        await sleep(self._delay)
+        self.ended.append(len(metrics))
+
+
+class Progressive(IsolatedAsyncioTestCase):
+    async def test_1(self) -> None:
+        interval = 0.1
+        workers = tuple(_Worker(str(n), delay=n * 0.02) for n in range(16))
+        supervisor = _supervisor(*workers, progressive=interval)
+        progress = _Progress()
+
+        metrics = await supervisor.collect(_CONTEXT, progress=progress)
+        self.assertEqual(len(metrics), len(workers))
+        self.assertTrue(progress.began)
+        for (lhs, l_len), (rhs, r_len) in zip(progress.began, progress.began[1:]):
+            self.assertGreaterEqual(rhs - lhs, interval * 0.9)
+            self.assertLess(l_len, r_len)
+
+    async def test_2(self) -> None:
+        workers = (_Worker("a", delay=0), _Worker("b", delay=0.05))
+        supervisor = _supervisor(*workers, progressive=0)
+        progress = _Progress(delay=0.2)
+
+        t0 = monotonic()
+        await supervisor.collect(_CONTEXT, progress=progress)
+        self.assertLess(monotonic() - t0, 0.15)
+        await sleep(0.25)
+        self.assertEqual([n for _, n in progress.began], [1])
+        self.assertEqual(progress.ended, [])
+
+    async def test_3(self) -> None:
+        workers = tuple(_Worker(str(n), delay=n * 0.01) for n in range(3))
+        supervisor = _supervisor(*workers, progressive=0)
+        progress = _Progress()
+
+        await supervisor.collect(_CONTEXT, progress=progress, shown=2)
+        self.assertEqual(progress.began, [])
+
+
+class Copy(TestCase):
+    def test_1(self) -> None:
+        metric = _metric("a")
+        self.assertEqual(loads(dumps(metric)), metric)
+        self.assertEqual(deepcopy(metric), metric)
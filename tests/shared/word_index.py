@@ -0,0 +1,66 @@
+from itertools import islice
+from random import choice, randint
+from typing import Iterable, MutableMapping
+from unittest import TestCase
+
+from ...coq.shared.fuzzy import quick_ratio
+from ...coq.shared.word_index import WordIndex, sql_lower
+
+_EXACT_MATCHES = 2
+_LOOK_AHEAD = 2
+_CUT_OFF = 0.6
+
+
+def _like(lwords: Iterable[str], word: str) -> Iterable[str]:
+    lhs = sql_lower(word)
+    prefix = lhs[:_EXACT_MATCHES]
+    for lword in lwords:
+        if (
+            lhs
+            and lword.startswith(prefix)
+            and quick_ratio(lhs, lword, look_ahead=_LOOK_AHEAD) > _CUT_OFF
+        ):
+            yield lword
+
+
+class SqlLower(TestCase):
+    def test_1(self) -> None:
+        self.assertEqual(sql_lower("AbC_É"), "abc_É")
+
+
+class Index(TestCase):
+    def test_1(self) -> None:
+        index = WordIndex(exact_matches=_EXACT_MATCHES)
+        index.update((("super", 1), ("super", 1), ("supper", 1)))
+        self.assertEqual(len(index), 2)
+
+        index.update((("super", -1),))
+        hits = index.hits("sup", look_ahead=_LOOK_AHEAD, cut_off=0)
+        self.assertEqual(hits.keys(), {"super", "supper"})
+
+        index.update((("super", -1),))
+        hits = index.hits("sup", look_ahead=_LOOK_AHEAD, cut_off=0)
+        self.assertEqual(hits.keys(), {"supper"})
+        self.assertEqual(len(index), 1)
+
+    def test_2(self) -> None:
+        index = WordIndex(exact_matches=_EXACT_MATCHES)
+        index.update((("abcd", 1), ("abxd", 1)))
+        hits = index.hits("abcd", look_ahead=_LOOK_AHEAD, cut_off=0)
+        self.assertGreater(hits["abcd"], hits["abxd"])
+
+    def test_3(self) -> None:
+        gen = iter(lambda: choice("abcAB_"), None)
+        index = WordIndex(exact_matches=_EXACT_MATCHES)
+        counts: MutableMapping[str, int] = {}
+
+        for _ in range(200):
+            lword = "".join(islice(gen, randint(1, 8))).lower()
+            delta = choice((1, 1, -1)) if counts.get(lword) else 1
+            counts[lword] = counts.get(lword, 0) + delta
+            index.update(((lword, delta),))
+
+            word = "".join(islice(gen, randint(0, 6)))
+            live = {lword for lword, count in counts.items() if count}
+            hits = index.hits(word, look_ahead=_LOOK_AHEAD, cut_off=_CUT_OFF)
+            self.assertEqual(hits.keys(), {*_like(live, word=word)})